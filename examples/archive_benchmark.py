@@ -0,0 +1,92 @@
+"""Compare per-board JSON files with the compressed chunked archive format.
+
+Reports total size, write time, full-scan time and single-board lookup time
+on synthetic boards.
+
+    python examples/archive_benchmark.py --boards 2000
+"""
+
+import argparse
+import random
+import tempfile
+import time
+from pathlib import Path
+from padlet_scraper import Padlet, Post, Section
+from padlet_scraper.archive import ArchiveReader, ArchiveWriter, default_codec, index_path
+from padlet_scraper.utils import load_from_json, save_to_json
+
+WORDS = ("reflection project team leadership science volunteering music coding "
+         "challenge growth learned research award experiment debate").split()
+
+
+def make_padlet(i: int, sections: int, posts: int) -> Padlet:
+    rng = random.Random(i)
+    return Padlet(
+        url=f"https://padlet.com/user/board-{i}",
+        title=f"Board {i}",
+        sections=[
+            Section(
+                title=f"Section {s}",
+                section_id=f"{i}-{s}",
+                posts=[
+                    Post(
+                        subject=" ".join(rng.choices(WORDS, k=4)).title(),
+                        body=" ".join(rng.choices(WORDS, k=rng.randint(20, 120))),
+                        section_id=f"{i}-{s}",
+                    )
+                    for _ in range(posts)
+                ],
+            )
+            for s in range(sections)
+        ],
+    )
+
+
+def timed(fn):
+    started = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--boards", type=int, default=1000)
+    parser.add_argument("--sections", type=int, default=6)
+    parser.add_argument("--posts", type=int, default=8, help="Posts per section")
+    parser.add_argument("--codec", choices=["zstd", "gzip"], default=default_codec())
+    args = parser.parse_args()
+
+    padlets = [make_padlet(i, args.sections, args.posts) for i in range(args.boards)]
+    target = padlets[len(padlets) // 2].url
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        json_dir = tmp / "json"
+        json_dir.mkdir()
+        json_paths = [json_dir / f"{i}.json" for i in range(len(padlets))]
+        archive = tmp / "boards.pjz"
+
+        _, json_write = timed(lambda: [save_to_json(p, path) for p, path in zip(padlets, json_paths)])
+        json_size = sum(p.stat().st_size for p in json_paths)
+        _, json_scan = timed(lambda: sum(load_from_json(p).total_posts for p in json_paths))
+        # Without an index, finding a board by URL means opening files until it turns up
+        _, json_lookup = timed(lambda: next(b for b in map(load_from_json, json_paths) if b.url == target))
+
+        def write_archive():
+            with ArchiveWriter(archive, codec=args.codec) as writer:
+                writer.write_all(padlets)
+
+        _, archive_write = timed(write_archive)
+        archive_size = archive.stat().st_size + index_path(archive).stat().st_size
+        _, archive_scan = timed(lambda: sum(p.total_posts for p in ArchiveReader(archive)))
+        _, archive_lookup = timed(lambda: ArchiveReader(archive).load(target))
+
+    print(f"{args.boards} boards, {args.sections * args.posts} posts each")
+    print(f"{'':14}{'size':>12}{'write':>10}{'scan':>10}{'lookup':>10}")
+    print(f"{'json files':14}{json_size / 1e6:>10.2f}MB{json_write:>9.2f}s{json_scan:>9.2f}s{json_lookup * 1e3:>8.1f}ms")
+    print(f"{'archive/' + args.codec:14}{archive_size / 1e6:>10.2f}MB{archive_write:>9.2f}s"
+          f"{archive_scan:>9.2f}s{archive_lookup * 1e3:>8.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
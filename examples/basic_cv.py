@@ -1,18 +1,50 @@
-from google import genai
+"""Write a personal statement from a Padlet with Gemini.
+
+The board is split into token-budgeted chunks. Each chunk is condensed into
+notes once and the notes are cached by the chunk's content hash in
+.cv-cache/, so re-running on an unchanged or slightly edited board only
+sends the changed chunks to the model.
+
+    python examples/basic_cv.py            # PADLET_LINK and GOOGLE_API_KEY from .env
+    python examples/basic_cv.py --fake     # dry run with a local fake model
+"""
+
 from padlet_scraper import scrape_padlet, Padlet
+from padlet_scraper.chunking import ChunkProcessor, FakeModel, FileChunkCache, chunk_padlet
 from dotenv import load_dotenv
+import hashlib
 import os
+import sys
 import asyncio
 
 load_dotenv()
 
 padlet_url = os.getenv("PADLET_LINK")
-client = genai.Client(api_key=os.getenv("GOOGLE_API_KEY"))
+cache = FileChunkCache(".cv-cache")
+
+# Bump these when the prompts or model change so cached results are not reused
+MODEL = "gemini-2.5-flash"
+NOTES_VERSION = f"notes-v1-{MODEL}"
+STATEMENT_VERSION = f"statement-v1-{MODEL}"
+
+NOTES_PROMPT = """
+You will be given part of a markdown export of a Padlet containing a person’s experiences, reflections, achievements, challenges, and interests.
+
+Condense it into concise notes for a personal-statement writer:
+
+Keep every distinct experience, achievement, skill and interest, with the learnings and insights the person drew from it
+
+Keep dates and specifics exactly as given; do not invent anything
+
+Plain text notes only
+
+Input:
+"""
 
 PROMPT = """
 You are a skilled personal-statement writer.
 
-You will be given a markdown export of a Padlet containing a person’s experiences, reflections, achievements, challenges, and interests.
+You will be given notes condensed from a Padlet containing a person’s experiences, reflections, achievements, challenges, and interests.
 
 This person is applying to {application_name}.
 
@@ -51,14 +83,36 @@ A single, polished personal statement suitable for applications (education, prog
 No bullet points, headings, or markdown — plain prose only
 """
 
-async def produce_cv(padlet_link: str, application_name: str):
+
+def gemini():
+    from google import genai
+    client = genai.Client(api_key=os.getenv("GOOGLE_API_KEY"))
+
+    def generate(prompt: str) -> str:
+        return client.models.generate_content(model=MODEL, contents=prompt).text
+
+    return generate
+
+
+async def produce_cv(padlet_link: str, application_name: str, fake: bool = False):
     padlet: Padlet = await scrape_padlet(padlet_link)
-    markdown = padlet.to_markdown()
-    response = client.models.generate_content(
-        model="gemini-2.5-flash",
-        contents=PROMPT.format(application_name=application_name) + "\n\n" + "Input:\n" + markdown
-    )
-    return response.text
+    chunks = chunk_padlet(padlet, max_tokens=6000)
+
+    generate = None if fake else gemini()
+    take_notes = FakeModel() if fake else (lambda chunk: generate(NOTES_PROMPT + chunk.markdown))
+    processor = ChunkProcessor(take_notes, cache=cache, max_concurrency=4, namespace=NOTES_VERSION)
+    notes = await processor.run(chunks)
+    stats = processor.last_stats
+    print(f"{len(chunks)} chunk(s): {stats.processed} sent to the model, {stats.cached} cached", file=sys.stderr)
+
+    # The statement only changes when the notes do
+    prompt = PROMPT.format(application_name=application_name) + "\n\n" + "Input:\n" + "\n\n".join(notes)
+    key = f"{STATEMENT_VERSION}:{hashlib.sha256(prompt.encode('utf-8')).hexdigest()}"
+    statement = cache.get(key)
+    if statement is None:
+        statement = "\n".join(notes) if fake else await asyncio.to_thread(generate, prompt)
+        cache.set(key, statement)
+    return statement
 
 if __name__ == "__main__":
-    print(asyncio.run(produce_cv(padlet_url, "Cambridge University Computer Science BSc")))
\ No newline at end of file
+    print(asyncio.run(produce_cv(padlet_url, "Cambridge University Computer Science BSc", fake="--fake" in sys.argv)))
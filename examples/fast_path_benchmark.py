@@ -0,0 +1,122 @@
+"""Benchmark the browserless HTTP fast path against the browser path.
+
+Serves synthetic boards from a local stand-in server and reports
+boards/second and peak memory for each path.
+
+    python examples/fast_path_benchmark.py --boards 200
+    python examples/fast_path_benchmark.py --boards 10 --browser   # also time Chrome
+"""
+
+import argparse
+import asyncio
+import json
+import resource
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from padlet_scraper import PadletScraper
+from padlet_scraper.fastpath import fetch_board
+from padlet_scraper.httpclient import HttpPool
+
+
+def make_board(board_id: int, sections: int, posts: int) -> str:
+    """Render a synthetic board as HTML with both markup and bootstrap JSON."""
+    state = {"wall": {"title": f"Board {board_id}", "posts_count": sections * posts}, "sections": [], "posts": []}
+    markup = []
+    for s in range(sections):
+        section_id = f"{board_id}-{s}"
+        state["sections"].append({"id": section_id, "title": f"Section {s}", "sort_index": s})
+        items = []
+        for p in range(posts):
+            body = f"<p>Post {p} in section {s}</p><p><br></p><p>See <a href='/link/{p}'>link</a></p>"
+            state["posts"].append({"id": f"{section_id}-{p}", "wall_section_id": section_id,
+                                   "subject": f"Post {p}", "body": body, "sort_index": p})
+            items.append(f'<div data-testid="surfacePost"><div data-pw="postSubject">Post {p}</div>'
+                         f'<div data-pw="postBody">{body}</div></div>')
+        markup.append(f'<section data-id="{section_id}" data-rank="{s}">'
+                      f'<h2 data-testid="sectionTitleText">Section {s}</h2>{"".join(items)}</section>')
+    return (f"<html><head><title>Board {board_id}</title></head><body><h1>Board {board_id}</h1>"
+            f"{''.join(markup)}<script>window.__STARTING_STATE__ = {json.dumps(state)};</script></body></html>")
+
+
+class BoardHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+    boards: dict[str, bytes] = {}
+
+    def do_GET(self):
+        body = self.boards.get(self.path)
+        if body is None:
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def peak_rss_mb(who: int) -> float:
+    # ru_maxrss is KB on Linux and bytes on macOS
+    scale = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return resource.getrusage(who).ru_maxrss / scale
+
+
+async def run_fast_path(urls: list[str], concurrency: int) -> float:
+    pool = HttpPool(max_per_host=concurrency)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(url):
+        async with semaphore:
+            result = await fetch_board(url, pool)
+            assert result is not None and result.complete, url
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(u) for u in urls))
+    elapsed = time.perf_counter() - started
+    pool.close()
+    return elapsed
+
+
+async def run_browser(urls: list[str]) -> float:
+    scraper = PadletScraper(sandbox=False)
+    started = time.perf_counter()
+    for url in urls:
+        await scraper.scrape(url)
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--boards", type=int, default=100)
+    parser.add_argument("--sections", type=int, default=10)
+    parser.add_argument("--posts", type=int, default=20, help="Posts per section")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--browser", action="store_true", help="Also benchmark the browser path")
+    args = parser.parse_args()
+
+    BoardHandler.boards = {
+        f"/board/{i}": make_board(i, args.sections, args.posts).encode("utf-8") for i in range(args.boards)
+    }
+    server = ThreadingHTTPServer(("127.0.0.1", 0), BoardHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    urls = [f"http://127.0.0.1:{server.server_port}/board/{i}" for i in range(args.boards)]
+
+    elapsed = asyncio.run(run_fast_path(urls, args.concurrency))
+    print(f"fast path: {len(urls) / elapsed:8.1f} boards/s   peak RSS {peak_rss_mb(resource.RUSAGE_SELF):.0f} MB (python)")
+
+    if args.browser:
+        elapsed = asyncio.run(run_browser(urls))
+        print(f"browser:   {len(urls) / elapsed:8.1f} boards/s   "
+              f"peak RSS {peak_rss_mb(resource.RUSAGE_CHILDREN):.0f} MB (largest browser process)")
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
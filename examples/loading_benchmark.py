@@ -0,0 +1,127 @@
+"""Compare the "scroll" and "tall" loading modes on a synthetic lazy-loading board.
+
+Serves a board whose sections and posts are only rendered when an
+IntersectionObserver sees them (like Padlet), scrapes it with each loading
+mode and reports time and completeness.
+
+    python examples/loading_benchmark.py --runs 3
+    python examples/loading_benchmark.py --sections 60   # taller than the tall-viewport limit: falls back
+"""
+
+import argparse
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from padlet_scraper import PadletScraper
+
+PAGE = """<html><head><title>{title}</title><style>
+section {{ margin: 16px; }}
+.overflow-y-auto {{ max-height: 480px; overflow-y: auto; }}
+[data-testid="surfacePost"] {{ height: 96px; margin: 8px; border: 1px solid #ccc; }}
+</style></head><body><h1>{title}</h1><div id="board"></div><div id="more-sections" style="height: 1px"></div>
+<script>
+const DATA = {data};
+const SECTION_BATCH = 4, POST_BATCH = 6, DELAY = 30;
+
+// Load a batch whenever the sentinel is visible; re-observing re-checks
+// visibility, so a sentinel that stays visible keeps loading
+function lazy(sentinel, load) {{
+    const observer = new IntersectionObserver(entries => {{
+        if (!entries.some(entry => entry.isIntersecting)) return;
+        observer.unobserve(sentinel);
+        setTimeout(() => {{ if (load()) observer.observe(sentinel); }}, DELAY);
+    }});
+    observer.observe(sentinel);
+}}
+
+function addSection(section, rank) {{
+    const el = document.createElement("section");
+    el.dataset.id = section.id;
+    el.dataset.rank = rank;
+    el.innerHTML = `<h2 data-testid="sectionTitleText">${{section.title}}</h2>` +
+        `<div id="group-posts-${{section.id}}" class="overflow-y-auto"><div class="sentinel" style="height: 1px"></div></div>`;
+    document.getElementById("board").appendChild(el);
+
+    const container = el.querySelector(".overflow-y-auto");
+    const sentinel = container.querySelector(".sentinel");
+    let next = 0;
+    lazy(sentinel, () => {{
+        for (const [subject, body] of section.posts.slice(next, next + POST_BATCH)) {{
+            const post = document.createElement("div");
+            post.dataset.testid = "surfacePost";
+            post.innerHTML = `<div data-pw="postSubject">${{subject}}</div><div data-pw="postBody"><p>${{body}}</p></div>`;
+            container.insertBefore(post, sentinel);
+        }}
+        next += POST_BATCH;
+        return next < section.posts.length;
+    }});
+}}
+
+let nextSection = 0;
+lazy(document.getElementById("more-sections"), () => {{
+    for (const section of DATA.sections.slice(nextSection, nextSection + SECTION_BATCH)) {{
+        addSection(section, nextSection++);
+    }}
+    return nextSection < DATA.sections.length;
+}});
+</script></body></html>"""
+
+
+def make_lazy_board(sections: int, posts: int) -> str:
+    """Render a board that only creates sections and posts as they scroll into view."""
+    data = {"sections": [
+        {"id": f"s{s}", "title": f"Section {s}",
+         "posts": [[f"Post {p}", f"Body of post {p} in section {s}"] for p in range(posts)]}
+        for s in range(sections)
+    ]}
+    return PAGE.format(title="Lazy Board", data=json.dumps(data))
+
+
+class BoardHandler(BaseHTTPRequestHandler):
+    body = b""
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+async def run(url: str, loading: str, runs: int, browser: str) -> tuple[float, int, int]:
+    scraper = PadletScraper(loading=loading, sandbox=False, browser_executable_path=browser)
+    started = time.perf_counter()
+    for _ in range(runs):
+        padlet = await scraper.scrape(url)
+    return (time.perf_counter() - started) / runs, len(padlet.sections), padlet.total_posts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sections", type=int, default=20)
+    parser.add_argument("--posts", type=int, default=24, help="Posts per section")
+    parser.add_argument("--runs", type=int, default=1)
+    parser.add_argument("--browser", help="Path to browser executable")
+    args = parser.parse_args()
+
+    BoardHandler.body = make_lazy_board(args.sections, args.posts).encode("utf-8")
+    server = ThreadingHTTPServer(("127.0.0.1", 0), BoardHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/board"
+
+    expected = args.sections * args.posts
+    for loading in ("scroll", "tall"):
+        seconds, sections, posts = asyncio.run(run(url, loading, args.runs, args.browser))
+        print(f"{loading:>6}: {seconds:6.2f}s per scrape, {sections}/{args.sections} sections, "
+              f"{posts}/{expected} posts ({posts / expected:.0%})")
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
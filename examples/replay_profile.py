@@ -0,0 +1,68 @@
+"""Record a scrape's CDP traffic once, then replay and profile it without a browser.
+
+    python examples/replay_profile.py record https://padlet.com/user/board board.cdp.jsonl
+    python examples/replay_profile.py replay board.cdp.jsonl --runs 50
+    python examples/replay_profile.py replay board.cdp.jsonl --profile     # cProfile the Python side
+    python examples/replay_profile.py replay board.cdp.jsonl --realtime    # original latencies
+"""
+
+import argparse
+import asyncio
+import contextlib
+import cProfile
+import io
+import pstats
+import time
+from padlet_scraper import PadletScraper
+from padlet_scraper.replay import RecordingSession, ReplaySession
+
+
+async def record(url: str, path: str, browser: str = None) -> None:
+    async with RecordingSession(path, browser_executable_path=browser) as session:
+        padlet = await PadletScraper(session=session).scrape(url)
+    print(f"Recorded {session.recorder.commands} CDP commands ({padlet.total_posts} posts) to {path}")
+
+
+async def replay(path: str, runs: int, realtime: bool) -> float:
+    session = ReplaySession(path, realtime=realtime)
+    scraper = PadletScraper(session=session)
+    started = time.perf_counter()
+    # The scraper's progress messages would drown out the results
+    with contextlib.redirect_stderr(io.StringIO()):
+        for _ in range(runs):
+            padlet = await scraper.scrape(session.url)
+    elapsed = time.perf_counter() - started
+    print(f"{padlet.total_posts} posts in {len(padlet.sections)} sections")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest="command", required=True)
+    rec = sub.add_parser("record", help="Scrape a board with Chrome and record its CDP traffic")
+    rec.add_argument("url")
+    rec.add_argument("path")
+    rec.add_argument("--browser", help="Path to browser executable")
+    rep = sub.add_parser("replay", help="Replay a recording without a browser")
+    rep.add_argument("path")
+    rep.add_argument("--runs", type=int, default=20)
+    rep.add_argument("--realtime", action="store_true", help="Replay with the recorded latencies")
+    rep.add_argument("--profile", action="store_true", help="Print the top functions by cumulative time")
+    args = parser.parse_args()
+
+    if args.command == "record":
+        asyncio.run(record(args.url, args.path, args.browser))
+        return
+
+    profiler = cProfile.Profile() if args.profile else None
+    if profiler:
+        profiler.enable()
+    elapsed = asyncio.run(replay(args.path, args.runs, args.realtime))
+    if profiler:
+        profiler.disable()
+        pstats.Stats(profiler).sort_stats("cumulative").print_stats(25)
+    print(f"{args.runs} replays in {elapsed:.2f}s ({elapsed / args.runs * 1000:.1f} ms per scrape)")
+
+
+if __name__ == "__main__":
+    main()
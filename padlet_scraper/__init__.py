@@ -1,7 +1,8 @@
 """Padlet Scraper - Extract structured data from Padlet boards."""
 
-from .models import Post, Section, Padlet, Link
+from .models import Post, Section, Padlet, Link, Attachment
 from .scraper import PadletScraper, scrape_padlet
+from .client import PadletClient
 
 __version__ = "0.1.0"
-__all__ = ["Post", "Section", "Padlet", "Link", "PadletScraper", "scrape_padlet"]
+__all__ = ["Post", "Section", "Padlet", "Link", "Attachment", "PadletScraper", "scrape_padlet", "PadletClient"]
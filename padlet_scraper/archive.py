@@ -0,0 +1,301 @@
+"""Compressed, chunked JSON Lines archives of scraped Padlets.
+
+An archive stores one board per line, grouped into chunks that are
+compressed independently (zstd when the optional `zstandard` package is
+installed, gzip otherwise). Concatenated zstd frames / gzip members form a
+valid stream, so `zstdcat board.pjz` or `zcat board.pjz` prints plain JSONL.
+
+A small JSON index next to the archive (`<archive>.idx`) records each
+chunk's byte offset and which chunk/line holds each board URL, so a single
+board can be loaded by decompressing just one chunk.
+"""
+
+import gzip
+import io
+import json
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, Union
+from .models import Padlet
+from .utils import atomic_write
+
+try:
+    import zstandard
+except ImportError:  # optional dependency
+    zstandard = None
+
+INDEX_VERSION = 1
+INDEX_SUFFIX = ".idx"
+DEFAULT_CHUNK_BYTES = 1024 * 1024
+
+# Read size when streaming an archive without its index
+_STREAM_READ_BYTES = 1024 * 1024
+
+_GZIP_MAGIC = b"\x1f\x8b"
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+
+def default_codec() -> str:
+    """Return 'zstd' if zstandard is installed, else 'gzip'."""
+    return "zstd" if zstandard is not None else "gzip"
+
+
+def _require_codec(codec: str) -> None:
+    if codec not in ("zstd", "gzip"):
+        raise ValueError(f"Unknown archive codec '{codec}' (use 'zstd' or 'gzip')")
+    if codec == "zstd" and zstandard is None:
+        raise ImportError("zstd archives need the 'zstandard' package: pip install zstandard")
+
+
+def _compress(codec: str, data: bytes, level: Optional[int]) -> bytes:
+    if codec == "zstd":
+        return zstandard.ZstdCompressor(level=3 if level is None else level).compress(data)
+    # mtime=0 keeps output deterministic
+    return gzip.compress(data, compresslevel=6 if level is None else level, mtime=0)
+
+
+def _decompress(codec: str, data: bytes) -> bytes:
+    if codec == "zstd":
+        return zstandard.ZstdDecompressor().decompress(data)
+    return gzip.decompress(data)
+
+
+def index_path(archive_path: Union[str, Path]) -> Path:
+    """Return the path of the index file belonging to an archive."""
+    archive_path = Path(archive_path)
+    return archive_path.with_name(archive_path.name + INDEX_SUFFIX)
+
+
+class ArchiveWriter:
+    """Writes Padlets to a chunked, compressed archive.
+
+    Usage:
+        with ArchiveWriter("boards.pjz") as archive:
+            for padlet in padlets:
+                archive.write(padlet)
+    """
+
+    def __init__(self, path: Union[str, Path], codec: Optional[str] = None, chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+                 level: Optional[int] = None, append: bool = False):
+        """
+        Open an archive for writing.
+
+        Args:
+            path: Archive file path
+            codec: 'zstd' or 'gzip' (default: zstd if available, else gzip)
+            chunk_bytes: Uncompressed size at which a chunk is compressed and written
+            level: Compression level (codec default if None)
+            append: Add to an existing archive instead of replacing it
+        """
+        self.path = Path(path)
+        self.chunk_bytes = chunk_bytes
+        self.level = level
+        self._chunks: list[dict] = []
+        self._boards: dict[str, list[int]] = {}
+        self._buffer: list[bytes] = []
+        self._buffered = 0
+
+        existing = None
+        if append and self.path.exists():
+            existing = _read_index(self.path)
+            if existing is None:
+                raise ValueError(f"Cannot append to {self.path}: its index is missing or out of date")
+        if existing is not None:
+            if codec is not None and codec != existing["codec"]:
+                raise ValueError(f"{self.path} uses {existing['codec']}, not {codec}")
+            self.codec = existing["codec"]
+            self._chunks = existing["chunks"]
+            self._boards = existing["boards"]
+        else:
+            self.codec = codec or default_codec()
+        _require_codec(self.codec)
+
+        self._file = open(self.path, "ab" if existing is not None else "wb")
+
+    def write(self, padlet: Padlet) -> None:
+        """Add one Padlet to the archive (a later board with the same URL shadows earlier ones)."""
+        line = padlet.model_dump_json().encode("utf-8") + b"\n"
+        chunk_no = len(self._chunks)
+        self._boards[padlet.url] = [chunk_no, len(self._buffer)]
+        self._buffer.append(line)
+        self._buffered += len(line)
+        if self._buffered >= self.chunk_bytes:
+            self.flush()
+
+    def write_all(self, padlets: Iterable[Padlet]) -> None:
+        """Add every Padlet from an iterable."""
+        for padlet in padlets:
+            self.write(padlet)
+
+    def flush(self) -> None:
+        """Compress and write the buffered boards as one chunk."""
+        if not self._buffer:
+            return
+        data = _compress(self.codec, b"".join(self._buffer), self.level)
+        offset = self._file.tell()
+        self._file.write(data)
+        self._chunks.append({"offset": offset, "length": len(data), "records": len(self._buffer)})
+        self._buffer = []
+        self._buffered = 0
+
+    def close(self) -> None:
+        """Write the last chunk and the index."""
+        if self._file.closed:
+            return
+        self.flush()
+        size = self._file.tell()
+        self._file.close()
+        with atomic_write(index_path(self.path)) as f:
+            json.dump({
+                "version": INDEX_VERSION,
+                "codec": self.codec,
+                "size": size,
+                "chunks": self._chunks,
+                "boards": self._boards,
+            }, f)
+
+    def __enter__(self) -> "ArchiveWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+def _iter_records(data: bytes) -> Iterator[bytes]:
+    """Yield the lines of a decompressed chunk one at a time.
+
+    Unlike bytes.splitlines() this doesn't copy every line of the chunk up
+    front, which is a noticeable share of a full scan.
+    """
+    start = 0
+    while start < len(data):
+        end = data.find(b"\n", start)
+        if end < 0:
+            end = len(data)
+        yield data[start:end]
+        start = end + 1
+
+
+def _read_index(path: Path) -> Optional[dict]:
+    """Load an archive's index, or None if it is missing or doesn't match the archive."""
+    try:
+        with open(index_path(path), "r", encoding="utf-8") as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if index.get("version") != INDEX_VERSION or index.get("size") != path.stat().st_size:
+        return None
+    return index
+
+
+class ArchiveReader:
+    """Reads Padlets from an archive lazily.
+
+    With a valid index, boards are located by URL and only the chunk that
+    holds them is decompressed. Without one (e.g. the writer crashed), the
+    archive is still readable as a stream.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Open an archive for reading.
+
+        Args:
+            path: Archive file path
+        """
+        self.path = Path(path)
+        self.index = _read_index(self.path)
+        if self.index is not None:
+            self.codec = self.index["codec"]
+        else:
+            with open(self.path, "rb") as f:
+                magic = f.read(4)
+            if magic.startswith(_ZSTD_MAGIC):
+                self.codec = "zstd"
+            elif magic.startswith(_GZIP_MAGIC) or not magic:
+                self.codec = "gzip"
+            else:
+                raise ValueError(f"{self.path} is not a Padlet archive")
+        _require_codec(self.codec)
+
+    def _read_chunk(self, f, chunk: dict) -> bytes:
+        f.seek(chunk["offset"])
+        return _decompress(self.codec, f.read(chunk["length"]))
+
+    def _iter_lines(self) -> Iterator[bytes]:
+        with open(self.path, "rb") as f:
+            if self.index is not None:
+                for chunk in self.index["chunks"]:
+                    yield from _iter_records(self._read_chunk(f, chunk))
+            else:
+                # Without an index, decompress as one stream in large reads
+                if self.codec == "zstd":
+                    reader = zstandard.ZstdDecompressor().stream_reader(f, read_across_frames=True)
+                else:
+                    reader = gzip.GzipFile(fileobj=f)
+                with io.BufferedReader(reader, buffer_size=_STREAM_READ_BYTES) as lines:
+                    for line in lines:
+                        yield line.rstrip(b"\n")
+
+    def __iter__(self) -> Iterator[Padlet]:
+        """Yield every board in write order, decompressing one chunk at a time."""
+        for line in self._iter_lines():
+            if line.strip():
+                yield Padlet.model_validate_json(line)
+
+    def urls(self) -> list[str]:
+        """Return the URLs of all boards in the archive."""
+        if self.index is not None:
+            return list(self.index["boards"])
+        return list(dict.fromkeys(json.loads(line)["url"] for line in self._iter_lines() if line.strip()))
+
+    def load(self, url: str) -> Padlet:
+        """
+        Load one board by URL (the most recently written one if repeated).
+
+        Raises:
+            KeyError: If the archive holds no board with this URL
+        """
+        if self.index is None:
+            found = None
+            for padlet in self:
+                if padlet.url == url:
+                    found = padlet
+            if found is None:
+                raise KeyError(url)
+            return found
+
+        chunk_no, line_no = self.index["boards"][url]
+        with open(self.path, "rb") as f:
+            data = self._read_chunk(f, self.index["chunks"][chunk_no])
+        for i, line in enumerate(_iter_records(data)):
+            if i == line_no:
+                return Padlet.model_validate_json(line)
+        raise ValueError(f"{self.path} is damaged: line {line_no} of chunk {chunk_no} is missing")
+
+    def __contains__(self, url: str) -> bool:
+        if self.index is not None:
+            return url in self.index["boards"]
+        return url in self.urls()
+
+    def __len__(self) -> int:
+        if self.index is not None:
+            return sum(chunk["records"] for chunk in self.index["chunks"])
+        return sum(1 for line in self._iter_lines() if line.strip())
+
+
+def save_to_archive(padlets: Iterable[Padlet], path: Union[str, Path], **kwargs) -> None:
+    """
+    Write Padlets to a new archive.
+
+    Args:
+        padlets: Boards to write
+        path: Archive file path
+        **kwargs: Passed to ArchiveWriter (codec, chunk_bytes, level)
+    """
+    with ArchiveWriter(path, **kwargs) as archive:
+        archive.write_all(padlets)
+
+
+def iter_archive(path: Union[str, Path]) -> Iterator[Padlet]:
+    """Lazily yield every Padlet stored in an archive."""
+    return iter(ArchiveReader(path))
@@ -0,0 +1,388 @@
+"""Download post attachments into a content-addressed on-disk cache.
+
+Attachments are stored once per distinct content under the SHA-256 of their
+bytes, and every URL that was downloaded remembers which content it
+resolved to, so media shared between boards (or between snapshots of one
+board) is only fetched once. The cache is kept under a size limit by
+evicting the least recently used content.
+
+Usage:
+    cache = AttachmentCache("attachments", max_bytes=2 * 1024 ** 3)
+    scraper = PadletScraper(attachment_fetcher=AttachmentFetcher(cache))
+    padlet = await scraper.scrape(url)
+    for post in padlet.sections[0].posts:
+        for attachment in post.attachments:
+            print(attachment.url, cache.path(attachment.cache_key))
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import threading
+from pathlib import Path
+from typing import Optional, Union
+from urllib.parse import urlsplit
+from pydantic import BaseModel, Field
+from .httpclient import HttpPool
+from .models import Attachment, Padlet
+from .utils import atomic_write
+
+ATTACHMENT_KINDS = ("image", "video", "audio", "file", "link")
+# Kinds downloaded by default; links usually point at whole web pages
+DOWNLOAD_KINDS = ("image", "video", "audio", "file")
+# Link targets with these extensions are files rather than web pages
+FILE_EXTENSIONS = {
+    ".pdf", ".doc", ".docx", ".xls", ".xlsx", ".ppt", ".pptx", ".odt", ".ods", ".odp",
+    ".txt", ".csv", ".rtf", ".zip", ".epub", ".key", ".pages", ".numbers",
+}
+IMAGE_EXTENSIONS = {".png", ".jpg", ".jpeg", ".gif", ".webp", ".svg", ".bmp", ".avif", ".heic"}
+VIDEO_EXTENSIONS = {".mp4", ".webm", ".mov", ".m4v"}
+AUDIO_EXTENSIONS = {".mp3", ".wav", ".ogg", ".m4a", ".aac", ".flac"}
+# Hosts Padlet serves uploaded files from
+UPLOAD_HOSTS = ("padlet-uploads.storage.googleapis.com", "padletusercontent.com")
+
+# After an eviction the cache is trimmed to this fraction of its limit, so
+# adding one file at a time doesn't rescan the cache on every download
+_EVICT_TO = 0.9
+
+
+def attachment_kind(url: str, hint: Optional[str] = None) -> str:
+    """
+    Classify an attachment URL.
+
+    Args:
+        url: The attachment URL
+        hint: Kind suggested by the element it was found on ("image", "video",
+              "audio" or "link"); links are refined by their extension and host
+
+    Returns:
+        One of ATTACHMENT_KINDS
+    """
+    if hint in ("image", "video", "audio", "file"):
+        return hint
+    parts = urlsplit(url)
+    extension = os.path.splitext(parts.path)[1].lower()
+    if extension in IMAGE_EXTENSIONS:
+        return "image"
+    if extension in VIDEO_EXTENSIONS:
+        return "video"
+    if extension in AUDIO_EXTENSIONS:
+        return "audio"
+    if extension in FILE_EXTENSIONS or (parts.hostname or "").endswith(UPLOAD_HOSTS):
+        return "file"
+    return "link"
+
+
+def _sha256(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class AttachmentStats(BaseModel):
+    """Counters for one AttachmentFetcher.fetch() call."""
+
+    attachments: int = Field(description="Attachments found on the board")
+    unique: int = Field(description="Distinct URLs among them that were eligible for download")
+    cached: int = Field(description="URLs already in the cache")
+    downloaded: int = Field(description="URLs downloaded")
+    failed: int = Field(description="URLs that could not be downloaded")
+    unfinished: int = Field(default=0, description="URLs still downloading when the time ran out")
+    bytes_downloaded: int = Field(description="Bytes written to the cache")
+
+
+class AttachmentCache:
+    """Content-addressed store of downloaded attachments with a size limit.
+
+    Layout under the root directory:
+        objects/ab/abcdef...   content, named by its SHA-256
+        urls/12/123456...      JSON reference from a URL (by its SHA-256) to content
+
+    Reads refresh an object's modification time, which eviction uses as its
+    least-recently-used order. Safe to use from several threads.
+    """
+
+    def __init__(self, root: Union[str, Path], max_bytes: Optional[int] = 1024 ** 3):
+        """
+        Open (or create) a cache directory.
+
+        Args:
+            root: Cache directory
+            max_bytes: Total content size to keep; least recently used content
+                       is evicted beyond it. None means no limit.
+        """
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self._objects = self.root / "objects"
+        self._urls = self.root / "urls"
+        self._objects.mkdir(parents=True, exist_ok=True)
+        self._urls.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._size = sum(entry.stat().st_size for entry in self._iter_objects())
+
+    def _iter_objects(self):
+        for shard in os.scandir(self._objects):
+            if shard.is_dir():
+                for entry in os.scandir(shard.path):
+                    if entry.is_file() and not entry.name.startswith("."):
+                        yield entry
+
+    @property
+    def size(self) -> int:
+        """Total bytes of content in the cache."""
+        return self._size
+
+    def path(self, key: str) -> Path:
+        """Path of the content with the given SHA-256 key (which may not exist)."""
+        return self._objects / key[:2] / key
+
+    def __contains__(self, key: str) -> bool:
+        return self.path(key).exists()
+
+    def _ref_path(self, url: str) -> Path:
+        digest = _sha256(url)
+        return self._urls / digest[:2] / digest
+
+    def lookup(self, url: str) -> Optional[dict]:
+        """
+        Find the content a URL was downloaded to.
+
+        Returns:
+            {"key", "content_type", "size"}, or None if the URL was never
+            downloaded or its content has been evicted
+        """
+        try:
+            with open(self._ref_path(url), "r", encoding="utf-8") as f:
+                ref = json.load(f)
+            os.utime(self.path(ref["key"]))  # mark as recently used
+        except (OSError, ValueError, KeyError):
+            return None
+        return ref
+
+    def temp_file(self):
+        """Open a temporary binary file on the cache's filesystem for add()."""
+        return tempfile.NamedTemporaryFile(dir=self._objects, prefix=".download.", delete=False)
+
+    def add(self, url: str, temp_path: Union[str, Path], key: str, content_type: Optional[str] = None) -> dict:
+        """
+        Move a downloaded file into the cache and record the URL it came from.
+
+        Args:
+            url: Source URL
+            temp_path: File written via temp_file(); it is moved or removed
+            key: SHA-256 of the file's content
+            content_type: Content-Type of the download
+
+        Returns:
+            The reference stored for the URL ({"key", "content_type", "size"})
+        """
+        path = self.path(key)
+        size = os.path.getsize(temp_path)
+        with self._lock:
+            if path.exists():
+                os.unlink(temp_path)  # the same content came from another URL
+                os.utime(path)
+            else:
+                path.parent.mkdir(exist_ok=True)
+                os.replace(temp_path, path)
+                self._size += size
+
+        ref = {"key": key, "content_type": content_type, "size": size}
+        ref_path = self._ref_path(url)
+        ref_path.parent.mkdir(exist_ok=True)
+        with atomic_write(ref_path) as f:
+            json.dump(ref, f)
+
+        if self.max_bytes is not None and self._size > self.max_bytes:
+            self.evict(keep=key)
+        return ref
+
+    def evict(self, keep: Optional[str] = None) -> int:
+        """
+        Remove least recently used content until the cache fits its limit.
+
+        References to evicted content are left in place; lookup() treats them
+        as misses and the next download overwrites them.
+
+        Args:
+            keep: Key that must not be evicted (e.g. the content just added)
+
+        Returns:
+            Number of objects removed
+        """
+        if self.max_bytes is None:
+            return 0
+        with self._lock:
+            if self._size <= self.max_bytes:
+                return 0
+            target = self.max_bytes * _EVICT_TO
+            removed = 0
+            for entry in sorted(self._iter_objects(), key=lambda e: e.stat().st_mtime):
+                if self._size <= target:
+                    break
+                if entry.name == keep:
+                    continue
+                size = entry.stat().st_size
+                try:
+                    os.unlink(entry.path)
+                except FileNotFoundError:
+                    continue
+                self._size -= size
+                removed += 1
+            return removed
+
+
+class _HashingWriter:
+    """File wrapper that hashes everything written through it."""
+
+    def __init__(self, f):
+        self.f = f
+        self.sha256 = hashlib.sha256()
+
+    def write(self, data: bytes) -> int:
+        self.sha256.update(data)
+        return self.f.write(data)
+
+
+class AttachmentFetcher:
+    """Downloads the attachments of scraped boards into an AttachmentCache.
+
+    Downloads run concurrently over a pooled HTTP client with a per-host
+    limit. URLs already in the cache are not fetched again, and a URL
+    requested by several boards at once is downloaded only once.
+    """
+
+    def __init__(self, cache: AttachmentCache, http_pool: Optional[HttpPool] = None, max_concurrency: int = 8,
+                 max_per_host: int = 4, max_file_bytes: Optional[int] = 100 * 1024 ** 2,
+                 kinds: tuple[str, ...] = DOWNLOAD_KINDS):
+        """
+        Initialize the fetcher.
+
+        Args:
+            cache: Cache to download into
+            http_pool: Connection pool (one with max_per_host connections per host if None)
+            max_concurrency: Maximum downloads in flight
+            max_per_host: Maximum downloads in flight to one host
+            max_file_bytes: Skip attachments larger than this (None means no limit)
+            kinds: Attachment kinds to download (see ATTACHMENT_KINDS)
+        """
+        self.cache = cache
+        self.http_pool = http_pool or HttpPool(max_per_host=max_per_host, timeout=30.0)
+        self.max_concurrency = max_concurrency
+        self.max_per_host = max_per_host
+        self.max_file_bytes = max_file_bytes
+        self.kinds = kinds
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._hosts: dict[str, asyncio.Semaphore] = {}
+        self._inflight: dict[str, asyncio.Future] = {}
+
+    def _download(self, url: str) -> dict:
+        """Download a URL into the cache (blocking; runs on an executor thread)."""
+        with self.cache.temp_file() as f:
+            temp_path = f.name
+            try:
+                writer = _HashingWriter(f)
+                response = self.http_pool.stream_to(url, writer, max_bytes=self.max_file_bytes)
+            except BaseException:
+                f.close()
+                os.unlink(temp_path)
+                raise
+        content_type = response.headers.get("content-type")
+        return self.cache.add(url, temp_path, writer.sha256.hexdigest(), content_type)
+
+    async def _fetch_url(self, url: str) -> tuple[dict, bool]:
+        """Return (reference, downloaded) for a URL, downloading it if it isn't cached."""
+        # The reference file and the mtime refresh are disk I/O; keep them off the event loop
+        ref = await asyncio.to_thread(self.cache.lookup, url)
+        if ref is not None:
+            return ref, False
+        host = urlsplit(url).hostname or ""
+        if host not in self._hosts:
+            self._hosts[host] = asyncio.Semaphore(self.max_per_host)
+        async with self._semaphore, self._hosts[host]:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, self._download, url), True
+
+    def _forget(self, url: str, task: asyncio.Future) -> None:
+        self._inflight.pop(url, None)
+        if not task.cancelled():
+            task.exception()  # retrieved here in case no board waited for it to finish
+
+    async def fetch(self, padlet: Padlet, timeout: Optional[float] = None) -> AttachmentStats:
+        """
+        Download a board's attachments and fill in their cache references.
+
+        Failed downloads are reported on stderr and leave cache_key unset;
+        they never fail the scrape. Downloads still running when the timeout
+        runs out also leave cache_key unset and mark the board partial; they
+        carry on in the background, so a later fetch finds them cached.
+
+        Args:
+            padlet: Scraped board whose posts' attachments to fetch
+            timeout: Seconds to wait for the downloads (None waits for all)
+
+        Returns:
+            AttachmentStats for this board
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        attachments: dict[str, list[Attachment]] = {}
+        total = 0
+        for section in padlet.sections:
+            for post in section.posts:
+                for attachment in post.attachments:
+                    total += 1
+                    if attachment.kind in self.kinds:
+                        attachments.setdefault(attachment.url, []).append(attachment)
+
+        # Share downloads of the same URL between boards fetched concurrently
+        tasks = {}
+        for url in attachments:
+            task = self._inflight.get(url)
+            if task is None:
+                task = self._inflight[url] = asyncio.ensure_future(self._fetch_url(url))
+                task.add_done_callback(lambda task, url=url: self._forget(url, task))
+            tasks[url] = task
+        # asyncio.wait() never cancels the downloads, which other boards may be waiting for
+        if tasks:
+            await asyncio.wait(tasks.values(), timeout=timeout)
+
+        cached = downloaded = failed = unfinished = written = 0
+        for url, task in tasks.items():
+            if not task.done():
+                unfinished += 1
+                continue
+            if task.cancelled() or task.exception() is not None:
+                failed += 1
+                error = "cancelled" if task.cancelled() else task.exception()
+                print(f"Warning: Could not download attachment {url}: {error}", file=sys.stderr)
+                continue
+            ref, fetched = task.result()
+            if fetched:
+                downloaded += 1
+                written += ref["size"]
+            else:
+                cached += 1
+            for attachment in attachments[url]:
+                attachment.cache_key = ref["key"]
+                attachment.content_type = ref.get("content_type")
+                attachment.size = ref.get("size")
+        if unfinished:
+            print(f"Warning: Ran out of time with {unfinished} attachment(s) still downloading", file=sys.stderr)
+            padlet.partial = True
+
+        return AttachmentStats(
+            attachments=total,
+            unique=len(attachments),
+            cached=cached,
+            downloaded=downloaded,
+            failed=failed,
+            unfinished=unfinished,
+            bytes_downloaded=written,
+        )
+
+    def close(self) -> None:
+        """Close the fetcher's idle HTTP connections."""
+        self.http_pool.close()
@@ -0,0 +1,344 @@
+"""Token-budgeted Markdown chunks of a board, with cached per-chunk processing.
+
+For feeding boards to a language model: chunk_padlet() splits a board's
+Markdown on section and post boundaries into chunks that fit a token
+budget, each with a stable content hash. Boundaries depend on the posts
+themselves, not on how much came before them, so editing one post only
+changes the chunk it is in. ChunkProcessor runs a function
+(e.g. a model call) over the chunks with bounded concurrency and caches
+the results by chunk hash, so re-running on a board that barely changed
+only reprocesses the chunks that did.
+
+Usage:
+    chunks = chunk_padlet(padlet, max_tokens=3000)
+    processor = ChunkProcessor(summarize, cache=FileChunkCache(".chunk-cache"), namespace="summary-v1")
+    summaries = await processor.run(chunks)
+"""
+
+import asyncio
+import hashlib
+import inspect
+import json
+import math
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Optional, Union
+from pydantic import BaseModel, Field
+from .models import Padlet, Post
+from .utils import atomic_write
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count for English text (about four characters per token)."""
+    return math.ceil(len(text) / 4)
+
+
+class Chunk(BaseModel):
+    """A piece of a board's Markdown that fits a token budget."""
+
+    index: int = Field(description="Position of the chunk in the board")
+    markdown: str = Field(description="Markdown of the chunk, starting with the board and section headings it belongs to")
+    tokens: int = Field(description="Token count of the Markdown")
+    hash: str = Field(description="SHA-256 of the Markdown; unchanged content gives the same hash")
+    sections: list[str] = Field(default_factory=list, description="Title of the section the chunk belongs to")
+    posts: int = Field(default=0, description="Number of posts (or post parts) in the chunk")
+
+    def __str__(self) -> str:
+        return f"Chunk {self.index} ({self.tokens} tokens, {self.posts} post(s), {self.hash[:12]})"
+
+
+def _post_markdown(post: Post) -> str:
+    # Same layout as Padlet.iter_markdown()
+    return f"### {post.subject}\n\n{post.body}\n"
+
+
+def _split_text(text: str, max_tokens: int, count_tokens: Callable[[str], int]) -> list[str]:
+    """Split text to fit max_tokens, on paragraphs, then lines, then characters."""
+    if count_tokens(text) <= max_tokens:
+        return [text]
+    for separator in ("\n\n", "\n"):
+        pieces = text.split(separator)
+        if len(pieces) > 1:
+            parts, current = [], ""
+            for piece in pieces:
+                candidate = current + separator + piece if current else piece
+                if current and count_tokens(candidate) > max_tokens:
+                    parts.append(current)
+                    current = piece
+                else:
+                    current = candidate
+            parts.append(current)
+            # A piece may still be too big on its own; split it further
+            return [part for p in parts for part in _split_text(p, max_tokens, count_tokens)]
+
+    # No line breaks left: cut by characters, shrinking each cut until it fits
+    parts = []
+    while text:
+        size = max(1, len(text) * max_tokens // max(count_tokens(text), 1))
+        while size > 1 and count_tokens(text[:size]) > max_tokens:
+            size = size * 9 // 10
+        parts.append(text[:size])
+        text = text[size:]
+    return parts
+
+
+def _cut_before(text: str, tokens: int, target: int) -> bool:
+    """Whether a chunk boundary falls before a post, given its Markdown.
+
+    Decided by the post alone: its whole Markdown hashes to a number in
+    [0, 1), and the boundary is there when that number is below the post's
+    share of the target chunk size. Chunks thus average about target tokens,
+    and inserting, removing or editing a post moves no boundary elsewhere in
+    its section. (Subjects alone won't do: posts without one all share the
+    "Untitled" placeholder.)
+    """
+    point = int.from_bytes(hashlib.sha256(text.encode("utf-8")).digest()[:8], "big") / 2 ** 64
+    return point * target < tokens
+
+
+def chunk_padlet(padlet: Padlet, max_tokens: int = 2000,
+                 count_tokens: Callable[[str], int] = estimate_tokens) -> list[Chunk]:
+    """
+    Split a board's Markdown into chunks of at most max_tokens tokens.
+
+    Every section starts a new chunk. A section too big for one chunk is
+    cut between posts at points picked from the posts' own content (see
+    _cut_before()) rather than by running token totals, so an edit to one
+    post changes the hash of its own chunk (or, when the edit adds or
+    removes the boundary before the post, of it and its neighbour) and
+    leaves the others cached. Only when a chunk would overflow the budget
+    is it cut early; an edit that makes a post much longer can move such
+    cuts up to the next content-defined one.
+    Every chunk repeats the board title and its section heading so it can
+    be read on its own. A post too big for one chunk gets chunks of its
+    own, split between paragraphs. The same board content always gives the
+    same chunks and hashes.
+
+    Args:
+        padlet: The board to chunk
+        max_tokens: Token budget of a chunk
+        count_tokens: Token counter (e.g. a model tokenizer's; estimate_tokens() by default)
+
+    Returns:
+        Chunks in board order
+    """
+    header = f"# {padlet.title}\n\n" if padlet.title else ""
+    budget = max_tokens - count_tokens(header)
+
+    chunks: list[Chunk] = []
+    parts: list[str] = []  # section heading and posts of the chunk being filled
+    used = 0  # tokens of parts, counted piece by piece (+1 per separator)
+    posts = 0
+
+    for section in padlet.sections:
+        if not section.posts:
+            continue
+        heading = f"## {section.title}\n"
+        heading_tokens = count_tokens(heading) + 1
+        room = budget - heading_tokens
+        if room < 1:
+            raise ValueError(f"max_tokens ({max_tokens}) leaves no room for posts in section '{section.title}'")
+        # Aim below the budget so cuts forced by the budget are rare
+        target = max(1, room // 2)
+
+        def flush() -> None:
+            nonlocal parts, used, posts
+            if posts:
+                markdown = header + "\n".join(parts)
+                chunks.append(Chunk(
+                    index=len(chunks),
+                    markdown=markdown,
+                    tokens=count_tokens(markdown),
+                    hash=hashlib.sha256(markdown.encode("utf-8")).hexdigest(),
+                    sections=[section.title],
+                    posts=posts,
+                ))
+            parts, used, posts = [heading], 0, 0
+
+        def add(piece: str, tokens: int) -> None:
+            nonlocal used, posts
+            parts.append(piece)
+            used += tokens
+            posts += 1
+
+        flush()
+        for post in section.posts:
+            text = _post_markdown(post)
+            tokens = count_tokens(text) + 1
+            if tokens > room:
+                flush()
+                for piece in _split_text(text, room, count_tokens):
+                    add(piece, count_tokens(piece) + 1)
+                    flush()
+                continue
+            if posts and (used + tokens > room or _cut_before(text, tokens, target)):
+                flush()
+            add(text, tokens)
+        flush()
+    return chunks
+
+
+class MemoryChunkCache:
+    """Chunk result cache kept in a dict (for tests and single runs)."""
+
+    def __init__(self):
+        self.results: dict[str, Any] = {}
+
+    def get(self, key: str) -> Optional[Any]:
+        return self.results.get(key)
+
+    def set(self, key: str, value: Any) -> None:
+        self.results[key] = value
+
+
+class FileChunkCache:
+    """Chunk result cache with one JSON file per key in a directory.
+
+    Any object with the same get()/set() methods can be passed to
+    ChunkProcessor instead (e.g. one backed by Redis or a database).
+    """
+
+    def __init__(self, root: Union[str, Path]):
+        """
+        Open (or create) a cache directory.
+
+        Args:
+            root: Cache directory
+        """
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        return self.root / (hashlib.sha256(key.encode("utf-8")).hexdigest() + ".json")
+
+    def get(self, key: str) -> Optional[Any]:
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as f:
+                return json.load(f)["value"]
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def set(self, key: str, value: Any) -> None:
+        with atomic_write(self._path(key)) as f:
+            json.dump({"key": key, "value": value}, f, ensure_ascii=False)
+
+
+class ProcessStats(BaseModel):
+    """Counters for one ChunkProcessor.run() call."""
+
+    chunks: int = Field(description="Chunks given to run()")
+    cached: int = Field(description="Distinct chunks whose result came from the cache")
+    processed: int = Field(description="Distinct chunks processed by the function")
+
+
+class ChunkProcessor:
+    """Runs a function over chunks with bounded concurrency, caching results by chunk hash."""
+
+    def __init__(self, fn: Callable[[Chunk], Union[Any, Awaitable[Any]]], cache=None, max_concurrency: int = 4,
+                 namespace: str = ""):
+        """
+        Initialize the processor.
+
+        Args:
+            fn: Called with each Chunk; may be a coroutine function. Plain
+                functions run on the default executor so blocking model
+                clients don't stall the event loop. Results must be
+                JSON-serializable to use FileChunkCache.
+            cache: Object with get(key) and set(key, value) (MemoryChunkCache,
+                   FileChunkCache or your own); None disables caching
+            max_concurrency: Maximum chunks processed at once
+            namespace: Prefix of the cache keys; change it when the prompt or
+                       model changes so old results aren't reused
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.fn = fn
+        self.cache = cache
+        self.max_concurrency = max_concurrency
+        self.namespace = namespace
+        self.last_stats: Optional[ProcessStats] = None
+
+    def key(self, chunk: Chunk) -> str:
+        """Cache key of a chunk's result."""
+        return f"{self.namespace}:{chunk.hash}"
+
+    async def _call(self, chunk: Chunk) -> Any:
+        if inspect.iscoroutinefunction(self.fn) or inspect.iscoroutinefunction(getattr(self.fn, "__call__", None)):
+            return await self.fn(chunk)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.fn, chunk)
+
+    async def run(self, chunks: list[Chunk]) -> list[Any]:
+        """
+        Process chunks, reusing cached results for chunks seen before.
+
+        Identical chunks in one run are processed once. The first failure
+        cancels the remaining work and is raised; results finished before it
+        stay cached.
+
+        Returns:
+            One result per chunk, in order
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        results: dict[str, Any] = {}
+        cached = 0
+        todo: dict[str, Chunk] = {}
+        for chunk in chunks:
+            key = self.key(chunk)
+            if key in results or key in todo:
+                continue
+            value = self.cache.get(key) if self.cache is not None else None
+            if value is not None:
+                results[key] = value
+                cached += 1
+            else:
+                todo[key] = chunk
+
+        async def process(key: str, chunk: Chunk) -> None:
+            async with semaphore:
+                value = await self._call(chunk)
+            if self.cache is not None:
+                self.cache.set(key, value)
+            results[key] = value
+
+        tasks = [asyncio.ensure_future(process(key, chunk)) for key, chunk in todo.items()]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+        self.last_stats = ProcessStats(chunks=len(chunks), cached=cached, processed=len(todo))
+        return [results[self.key(chunk)] for chunk in chunks]
+
+
+class FakeModel:
+    """Deterministic local stand-in for a model, for tests and dry runs.
+
+    Returns a short digest of each chunk (headings, post count and hash)
+    and counts its calls, so tests can check what was (re)processed.
+    """
+
+    def __init__(self, latency: float = 0.0):
+        """
+        Initialize the fake model.
+
+        Args:
+            latency: Seconds each call takes, to exercise concurrency
+        """
+        self.latency = latency
+        self.calls = 0
+        self.active = 0
+        self.peak = 0
+
+    async def __call__(self, chunk: Chunk) -> str:
+        self.calls += 1
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            if self.latency:
+                await asyncio.sleep(self.latency)
+        finally:
+            self.active -= 1
+        return f"[{chunk.hash[:12]}] {', '.join(chunk.sections)}: {chunk.posts} post(s), {chunk.tokens} tokens"
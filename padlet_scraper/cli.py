@@ -3,11 +3,20 @@
 import argparse
 import asyncio
 import contextlib
+import io
 import os
 import sys
-from pathlib import Path
+import threading
+import time
+from typing import Optional
+from .attachments import AttachmentCache, AttachmentFetcher
+from .client import PadletClient
+from .coordinator import DEFAULT_PORT, Coordinator, JobQueue
+from .export import Exporter, writer_for
 from .scraper import PadletScraper
-from .utils import save_to_json, save_to_markdown
+from .session import BrowserSession
+from .utils import write_jsonl
+from .worker import Worker
 
 
 @contextlib.contextmanager
@@ -29,10 +38,103 @@ def _redirect_stdout_fd(to_fd: int):
             os.close(saved_fd)
 
 
-def main():
-    """Main CLI entry point."""
-    parser = argparse.ArgumentParser(
-        description="Scrape Padlet boards and export to JSON or Markdown",
+def _add_scraper_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the browser and scraping options shared by every mode."""
+    parser.add_argument(
+        "--no-headless",
+        action="store_true",
+        help="Show browser window (default is headless mode)"
+    )
+
+    parser.add_argument(
+        "--no-sandbox",
+        action="store_true",
+        help="Disable browser sandbox (may be needed on some systems)"
+    )
+
+    parser.add_argument(
+        "--browser",
+        help="Path to browser executable (Chrome, Chromium, etc.)"
+    )
+
+    parser.add_argument(
+        "--timeout",
+        type=int,
+        default=30,
+        help="Timeout in seconds for page elements (default: 30)"
+    )
+
+    parser.add_argument(
+        "--deadline",
+        type=float,
+        help="Maximum time in seconds for the whole scrape; on expiry, "
+             "partial results are returned with \"partial\": true (default: no limit)"
+    )
+
+    parser.add_argument(
+        "--fast-path",
+        action="store_true",
+        help="Read the board from its HTML over plain HTTP when possible, "
+             "falling back to the browser if the data is incomplete"
+    )
+
+    parser.add_argument(
+        "--tabs",
+        type=int,
+        default=1,
+        help="Split a very large board between this many browser tabs (default: 1)"
+    )
+
+    parser.add_argument(
+        "--loading",
+        choices=["scroll", "tall"],
+        default="scroll",
+        help="How to load lazy content: scroll the board, or render it in one tall "
+             "viewport (falls back to scrolling if that fails) (default: scroll)"
+    )
+
+    parser.add_argument(
+        "--attachments",
+        metavar="CACHE_DIR",
+        help="Capture post attachments and download images, media and files into this "
+             "content-addressed cache directory (shared between runs and boards)"
+    )
+
+    parser.add_argument(
+        "--attachment-cache-size",
+        type=int,
+        default=1024,
+        metavar="MB",
+        help="Size limit of the attachment cache; least recently used files are evicted (default: 1024)"
+    )
+
+
+def _scraper_options(args) -> dict:
+    """PadletScraper keyword arguments for the options added by _add_scraper_arguments()."""
+    return {
+        "headless": not args.no_headless,  # Headless by default, unless --no-headless
+        "timeout": args.timeout,
+        "browser_executable_path": args.browser,
+        "sandbox": not args.no_sandbox,
+        "deadline": args.deadline,
+        "fast_path": args.fast_path,
+        "tabs": args.tabs,
+        "loading": args.loading,
+        "attachment_fetcher": AttachmentFetcher(
+            AttachmentCache(args.attachments, max_bytes=args.attachment_cache_size * 1024 ** 2)
+        ) if args.attachments else None,
+    }
+
+
+# Subcommands; a command line that doesn't start with one of these is a scrape
+COMMANDS = ("scrape", "worker", "coordinator")
+
+
+def _add_scrape_parser(commands) -> None:
+    parser = commands.add_parser(
+        "scrape",
+        help="Scrape one board (the default when no command is given)",
+        description="Scrape Padlet boards and export to JSON, Markdown or JSONL",
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
 Examples:
@@ -42,6 +144,9 @@ Examples:
   # Scrape and save to Markdown
   padlet-scraper https://padlet.com/user/board -o output.md
 
+  # Write several formats from a single scrape
+  padlet-scraper https://padlet.com/user/board -o out.json -o out.md -o out.jsonl
+
   # Show browser window (for debugging)
   padlet-scraper https://padlet.com/user/board --no-headless -o output.json
 
@@ -57,91 +162,176 @@ Examples:
 
     parser.add_argument(
         "-o", "--output",
-        help="Output file path (extension determines format: .json or .md)"
+        action="append",
+        help="Output file path (extension determines format: .json, .md or .jsonl). "
+             "May be given multiple times to write several formats from one scrape"
     )
 
     parser.add_argument(
         "--format",
-        choices=["json", "markdown"],
+        choices=["json", "markdown", "jsonl"],
         help="Output format when printing to stdout (use with no -o flag)"
     )
 
+    _add_scraper_arguments(parser)
+    parser.set_defaults(handler=scrape_main)
+
+
+def _add_worker_parser(commands) -> None:
+    parser = commands.add_parser(
+        "worker",
+        help="Scrape boards leased from a coordinator",
+        description="Lease boards from a coordinator and scrape them with one warm browser"
+    )
     parser.add_argument(
-        "--no-headless",
-        action="store_true",
-        help="Show browser window (default is headless mode)"
+        "--coordinator",
+        default=f"http://127.0.0.1:{DEFAULT_PORT}",
+        help=f"Coordinator URL (default: http://127.0.0.1:{DEFAULT_PORT})"
     )
-
     parser.add_argument(
-        "--no-sandbox",
+        "--concurrency",
+        type=int,
+        default=2,
+        help="Boards scraped at once by this worker (default: 2)"
+    )
+    parser.add_argument(
+        "--name",
+        help="Worker name in the coordinator's stats (default: hostname-pid)"
+    )
+    parser.add_argument(
+        "--exit-when-idle",
         action="store_true",
-        help="Disable browser sandbox (may be needed on some systems)"
+        help="Exit once the coordinator has no jobs left instead of waiting for more"
     )
+    _add_scraper_arguments(parser)
+    parser.set_defaults(handler=worker_main)
+
 
+def _add_coordinator_parser(commands) -> None:
+    parser = commands.add_parser(
+        "coordinator",
+        help="Serve a queue of boards to workers",
+        description="Hand out boards to scrape to `padlet-scraper worker` processes"
+    )
     parser.add_argument(
-        "--browser",
-        help="Path to browser executable (Chrome, Chromium, etc.)"
+        "urls",
+        nargs="*",
+        help="Board URLs to enqueue at startup (more can be POSTed to /jobs)"
     )
-
     parser.add_argument(
-        "--timeout",
+        "--urls-file",
+        help="File with one board URL per line to enqueue at startup"
+    )
+    parser.add_argument(
+        "--host",
+        default="127.0.0.1",
+        help="Address to listen on; use 0.0.0.0 to accept workers on other hosts (default: 127.0.0.1)"
+    )
+    parser.add_argument(
+        "--port",
         type=int,
-        default=30,
-        help="Timeout in seconds for page elements (default: 30)"
+        default=DEFAULT_PORT,
+        help=f"Port to listen on (default: {DEFAULT_PORT})"
+    )
+    parser.add_argument(
+        "--lease-timeout",
+        type=float,
+        default=120.0,
+        help="Seconds before an unrenewed job is given to another worker (default: 120)"
+    )
+    parser.add_argument(
+        "--max-attempts",
+        type=int,
+        default=3,
+        help="Times a board is tried before it is marked failed (default: 3)"
+    )
+    parser.add_argument(
+        "--output-dir",
+        help="Write each result to <output-dir>/<job id>.json instead of keeping it in memory"
+    )
+    parser.add_argument(
+        "--stats-interval",
+        type=float,
+        default=30.0,
+        help="Print queue and throughput stats every this many seconds (0 disables; default: 30)"
     )
+    parser.set_defaults(handler=coordinator_main)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser with the scrape, worker and coordinator commands."""
+    parser = argparse.ArgumentParser(
+        prog="padlet-scraper",
+        description="Scrape Padlet boards, on their own or spread over several machines",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Scrape one board (same as `padlet-scraper scrape ...`)
+  padlet-scraper https://padlet.com/user/board -o output.json
+
+  # Spread many boards over several machines (see --help of each command)
+  padlet-scraper coordinator --urls-file boards.txt --output-dir results
+  padlet-scraper worker --coordinator http://coordinator-host:8700
+        """
+    )
+    commands = parser.add_subparsers(dest="command", metavar="{" + ",".join(COMMANDS) + "}")
+    _add_scrape_parser(commands)
+    _add_worker_parser(commands)
+    _add_coordinator_parser(commands)
+    return parser
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    """
+    Parse a command line; one that doesn't start with a command is a scrape.
+
+    Args:
+        argv: Arguments without the program name (sys.argv[1:] if None)
+
+    Returns:
+        The parsed arguments; args.handler runs the chosen command
+    """
+    argv = list(sys.argv[1:] if argv is None else argv)
+    # Keep `padlet-scraper URL ...` working: it means `padlet-scraper scrape URL ...`
+    if not argv or argv[0] not in (*COMMANDS, "-h", "--help"):
+        argv.insert(0, "scrape")
+    return build_parser().parse_args(argv)
+
+
+def main(argv: Optional[list[str]] = None):
+    """Main CLI entry point."""
+    args = parse_args(argv)
+    return args.handler(args)
 
-    args = parser.parse_args()
+
+def scrape_main(args: argparse.Namespace) -> None:
+    """Entry point for `padlet-scraper scrape`: scrape one board and export it."""
+    # Reject unsupported output paths before spending time on a scrape
+    for output in args.output or []:
+        try:
+            writer_for(output)
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
 
     # If we're printing machine-readable output to stdout, keep stdout "clean".
     # nodriver may write directly to fd=1 (bypassing sys.stdout) even after the
     # scrape completes, so we permanently redirect fd=1 to stderr and manually
     # write the final result to the original stdout fd.
-    clean_stdout = (args.output is None) and (args.format in {"json", "markdown"})
+    clean_stdout = (args.output is None) and (args.format in {"json", "markdown", "jsonl"})
     original_stdout_fd = None
     if clean_stdout:
         original_stdout_fd = os.dup(1)
         os.dup2(2, 1)  # redirect stdout -> stderr for the remainder of the process
 
-    # Run the scraper with proper event loop cleanup
+    # Run the scraper on a PadletClient's background loop; the client owns
+    # the event loop and browser and cleans both up on close.
     try:
-        # Create and manage event loop manually for proper cleanup
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            # nodriver can write directly to stdout's file descriptor; keep it off stdout.
-            padlet = loop.run_until_complete(scrape_with_args(args))
-        finally:
-            # Cleanup pending tasks
-            try:
-                # Cancel all remaining tasks
-                pending = asyncio.all_tasks(loop)
-                for task in pending:
-                    task.cancel()
-                # Wait for task cancellations to complete
-                if pending:
-                    loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
-            except Exception:
-                pass
-            # Give subprocesses time to cleanup
-            loop.run_until_complete(asyncio.sleep(0.25))
-            # Close the loop
-            loop.close()
-
-        # Output handling
-        if args.output:
-            output_path = Path(args.output)
-
-            if output_path.suffix.lower() == ".json":
-                save_to_json(padlet, output_path)
-                print(f"✓ Saved to {output_path}")
-            elif output_path.suffix.lower() == ".md":
-                save_to_markdown(padlet, output_path)
-                print(f"✓ Saved to {output_path}")
-            else:
-                print(f"Error: Unsupported file extension '{output_path.suffix}'. Use .json or .md", file=sys.stderr)
-                sys.exit(1)
-
-        elif args.format:
+        # nodriver can write directly to stdout's file descriptor; keep it off stdout.
+        padlet = scrape_with_args(args)
+
+        # Output handling (files given with -o were written by the export stage)
+        if args.format and not args.output:
             if args.format == "json":
                 import json
                 out = json.dumps(padlet.model_dump(), indent=2, ensure_ascii=False) + "\n"
@@ -155,8 +345,16 @@ Examples:
                     os.write(original_stdout_fd, out.encode("utf-8"))
                 else:
                     print(out, end="")
+            elif args.format == "jsonl":
+                buf = io.StringIO()
+                write_jsonl(padlet, buf)
+                out = buf.getvalue()
+                if clean_stdout and original_stdout_fd is not None:
+                    os.write(original_stdout_fd, out.encode("utf-8"))
+                else:
+                    print(out, end="")
 
-        else:
+        elif not args.output:
             # Default: print summary
             print(f"\n{padlet}")
             print(f"\nSections:")
@@ -177,21 +375,82 @@ Examples:
                 pass
 
 
-async def scrape_with_args(args):
+def scrape_with_args(args):
     """Scrape Padlet with CLI arguments."""
-    scraper = PadletScraper(
-        headless=not args.no_headless,  # Headless by default, unless --no-headless
-        timeout=args.timeout,
-        browser_executable_path=args.browser,
-        sandbox=not args.no_sandbox
-    )
+    client = PadletClient(**_scraper_options(args))
 
-    print(f"Scraping {args.url}...", file=sys.stderr)
-    padlet = await scraper.scrape(args.url)
+    with client:
+        print(f"Scraping {args.url}...", file=sys.stderr)
+        padlet = client.scrape(args.url)
     print(f"✓ Scraped {len(padlet.sections)} sections, {padlet.total_posts} posts", file=sys.stderr)
+    if padlet.partial:
+        print("Warning: Deadline reached; results are partial", file=sys.stderr)
+
+    # Export stage: all requested formats are written concurrently on
+    # background threads
+    if args.output:
+        with Exporter() as exporter:
+            for future in exporter.submit(padlet, args.output):
+                print(f"✓ Saved to {future.result()}")
 
     return padlet
 
 
+def worker_main(args: argparse.Namespace) -> None:
+    """Entry point for `padlet-scraper worker`: scrape jobs leased from a coordinator."""
+    async def run(worker_args) -> Worker:
+        options = _scraper_options(worker_args)
+        async with BrowserSession(headless=options.pop("headless"),
+                                  browser_executable_path=options.pop("browser_executable_path"),
+                                  sandbox=options.pop("sandbox")) as session:
+            worker = Worker(worker_args.coordinator, PadletScraper(session=session, **options),
+                            concurrency=worker_args.concurrency, name=worker_args.name)
+            print(f"Worker {worker.name} taking jobs from {worker.coordinator_url}", file=sys.stderr)
+            try:
+                await worker.run(exit_when_idle=worker_args.exit_when_idle)
+            finally:
+                print(f"Worker {worker.name}: {worker.completed} completed, {worker.failed} failed, "
+                      f"{worker.lost} lost", file=sys.stderr)
+        return worker
+
+    try:
+        asyncio.run(run(args))
+    except KeyboardInterrupt:
+        # Jobs in progress were released back to the coordinator
+        print("\nStopped by user", file=sys.stderr)
+        sys.exit(130)
+
+
+def coordinator_main(args: argparse.Namespace) -> None:
+    """Entry point for `padlet-scraper coordinator`: serve a job queue to workers."""
+    queue = JobQueue(lease_timeout=args.lease_timeout, max_attempts=args.max_attempts, output_dir=args.output_dir)
+    urls = list(args.urls)
+    if args.urls_file:
+        with open(args.urls_file, "r", encoding="utf-8") as f:
+            urls.extend(line.strip() for line in f if line.strip() and not line.startswith("#"))
+    if urls:
+        queue.enqueue(urls)
+
+    coordinator = Coordinator(args.host, args.port, queue)
+    print(f"Coordinator listening on {coordinator.url} with {len(urls)} job(s) queued", file=sys.stderr)
+
+    def report_stats():
+        while True:
+            time.sleep(args.stats_interval)
+            stats = queue.stats()
+            print(f"{stats.queued} queued, {stats.leased} leased, {stats.completed} completed, "
+                  f"{stats.failed} failed; {stats.throughput:.1f} boards/min", file=sys.stderr, flush=True)
+
+    if args.stats_interval > 0:
+        threading.Thread(target=report_stats, daemon=True).start()
+    try:
+        coordinator.serve_forever()
+    except KeyboardInterrupt:
+        print("\nStopped by user", file=sys.stderr)
+    finally:
+        coordinator.close()
+    print(queue.stats().model_dump_json(indent=2))
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,204 @@
+"""Thread-safe synchronous client backed by a persistent background event loop."""
+
+import asyncio
+import atexit
+import sys
+import threading
+import weakref
+from concurrent.futures import Future
+from typing import Optional
+from .attachments import AttachmentFetcher
+from .models import Padlet
+from .scraper import PadletScraper
+from .session import BrowserSession, RecyclePolicy
+
+# Clients still open at interpreter exit are closed so their browsers don't leak
+_open_clients: "weakref.WeakSet[PadletClient]" = weakref.WeakSet()
+
+
+@atexit.register
+def _close_open_clients() -> None:
+    for client in list(_open_clients):
+        client.close()
+
+
+class PadletClient:
+    """Blocking Padlet scraping API for synchronous code (WSGI apps, scripts, the CLI).
+
+    One background thread runs an event loop that owns a warm browser
+    (a BrowserSession). Any thread may call scrape() or submit(); calls are
+    scheduled onto that loop, so no event loop or browser is created per call.
+
+    Usage:
+        client = PadletClient()
+        padlet = client.scrape("https://padlet.com/user/board")
+
+        futures = [client.submit(url) for url in urls]
+        padlets = [f.result() for f in futures]
+    """
+
+    def __init__(self, headless: bool = True, timeout: int = 30, browser_executable_path: Optional[str] = None,
+                 sandbox: bool = True, deadline: Optional[float] = None, max_concurrency: int = 4,
+                 policy: Optional[RecyclePolicy] = None, fast_path: bool = False, tabs: int = 1,
+                 loading: str = "scroll", attachments: bool = False,
+                 attachment_fetcher: Optional[AttachmentFetcher] = None):
+        """
+        Initialize the client (the loop thread and browser start on first use).
+
+        Args:
+            headless: Whether to run browser in headless mode
+            timeout: Maximum time to wait for page elements (seconds)
+            browser_executable_path: Path to browser executable (None lets nodriver find one)
+            sandbox: Whether to use Chrome sandbox
+            deadline: Maximum time for each scrape (seconds), None for no limit
+            max_concurrency: Maximum number of scrapes running at once
+            policy: Tab and browser recycling limits for the shared browser
+            fast_path: Try plain HTTP before using the browser (see PadletScraper)
+            tabs: Tabs to split each board between (see PadletScraper)
+            loading: "scroll" or "tall" (see PadletScraper)
+            attachments: Collect post attachments (see PadletScraper)
+            attachment_fetcher: Download attachments into its cache (see PadletScraper)
+        """
+        self.session = BrowserSession(
+            headless=headless,
+            browser_executable_path=browser_executable_path,
+            sandbox=sandbox,
+            policy=policy,
+        )
+        self.scraper = PadletScraper(
+            headless=headless,
+            timeout=timeout,
+            browser_executable_path=browser_executable_path,
+            sandbox=sandbox,
+            deadline=deadline,
+            session=self.session,
+            fast_path=fast_path,
+            tabs=tabs,
+            loading=loading,
+            attachments=attachments,
+            attachment_fetcher=attachment_fetcher,
+        )
+        self.max_concurrency = max_concurrency
+
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._tasks: set = set()
+        self._closed = False
+        _open_clients.add(self)
+
+    def start(self) -> "PadletClient":
+        """Start the loop thread and launch the browser now instead of on the first scrape."""
+        loop = self._ensure_loop()
+        asyncio.run_coroutine_threadsafe(self.session.start(), loop).result()
+        return self
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("PadletClient is closed")
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                ready = threading.Event()
+                thread = threading.Thread(
+                    target=self._run_loop, args=(loop, ready), name="padlet-client", daemon=True
+                )
+                thread.start()
+                ready.wait()
+                self._loop, self._thread = loop, thread
+            return self._loop
+
+    def _run_loop(self, loop: asyncio.AbstractEventLoop, ready: threading.Event) -> None:
+        asyncio.set_event_loop(loop)
+        loop.call_soon(ready.set)
+        loop.run_forever()
+
+    async def _scrape(self, url: str) -> Padlet:
+        task = asyncio.current_task()
+        self._tasks.add(task)
+        try:
+            if self._semaphore is None:
+                self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            async with self._semaphore:
+                return await self.scraper.scrape(url)
+        finally:
+            self._tasks.discard(task)
+
+    def submit(self, url: str) -> Future:
+        """
+        Schedule a scrape on the background loop.
+
+        Args:
+            url: The URL of the Padlet to scrape
+
+        Returns:
+            A concurrent.futures.Future resolving to the Padlet
+        """
+        loop = self._ensure_loop()
+        if threading.current_thread() is self._thread:
+            raise RuntimeError("PadletClient cannot be called from its own event loop; await PadletScraper.scrape() instead")
+        return asyncio.run_coroutine_threadsafe(self._scrape(url), loop)
+
+    def scrape(self, url: str, timeout: Optional[float] = None) -> Padlet:
+        """
+        Scrape a Padlet, blocking the calling thread until it finishes.
+
+        Args:
+            url: The URL of the Padlet to scrape
+            timeout: Seconds to wait for the result (None waits indefinitely)
+
+        Returns:
+            Padlet object containing all sections and posts
+        """
+        future = self.submit(url)
+        try:
+            return future.result(timeout)
+        except BaseException:
+            future.cancel()
+            raise
+
+    async def _shutdown(self) -> None:
+        # Cancel in-flight scrapes first so their tabs are released...
+        scrapes = list(self._tasks)
+        for task in scrapes:
+            task.cancel()
+        await asyncio.gather(*scrapes, return_exceptions=True)
+
+        # ...then stop the browser
+        await self.session.close()
+        self.scraper.close()
+
+        # Cancel whatever nodriver left running
+        current = asyncio.current_task()
+        pending = [t for t in asyncio.all_tasks() if t is not current]
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    def close(self, timeout: float = 30) -> None:
+        """Cancel pending scrapes, stop the browser and the loop thread. Safe to call twice."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            loop, thread = self._loop, self._thread
+        _open_clients.discard(self)
+        if loop is None:
+            return
+
+        try:
+            asyncio.run_coroutine_threadsafe(self._shutdown(), loop).result(timeout)
+        except Exception as e:
+            print(f"Warning: PadletClient did not shut down cleanly: {e}", file=sys.stderr)
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(timeout)
+            if not thread.is_alive():
+                loop.close()
+
+    def __enter__(self) -> "PadletClient":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
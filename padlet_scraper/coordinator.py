@@ -0,0 +1,490 @@
+"""Job coordinator for spreading scrapes over workers on several hosts.
+
+The coordinator keeps a queue of Padlet URLs and hands them out to workers
+(`padlet-scraper worker`) as leases. A worker must renew its lease while it
+scrapes; a lease that runs out (the worker died or hung) puts the job back
+in the queue. Everything is exposed over a small JSON HTTP API:
+
+    POST /jobs                {"urls": [...]}                     -> {"ids": [...]}
+    POST /lease               {"worker": name, "max_jobs": n}     -> {"jobs": [{"id", "url", "lease", "expires_in"}], "pending": n}
+    POST /jobs/<id>/renew     {"lease": token}                    -> {"expires_in": seconds}
+    POST /jobs/<id>/complete  {"lease": token, "result": padlet, "duration": seconds}
+    POST /jobs/<id>/fail      {"lease": token, "error": message}
+    POST /jobs/<id>/release   {"lease": token}                    (give back unfinished, e.g. on shutdown)
+    GET  /jobs/<id>           job status (and result once done)
+    GET  /stats               queue sizes, throughput and per-worker counters
+
+"pending" counts the jobs not finished yet (queued or leased), so an idle
+worker can tell an empty queue from one whose leases may still expire.
+Renewing, completing, failing or releasing with a lease that has been lost answers 409.
+Completing, failing and releasing are idempotent per lease: repeating a request that
+already succeeded (e.g. a worker retrying after a dropped response) answers as before.
+"""
+
+import collections
+import json
+import sys
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Optional, Union
+from pydantic import BaseModel, Field
+from .utils import atomic_write
+
+DEFAULT_PORT = 8700
+
+# Window over which the recent throughput is measured
+_RATE_WINDOW = 60.0
+
+
+class LeaseLostError(RuntimeError):
+    """Raised when a lease has expired or was given to another worker."""
+
+    def __init__(self, job_id: str):
+        super().__init__(f"Lease on job {job_id} was lost")
+        self.job_id = job_id
+
+
+class WorkerStats(BaseModel):
+    """What the coordinator has seen from one worker."""
+
+    leased: int = Field(default=0, description="Jobs leased by the worker")
+    completed: int = Field(default=0, description="Jobs the worker finished")
+    failed: int = Field(default=0, description="Jobs the worker reported as failed")
+    expired: int = Field(default=0, description="Leases the worker let run out")
+    active: int = Field(default=0, description="Jobs currently leased to the worker")
+    last_seen: float = Field(default=0.0, description="Seconds since the worker last contacted the coordinator")
+    avg_duration: Optional[float] = Field(default=None, description="Mean reported scrape time in seconds")
+
+
+class CoordinatorStats(BaseModel):
+    """Snapshot of the coordinator's queue and aggregated throughput."""
+
+    queued: int = Field(description="Jobs waiting for a worker")
+    leased: int = Field(description="Jobs currently leased")
+    completed: int = Field(description="Jobs finished successfully")
+    failed: int = Field(description="Jobs that failed on every attempt")
+    requeued: int = Field(description="Jobs put back in the queue after a failure or an expired lease")
+    uptime: float = Field(description="Seconds since the coordinator started")
+    throughput: float = Field(description="Completed jobs per minute since the first lease")
+    recent_throughput: float = Field(description="Completed jobs per minute over the last minute")
+    workers: dict[str, WorkerStats] = Field(default_factory=dict, description="Per-worker counters")
+
+
+class _Job:
+    """Bookkeeping for one URL."""
+
+    def __init__(self, job_id: str, url: str):
+        self.id = job_id
+        self.url = url
+        self.status = "queued"  # queued | leased | completed | failed
+        self.attempts = 0
+        self.lease: Optional[str] = None
+        self.worker: Optional[str] = None
+        self.expires = 0.0
+        self.error: Optional[str] = None
+        self.result: Optional[dict] = None
+        self.result_path: Optional[str] = None
+        self.reports: dict[str, str] = {}  # lease -> how it ended: complete | fail | release
+
+    def to_dict(self) -> dict:
+        data = {"id": self.id, "url": self.url, "status": self.status, "attempts": self.attempts,
+                "worker": self.worker, "error": self.error}
+        if self.result is not None:
+            data["result"] = self.result
+        if self.result_path is not None:
+            data["result_path"] = self.result_path
+        return data
+
+
+class JobQueue:
+    """Thread-safe job queue with leases; the coordinator's HTTP API is a thin layer over it."""
+
+    def __init__(self, lease_timeout: float = 120.0, max_attempts: int = 3, output_dir: Optional[Union[str, Path]] = None):
+        """
+        Initialize the queue.
+
+        Args:
+            lease_timeout: Seconds a lease lasts without renewal
+            max_attempts: Leases a job gets (failures and expired leases) before it is marked failed
+            output_dir: Write each result to <output_dir>/<job id>.json instead of keeping it in memory
+        """
+        self.lease_timeout = lease_timeout
+        self.max_attempts = max_attempts
+        self.output_dir = Path(output_dir) if output_dir else None
+        if self.output_dir is not None:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._jobs: dict[str, _Job] = {}
+        self._queue: collections.deque[str] = collections.deque()
+        self._leased: set[str] = set()
+        self._workers: dict[str, dict] = {}
+        self._completions: collections.deque[float] = collections.deque()
+        self._completed = 0
+        self._failed = 0
+        self._requeued = 0
+        self._started = time.monotonic()
+        self._first_lease: Optional[float] = None
+
+    def _worker(self, name: str) -> dict:
+        worker = self._workers.get(name)
+        if worker is None:
+            worker = self._workers[name] = {
+                "leased": 0, "completed": 0, "failed": 0, "expired": 0, "seen": 0.0, "durations": 0.0,
+            }
+        worker["seen"] = time.monotonic()
+        return worker
+
+    def _timeout(self, lease_timeout) -> float:
+        """Validate a requested lease length (None means the queue's default)."""
+        if lease_timeout is None:
+            return self.lease_timeout
+        if isinstance(lease_timeout, bool) or not isinstance(lease_timeout, (int, float)):
+            raise ValueError(f"lease_timeout must be a number of seconds, not {lease_timeout!r}")
+        if not 0 < lease_timeout < float("inf"):
+            raise ValueError(f"lease_timeout must be positive, not {lease_timeout!r}")
+        return float(lease_timeout)
+
+    def _leased_job(self, job_id: str, lease: str) -> _Job:
+        job = self._jobs.get(job_id)
+        if job is None:
+            raise KeyError(job_id)
+        if job.status != "leased" or job.lease != lease:
+            raise LeaseLostError(job_id)
+        return job
+
+    def _retry_or_fail(self, job: _Job, error: str) -> None:
+        self._leased.discard(job.id)
+        job.lease = None
+        job.error = error
+        if job.attempts >= self.max_attempts:
+            job.status = "failed"
+            self._failed += 1
+        else:
+            job.status = "queued"
+            self._queue.append(job.id)
+            self._requeued += 1
+
+    def _requeue_expired(self) -> None:
+        now = time.monotonic()
+        for job in [self._jobs[job_id] for job_id in self._leased]:
+            if job.expires <= now:
+                self._workers[job.worker]["expired"] += 1
+                print(f"Lease on {job.url} held by {job.worker} expired", file=sys.stderr, flush=True)
+                self._retry_or_fail(job, f"lease expired on worker {job.worker}")
+
+    def enqueue(self, urls: list[str]) -> list[str]:
+        """Add URLs to the queue and return their job ids."""
+        for url in urls:
+            if not isinstance(url, str) or not url.strip():
+                raise ValueError(f"Invalid URL: {url!r}")
+        ids = []
+        with self._lock:
+            for url in urls:
+                job = _Job(uuid.uuid4().hex[:12], url.strip())
+                self._jobs[job.id] = job
+                self._queue.append(job.id)
+                ids.append(job.id)
+        return ids
+
+    def lease(self, worker: str, max_jobs: int = 1, lease_timeout: Optional[float] = None) -> list[dict]:
+        """
+        Lease up to max_jobs queued jobs to a worker.
+
+        Returns:
+            One {"id", "url", "lease", "expires_in"} dict per leased job (possibly none)
+
+        Raises:
+            ValueError: If lease_timeout isn't a positive number of seconds
+        """
+        # Checked before any job leaves the queue, so a bad request can't lose one
+        timeout = self._timeout(lease_timeout)
+        leased = []
+        with self._lock:
+            self._requeue_expired()
+            stats = self._worker(worker)
+            now = time.monotonic()
+            while self._queue and len(leased) < max_jobs:
+                job = self._jobs[self._queue.popleft()]
+                job.status = "leased"
+                job.attempts += 1
+                job.worker = worker
+                job.lease = uuid.uuid4().hex
+                job.expires = now + timeout
+                self._leased.add(job.id)
+                stats["leased"] += 1
+                leased.append({"id": job.id, "url": job.url, "lease": job.lease, "expires_in": timeout})
+            if leased and self._first_lease is None:
+                self._first_lease = now
+        return leased
+
+    @property
+    def pending(self) -> int:
+        """Number of jobs queued or leased (not completed or failed yet)."""
+        with self._lock:
+            return len(self._queue) + len(self._leased)
+
+    def renew(self, job_id: str, lease: str, lease_timeout: Optional[float] = None) -> float:
+        """Extend a lease; returns the seconds until it expires again."""
+        timeout = self._timeout(lease_timeout)
+        with self._lock:
+            job = self._leased_job(job_id, lease)
+            self._worker(job.worker)
+            job.expires = time.monotonic() + timeout
+        return timeout
+
+    def _reported(self, job_id: str, lease: str, action: str) -> bool:
+        """Whether this lease already reported this outcome (a retried request is answered as before)."""
+        job = self._jobs.get(job_id)
+        return job is not None and job.lease != lease and job.reports.get(lease) == action
+
+    def complete(self, job_id: str, lease: str, result: dict, duration: Optional[float] = None) -> None:
+        """Accept a job's result (a Padlet as a dict); repeating it with the same lease is a no-op."""
+        with self._lock:
+            if self._reported(job_id, lease, "complete"):
+                return
+            self._leased_job(job_id, lease)
+
+        # Written without the lock so a slow disk doesn't hold up every other request
+        path = None
+        if self.output_dir is not None:
+            path = self.output_dir / f"{job_id}.json"
+            with atomic_write(path) as f:
+                json.dump(result, f, indent=2, ensure_ascii=False)
+
+        with self._lock:
+            if self._reported(job_id, lease, "complete"):
+                return  # A retry of this request got here first
+            job = self._leased_job(job_id, lease)
+            if path is not None:
+                job.result_path = str(path)
+            else:
+                job.result = result
+
+            job.status = "completed"
+            self._leased.discard(job.id)
+            job.reports[lease] = "complete"
+            job.lease = None
+            job.error = None
+            worker = self._worker(job.worker)
+            worker["completed"] += 1
+            if duration is not None:
+                worker["durations"] += duration
+            self._completed += 1
+            self._completions.append(time.monotonic())
+
+    def fail(self, job_id: str, lease: str, error: str) -> None:
+        """Record a failed attempt; the job is retried until it has used max_attempts leases."""
+        with self._lock:
+            if self._reported(job_id, lease, "fail"):
+                return
+            job = self._leased_job(job_id, lease)
+            job.reports[lease] = "fail"
+            self._worker(job.worker)["failed"] += 1
+            self._retry_or_fail(job, error)
+
+    def release(self, job_id: str, lease: str) -> None:
+        """Put an unfinished job back at the front of the queue without counting the attempt."""
+        with self._lock:
+            if self._reported(job_id, lease, "release"):
+                return
+            job = self._leased_job(job_id, lease)
+            job.reports[lease] = "release"
+            self._worker(job.worker)
+            self._leased.discard(job.id)
+            job.status = "queued"
+            job.lease = None
+            job.attempts -= 1
+            self._queue.appendleft(job.id)
+
+    def job(self, job_id: str) -> dict:
+        """Return a job's status (and result once completed)."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                raise KeyError(job_id)
+            return job.to_dict()
+
+    def stats(self) -> CoordinatorStats:
+        """Return queue sizes, throughput and per-worker counters."""
+        with self._lock:
+            self._requeue_expired()
+            now = time.monotonic()
+            while self._completions and self._completions[0] < now - _RATE_WINDOW:
+                self._completions.popleft()
+
+            active = collections.Counter(self._jobs[job_id].worker for job_id in self._leased)
+            workers = {
+                name: WorkerStats(
+                    leased=w["leased"],
+                    completed=w["completed"],
+                    failed=w["failed"],
+                    expired=w["expired"],
+                    active=active[name],
+                    last_seen=round(now - w["seen"], 1),
+                    avg_duration=round(w["durations"] / w["completed"], 2) if w["completed"] else None,
+                )
+                for name, w in self._workers.items()
+            }
+            running = now - self._first_lease if self._first_lease is not None else 0.0
+            return CoordinatorStats(
+                queued=len(self._queue),
+                leased=sum(active.values()),
+                completed=self._completed,
+                failed=self._failed,
+                requeued=self._requeued,
+                uptime=round(now - self._started, 1),
+                throughput=round(self._completed * 60 / running, 2) if running else 0.0,
+                recent_throughput=round(len(self._completions) * 60 / min(_RATE_WINDOW, max(running, 1e-9)), 2),
+                workers=workers,
+            )
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive for workers polling through HttpPool
+    queue: JobQueue
+
+    def _send(self, status: int, payload: dict) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _payload(self) -> dict:
+        length = int(self.headers.get("Content-Length") or 0)
+        data = json.loads(self.rfile.read(length) or b"{}")
+        if not isinstance(data, dict):
+            raise ValueError("Request body must be a JSON object")
+        return data
+
+    def _dispatch(self, handler, *args) -> None:
+        try:
+            self._send(200, handler(*args))
+        except LeaseLostError as e:
+            self._send(409, {"error": str(e)})
+        except KeyError as e:
+            self._send(404, {"error": f"Unknown job {e.args[0]}"})
+        except (ValueError, TypeError) as e:
+            self._send(400, {"error": str(e)})
+        except Exception as e:
+            # e.g. OSError writing a result; answer rather than drop the connection
+            print(f"Error handling {self.command} {self.path}: {type(e).__name__}: {e}", file=sys.stderr, flush=True)
+            self._send(500, {"error": f"{type(e).__name__}: {e}"})
+
+    def do_GET(self):
+        parts = self.path.strip("/").split("/")
+        if parts == ["stats"]:
+            self._dispatch(lambda: self.queue.stats().model_dump())
+        elif len(parts) == 2 and parts[0] == "jobs":
+            self._dispatch(self.queue.job, parts[1])
+        else:
+            self._send(404, {"error": f"No such endpoint: {self.path}"})
+
+    def do_POST(self):
+        parts = self.path.strip("/").split("/")
+        try:
+            data = self._payload()
+        except ValueError as e:
+            self._send(400, {"error": f"Invalid JSON: {e}"})
+            return
+
+        if parts == ["jobs"]:
+            self._dispatch(self._enqueue, data)
+        elif parts == ["lease"]:
+            self._dispatch(self._lease, data)
+        elif len(parts) == 3 and parts[0] == "jobs" and parts[2] in ("renew", "complete", "fail", "release"):
+            self._dispatch(getattr(self, f"_{parts[2]}"), parts[1], data)
+        else:
+            self._send(404, {"error": f"No such endpoint: {self.path}"})
+
+    @staticmethod
+    def _field(data: dict, name: str):
+        if name not in data:
+            raise ValueError(f"Missing field '{name}'")
+        return data[name]
+
+    def _enqueue(self, data: dict) -> dict:
+        return {"ids": self.queue.enqueue(list(self._field(data, "urls")))}
+
+    def _lease(self, data: dict) -> dict:
+        worker = str(self._field(data, "worker"))
+        jobs = self.queue.lease(worker, int(data.get("max_jobs", 1)), data.get("lease_timeout"))
+        return {"jobs": jobs, "pending": self.queue.pending}
+
+    def _renew(self, job_id: str, data: dict) -> dict:
+        return {"expires_in": self.queue.renew(job_id, self._field(data, "lease"), data.get("lease_timeout"))}
+
+    def _complete(self, job_id: str, data: dict) -> dict:
+        self.queue.complete(job_id, self._field(data, "lease"), self._field(data, "result"), data.get("duration"))
+        return {"ok": True}
+
+    def _fail(self, job_id: str, data: dict) -> dict:
+        self.queue.fail(job_id, self._field(data, "lease"), str(data.get("error")))
+        return {"ok": True}
+
+    def _release(self, job_id: str, data: dict) -> dict:
+        self.queue.release(job_id, self._field(data, "lease"))
+        return {"ok": True}
+
+    def log_message(self, format, *args):
+        pass
+
+
+class Coordinator:
+    """HTTP front end for a JobQueue.
+
+    Usage:
+        coordinator = Coordinator(port=8700).start()   # serves on a background thread
+        coordinator.queue.enqueue(urls)
+        ...
+        coordinator.close()
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = DEFAULT_PORT, queue: Optional[JobQueue] = None):
+        """
+        Bind the server (port 0 picks a free port).
+
+        Args:
+            host: Interface to listen on (use 0.0.0.0 to accept workers from other hosts)
+            port: TCP port
+            queue: Job queue to serve (a default JobQueue if None)
+        """
+        self.queue = queue or JobQueue()
+        handler = type("Handler", (_Handler,), {"queue": self.queue})
+        self._server = ThreadingHTTPServer((host, port), handler)
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Base URL workers should use."""
+        host, port = self._server.server_address[:2]
+        return f"http://{'127.0.0.1' if host == '0.0.0.0' else host}:{port}"
+
+    def start(self) -> "Coordinator":
+        """Serve requests on a background thread."""
+        self._thread = threading.Thread(target=self._server.serve_forever, name="padlet-coordinator", daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        """Serve requests on the calling thread until close() or KeyboardInterrupt."""
+        self._server.serve_forever()
+
+    def close(self) -> None:
+        """Stop serving and release the port."""
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+        self._server.server_close()
+
+    def __enter__(self) -> "Coordinator":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
@@ -0,0 +1,81 @@
+"""Per-scrape deadline budgets split across scrape phases."""
+
+import asyncio
+import sys
+from typing import Awaitable, Optional, TypeVar
+
+T = TypeVar("T")
+
+# Scrape phases in the order they run
+PHASES = ("navigate", "load", "scroll", "extract", "teardown")
+
+# Relative share of the deadline each phase gets by default
+DEFAULT_PHASE_WEIGHTS: dict[str, float] = {
+    "navigate": 0.20,
+    "load": 0.15,
+    "scroll": 0.35,
+    "extract": 0.25,
+    "teardown": 0.05,
+}
+
+
+class Deadline:
+    """Splits one scrape's time budget across its phases.
+
+    Each phase gets its weight's share of the time that is *left*, measured
+    against the phases still to run. Time a phase doesn't use therefore rolls
+    over to the later phases, and a phase that overruns (only possible for
+    unbounded work) eats into them.
+
+    A Deadline with ``total=None`` is unbounded: every budget is None and
+    run() simply awaits.
+    """
+
+    def __init__(self, total: Optional[float], weights: Optional[dict[str, float]] = None):
+        """
+        Start the clock.
+
+        Args:
+            total: Seconds allowed for the whole scrape, or None for no limit
+            weights: Relative phase shares (defaults to DEFAULT_PHASE_WEIGHTS)
+        """
+        self.total = total
+        self.weights = {**DEFAULT_PHASE_WEIGHTS, **(weights or {})}
+        self.expired: list[str] = []
+        self._loop = asyncio.get_running_loop()
+        self._started = self._loop.time()
+
+    def elapsed(self) -> float:
+        """Seconds since the deadline started."""
+        return self._loop.time() - self._started
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left in the whole budget (never negative), or None if unbounded."""
+        if self.total is None:
+            return None
+        return max(0.0, self.total - self.elapsed())
+
+    def budget_for(self, phase: str) -> Optional[float]:
+        """Seconds the given phase may use right now, or None if unbounded."""
+        remaining = self.remaining()
+        if remaining is None:
+            return None
+        later = PHASES[PHASES.index(phase):]
+        share = sum(self.weights[p] for p in later)
+        if share <= 0:
+            return remaining
+        return remaining * self.weights[phase] / share
+
+    async def run(self, phase: str, awaitable: Awaitable[T]) -> T:
+        """
+        Await within the phase's budget, cancelling it when the budget runs out.
+
+        Raises:
+            asyncio.TimeoutError: If the phase ran out of time
+        """
+        try:
+            return await asyncio.wait_for(awaitable, self.budget_for(phase))
+        except asyncio.TimeoutError:
+            self.expired.append(phase)
+            print(f"Warning: '{phase}' phase ran out of time after {self.elapsed():.1f}s", file=sys.stderr)
+            raise
@@ -0,0 +1,13 @@
+"""Exceptions shared by the browser and HTTP scraping paths."""
+
+# HTTP statuses Padlet uses to signal that we are sending too many requests
+THROTTLE_STATUSES = {429, 503}
+
+
+class ThrottledError(RuntimeError):
+    """Raised when the Padlet host answers the page load with a throttling status."""
+
+    def __init__(self, url: str, status: int):
+        super().__init__(f"Throttled by server (HTTP {status}) while loading {url}")
+        self.url = url
+        self.status = status
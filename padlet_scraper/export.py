@@ -0,0 +1,98 @@
+"""Multi-format export of scraped Padlets using background writer threads."""
+
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Iterable, Union
+from .models import Padlet
+from .utils import atomic_write, write_json, write_jsonl, write_markdown
+
+# Output file suffix -> streaming writer
+WRITERS: dict[str, Callable] = {
+    ".json": write_json,
+    ".md": write_markdown,
+    ".jsonl": write_jsonl,
+}
+
+
+def writer_for(output_path: Union[str, Path]) -> Callable:
+    """
+    Look up the writer for an output path based on its extension.
+
+    Raises:
+        ValueError: If the extension is not a supported export format
+    """
+    suffix = Path(output_path).suffix.lower()
+    try:
+        return WRITERS[suffix]
+    except KeyError:
+        supported = ", ".join(sorted(WRITERS))
+        raise ValueError(f"Unsupported file extension '{suffix}'. Use one of: {supported}") from None
+
+
+def export_file(padlet: Padlet, output_path: Union[str, Path]) -> Path:
+    """
+    Write a Padlet to output_path, choosing the format from the extension.
+
+    The file is written to a temporary name and atomically renamed into place.
+
+    Returns:
+        The path that was written
+    """
+    output_path = Path(output_path)
+    writer = writer_for(output_path)
+    with atomic_write(output_path) as f:
+        writer(padlet, f)
+    return output_path
+
+
+class Exporter:
+    """Writes Padlets to one or more formats on a pool of background threads.
+
+    File I/O and serialization run off the event loop, so scrapes that are
+    still in progress are never stalled by a large export.
+    """
+
+    def __init__(self, max_workers: int = 4):
+        """
+        Initialize the exporter.
+
+        Args:
+            max_workers: Maximum number of files written concurrently
+        """
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="padlet-export")
+
+    def submit(self, padlet: Padlet, output_paths: Iterable[Union[str, Path]]) -> list[Future]:
+        """
+        Schedule a Padlet to be written to every path in output_paths.
+
+        All paths are validated before anything is scheduled.
+
+        Returns:
+            One concurrent.futures.Future per path, resolving to the written Path
+        """
+        output_paths = [Path(p) for p in output_paths]
+        for output_path in output_paths:
+            writer_for(output_path)
+        return [self._executor.submit(export_file, padlet, p) for p in output_paths]
+
+    async def export(self, padlet: Padlet, output_paths: Iterable[Union[str, Path]]) -> list[Path]:
+        """
+        Write a Padlet to every path in output_paths without blocking the event loop.
+
+        Returns:
+            The paths that were written
+        """
+        futures = self.submit(padlet, output_paths)
+        return list(await asyncio.gather(*(asyncio.wrap_future(f) for f in futures)))
+
+    def close(self, wait: bool = True) -> None:
+        """Stop accepting work and (optionally) wait for pending writes to finish."""
+        self._executor.shutdown(wait=wait)
+
+    def __enter__(self) -> "Exporter":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
@@ -0,0 +1,475 @@
+"""Browserless scraping of Padlet boards from their server-rendered HTML.
+
+Many public boards ship their sections and posts in the initial page, either
+as the bootstrap state script (`window.__STARTING_STATE__ = {...}`) or as
+server-rendered markup.
+When that data is complete we can build the Padlet with one HTTP request
+instead of launching Chrome. The result says whether it is complete so the
+caller can fall back to the browser when it is not.
+"""
+
+import asyncio
+import json
+import re
+from html.parser import HTMLParser
+from typing import Any, Iterator, Optional
+from urllib.parse import urljoin
+from pydantic import BaseModel, Field
+from .attachments import attachment_kind
+from .errors import THROTTLE_STATUSES, ThrottledError
+from .httpclient import HttpPool
+from .models import Attachment, Padlet, Post, Section
+
+# Globals (or ids of JSON <script>s) that hold the board's bootstrap state;
+# other scripts' JSON (analytics, embeds, ...) is never taken for board data
+HYDRATION_ROOTS = ("__STARTING_STATE__",)
+# Keys under which bootstrap JSON stores sections and posts
+SECTION_LIST_KEYS = ("sections", "wall_sections", "wallSections")
+POST_LIST_KEYS = ("posts", "wishes")
+# Keys a post uses to refer to its section
+POST_SECTION_KEYS = ("section_id", "wall_section_id", "wallSectionId", "sectionId")
+# Keys holding the expected number of posts, used to check completeness
+POST_COUNT_KEYS = ("posts_count", "wishes_count", "postsCount", "wishesCount")
+# Keys under which bootstrap JSON stores the board itself (for its title)
+BOARD_KEYS = ("wall", "padlet", "board")
+# Keys used to order sections/posts
+SORT_KEYS = ("sort_index", "sortIndex", "rank", "position")
+# Keys under which a post stores its attachment (a URL, or a dict with one)
+ATTACHMENT_KEYS = ("attachment", "attachment_url", "attachmentUrl")
+
+_VOID_TAGS = {
+    "area", "base", "br", "col", "embed", "hr", "img", "input",
+    "link", "meta", "param", "source", "track", "wbr",
+}
+
+# `window.__STARTING_STATE__ = {...};` style bootstrap assignments
+_ASSIGNMENT_RE = re.compile(r"^\s*(?:window\.)?([\w$]+)\s*=\s*(\{.*\})\s*;?\s*$", re.DOTALL)
+# Scripts are located with a regex so pages with bootstrap JSON never pay for a full HTML parse
+_SCRIPT_RE = re.compile(r"<script\b([^>]*)>(.*?)</script\s*>", re.DOTALL | re.IGNORECASE)
+_TYPE_ATTR_RE = re.compile(r"""\btype\s*=\s*["']?([^"'\s>]+)""", re.IGNORECASE)
+_ID_ATTR_RE = re.compile(r"""\bid\s*=\s*["']?([^"'\s>]+)""", re.IGNORECASE)
+
+
+class FastPathResult(BaseModel):
+    """Outcome of a browserless scrape attempt."""
+
+    padlet: Padlet = Field(description="Board data found in the page")
+    complete: bool = Field(description="True if the data is known to contain every section and post")
+    source: str = Field(description="Where the data came from: 'hydration' or 'dom'")
+
+
+class _Node:
+    """Minimal DOM element built by _TreeBuilder."""
+
+    __slots__ = ("tag", "attrs", "children", "parent")
+
+    def __init__(self, tag: str, attrs: dict[str, str], parent: Optional["_Node"]):
+        self.tag = tag
+        self.attrs = attrs
+        self.children: list = []  # _Node or str
+        self.parent = parent
+
+    def iter(self) -> Iterator["_Node"]:
+        """Yield this element and all descendant elements in document order."""
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed([c for c in node.children if isinstance(c, _Node)]))
+
+    def find_all(self, predicate) -> list["_Node"]:
+        return [n for n in self.iter() if n is not self and predicate(n)]
+
+    def find(self, predicate) -> Optional["_Node"]:
+        for n in self.iter():
+            if n is not self and predicate(n):
+                return n
+        return None
+
+    def text(self) -> str:
+        """Approximate innerText: text content with <br> and block ends as newlines."""
+        parts = []
+        self._collect_text(parts, base_url=None)
+        return "".join(parts)
+
+    def _collect_text(self, parts: list, base_url: Optional[str]) -> None:
+        for child in self.children:
+            if isinstance(child, str):
+                parts.append(child)
+            elif child.tag == "br":
+                parts.append("\n")
+            elif child.tag in ("script", "style"):
+                continue
+            elif base_url is not None and child.tag == "a" and child.attrs.get("href"):
+                # Links become inline Markdown, like the browser path
+                url = urljoin(base_url, child.attrs["href"])
+                label = child.text() or url
+                parts.append(f"[{label}]({url})")
+            else:
+                child._collect_text(parts, base_url)
+                if child.tag in ("p", "div", "li", "h1", "h2", "h3", "h4", "h5", "h6"):
+                    parts.append("\n")
+
+    def text_with_links(self, base_url: str) -> str:
+        """Like text(), but with <a href> rendered as Markdown links."""
+        parts = []
+        self._collect_text(parts, base_url)
+        return "".join(parts)
+
+
+class _TreeBuilder(HTMLParser):
+    """Builds a _Node tree, skipping <script> contents."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.root = _Node("#document", {}, None)
+        self._current = self.root
+        self._in_script = False
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "script":
+            self._in_script = True
+            return
+        node = _Node(tag, {k: (v or "") for k, v in attrs}, self._current)
+        self._current.children.append(node)
+        if tag not in _VOID_TAGS:
+            self._current = node
+
+    def handle_startendtag(self, tag, attrs):
+        if tag != "script":
+            self._current.children.append(_Node(tag, {k: (v or "") for k, v in attrs}, self._current))
+
+    def handle_endtag(self, tag):
+        if tag == "script":
+            self._in_script = False
+            return
+        # Close the nearest open element with this tag; ignore stray end tags
+        node = self._current
+        while node is not None and node.tag != tag:
+            node = node.parent
+        if node is not None and node.parent is not None:
+            self._current = node.parent
+
+    def handle_data(self, data):
+        if not self._in_script:
+            self._current.children.append(data)
+
+
+def _normalize(text: Optional[str]) -> Optional[str]:
+    """Same normalization as the browser path's JS `normalize`."""
+    if not text:
+        return None
+    return text.replace("\r\n", "\n").replace("\u00a0", " ").strip() or None
+
+
+def html_to_text(html: str, base_url: str) -> str:
+    """
+    Convert a post body's HTML into text with inline Markdown links.
+
+    Paragraphs are separated by one newline, or by a blank line when an
+    empty spacer paragraph (<p><br></p>) sits between them, matching the
+    browser extraction.
+    """
+    return _body_text(_parse_tree(html), base_url) or ""
+
+
+def _body_text(body: _Node, base_url: str) -> Optional[str]:
+    paragraphs = body.find_all(lambda n: n.tag == "p")
+    if not paragraphs:
+        return _normalize(body.text_with_links(base_url))
+
+    parts = []
+    prev_was_spacer = False
+    for p in paragraphs:
+        text = _normalize(p.text_with_links(base_url))
+        if not text:
+            prev_was_spacer = True
+            continue
+        if parts:
+            parts.append("\n\n" if prev_was_spacer else "\n")
+        parts.append(text)
+        prev_was_spacer = False
+    return _normalize("".join(parts))
+
+
+def _data_attachments(post: dict, base_url: str) -> list[Attachment]:
+    attachments = []
+    for key in ATTACHMENT_KEYS:
+        value = post.get(key)
+        if isinstance(value, dict):
+            value = value.get("url") or value.get("src")
+        if isinstance(value, str) and value.strip():
+            url = urljoin(base_url, value.strip())
+            if url.startswith(("http://", "https://")) and all(a.url != url for a in attachments):
+                attachments.append(Attachment(url=url, kind=attachment_kind(url)))
+    return attachments
+
+
+def _node_attachments(post: _Node, body: Optional[_Node], base_url: str) -> list[Attachment]:
+    """Images, media and links outside the body, like the browser extraction."""
+    in_body = set(map(id, body.iter())) if body is not None else set()
+    seen = set()
+    attachments = []
+    for node in post.iter():
+        if node.tag == "img":
+            hint, src = "image", node.attrs.get("src")
+        elif node.tag in ("video", "audio"):
+            hint, src = node.tag, node.attrs.get("src")
+        elif node.tag == "source" and node.parent is not None and node.parent.tag in ("video", "audio"):
+            hint, src = node.parent.tag, node.attrs.get("src")
+        elif node.tag == "a" and id(node) not in in_body:
+            hint, src = "file" if "download" in node.attrs else "link", node.attrs.get("href")
+        else:
+            continue
+        if not src:
+            continue
+        url = urljoin(base_url, src)
+        if url.startswith(("http://", "https://")) and url not in seen:
+            seen.add(url)
+            attachments.append(Attachment(url=url, kind=attachment_kind(url, hint)))
+    return attachments
+
+
+def _hydration_root(attrs: str, text: str) -> Optional[dict]:
+    """Return the bootstrap state of a <script>, or None if it isn't one of HYDRATION_ROOTS."""
+    text = text.strip()
+    if not text:
+        return None
+    type_match = _TYPE_ATTR_RE.search(attrs)
+    if type_match and type_match.group(1).lower().endswith("json"):
+        id_match = _ID_ATTR_RE.search(attrs)
+        if not id_match or id_match.group(1) not in HYDRATION_ROOTS:
+            return None
+        candidate = text
+    else:
+        match = _ASSIGNMENT_RE.match(text)
+        if not match or match.group(1) not in HYDRATION_ROOTS:
+            return None
+        candidate = match.group(2)
+    try:
+        data = json.loads(candidate)
+    except ValueError:
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def _root_value(root: dict, board: Optional[dict], keys: tuple) -> Any:
+    """Value of the first of keys found at the top of the state or in its board object."""
+    for owner in (root, board or {}):
+        for key in keys:
+            if key in owner:
+                return owner[key]
+    return None
+
+
+def _is_id(value: Any) -> bool:
+    return isinstance(value, (str, int)) and not isinstance(value, bool)
+
+
+def _valid_sections(sections: Any) -> bool:
+    return isinstance(sections, list) and all(
+        isinstance(s, dict) and _is_id(s.get("id")) and isinstance(s.get("title"), (str, type(None)))
+        for s in sections
+    )
+
+
+def _valid_posts(posts: Any) -> bool:
+    if not isinstance(posts, list):
+        return False
+    for p in posts:
+        if not isinstance(p, dict) or not _is_id(p.get("id")):
+            return False
+        if any(not isinstance(p.get(k), (str, type(None))) for k in ("subject", "headline", "title", "body", "content")):
+            return False
+        if any(p.get(k) is not None and not _is_id(p[k]) for k in POST_SECTION_KEYS):
+            return False
+    return True
+
+
+def _board(root: dict) -> Optional[dict]:
+    return next((root[k] for k in BOARD_KEYS if isinstance(root.get(k), dict)), None)
+
+
+def _post_count(root: dict) -> Optional[int]:
+    """The number of posts the state says the board has, if it says so."""
+    expected = _root_value(root, _board(root), POST_COUNT_KEYS)
+    return expected if isinstance(expected, int) and not isinstance(expected, bool) else None
+
+
+def _sorted(items: list[dict]) -> list[dict]:
+    for key in SORT_KEYS:
+        if all(isinstance(i.get(key), (int, float)) for i in items):
+            return sorted(items, key=lambda i: i[key])
+    return items
+
+
+def _board_title(root: dict, board: Optional[dict]) -> Optional[str]:
+    """Board title from the board object, or the top of the state."""
+    for candidate in (board, root):
+        if isinstance(candidate, dict) and isinstance(candidate.get("title"), str):
+            return _normalize(candidate["title"])
+    return None
+
+
+def _from_hydration(root: dict, url: str, attachments: bool = False) -> Optional[FastPathResult]:
+    """
+    Build a Padlet from bootstrap state.
+
+    Returns None when the state doesn't have the expected shape. The result
+    is only complete if the state's post count matches the posts it holds.
+    """
+    board = _board(root)
+    posts_data = _root_value(root, board, POST_LIST_KEYS)
+    sections_data = _root_value(root, board, SECTION_LIST_KEYS)
+    if sections_data is None:
+        sections_data = []
+    if not _valid_posts(posts_data) or not _valid_sections(sections_data):
+        return None
+    sections_data = _sorted(sections_data)
+
+    sections: dict[Optional[str], Section] = {}
+    titled = set()
+    for s in sections_data:
+        section_id = str(s["id"]) if s.get("id") is not None else None
+        title = _normalize(s.get("title"))
+        if title and title.lower() == "suggested content":
+            continue
+        if title:
+            titled.add(section_id)
+        sections[section_id] = Section(title=title or "Untitled Section", section_id=section_id)
+
+    for p in _sorted(posts_data):
+        section_id = next((str(p[k]) for k in POST_SECTION_KEYS if p.get(k) is not None), None)
+        section = sections.get(section_id)
+        if section is None:
+            if sections_data:
+                continue  # Post belongs to a skipped section
+            section = sections[section_id] = Section(title="Untitled Section", section_id=section_id)
+        subject = _normalize(p.get("subject") or p.get("headline") or p.get("title"))
+        body = p.get("body") if p.get("body") is not None else p.get("content")
+        body = html_to_text(body, url) if isinstance(body, str) and "<" in body else _normalize(body)
+        post_attachments = _data_attachments(p, url) if attachments else []
+        if not subject and not body and not post_attachments:
+            continue
+        section.posts.append(Post(subject=subject or "Untitled", body=body or "", section_id=section_id,
+                                  attachments=post_attachments))
+
+    # Only trust the state to be complete if it says how many posts exist and holds them all
+    expected = _post_count(root)
+    complete = expected is not None and expected == len(posts_data)
+
+    title = _board_title(root, board)
+    padlet = Padlet(
+        url=url,
+        title=title,
+        # Like the browser path, keep only sections with a title or posts
+        sections=[s for s in sections.values() if s.posts or s.section_id in titled],
+    )
+    return FastPathResult(padlet=padlet, complete=complete, source="hydration")
+
+
+def _from_dom(root: _Node, url: str, html_title: Optional[str], attachments: bool = False,
+              expected: Optional[int] = None) -> Optional[FastPathResult]:
+    """
+    Build a Padlet from server-rendered markup.
+
+    Markup may hold only the rows rendered before the page was scrolled, so
+    the result is only complete if expected (a post count from the page's
+    state) matches the posts the markup holds.
+    """
+    section_nodes = root.find_all(lambda n: n.tag == "section" and "data-id" in n.attrs and "data-rank" in n.attrs)
+    if not section_nodes:
+        return None
+
+    sections = []
+    found = 0
+    for node in section_nodes:
+        section_id = node.attrs["data-id"]
+        post_nodes = node.find_all(lambda n: n.attrs.get("data-testid") == "surfacePost")
+        found += len(post_nodes)
+        title_node = node.find(lambda n: n.attrs.get("data-testid") == "sectionTitleText")
+        title = _normalize(title_node.text()) if title_node else None
+        if title and title.lower() == "suggested content":
+            continue
+        posts = []
+        for post_node in post_nodes:
+            subject_node = post_node.find(lambda n: n.attrs.get("data-pw") == "postSubject")
+            body_node = post_node.find(lambda n: n.attrs.get("data-pw") == "postBody")
+            subject = _normalize(subject_node.text()) if subject_node else None
+            body = _body_text(body_node, url) if body_node else None
+            post_attachments = _node_attachments(post_node, body_node, url) if attachments else []
+            if subject or body or post_attachments:
+                posts.append(Post(subject=subject or "Untitled", body=body or "", section_id=section_id,
+                                  attachments=post_attachments))
+        if title or posts:
+            sections.append(Section(title=title or "Untitled Section", section_id=section_id, posts=posts))
+
+    # Scrollable post containers are filled lazily, so server-rendered
+    # markup that has them can't be trusted to hold every post.
+    lazy = root.find(lambda n: n.attrs.get("id", "").startswith("group-posts-")
+                     and "overflow-y-auto" in n.attrs.get("class", ""))
+    complete = expected is not None and expected == found and lazy is None
+    padlet = Padlet(url=url, title=html_title, sections=sections)
+    return FastPathResult(padlet=padlet, complete=complete, source="dom")
+
+
+def _parse_tree(html: str) -> _Node:
+    builder = _TreeBuilder()
+    builder.feed(html)
+    builder.close()
+    return builder.root
+
+
+def _h1_text(root: _Node) -> Optional[str]:
+    h1 = root.find(lambda n: n.tag == "h1")
+    return _normalize(h1.text()) if h1 else None
+
+
+def parse_board_html(html: str, url: str, attachments: bool = False) -> Optional[FastPathResult]:
+    """
+    Extract a Padlet from a board page's HTML without running its JavaScript.
+
+    The bootstrap state (see HYDRATION_ROOTS) is preferred; server-rendered
+    markup is the fallback, and counts as complete only when the state says
+    how many posts the board has and the markup holds that many.
+
+    Args:
+        html: The page HTML
+        url: The board URL (used for the Padlet and to resolve relative links)
+        attachments: Also collect each post's attachments into Post.attachments
+
+    Returns:
+        FastPathResult, or None if the page holds no recognizable board data
+    """
+    expected = None
+    for match in _SCRIPT_RE.finditer(html):
+        root = _hydration_root(match.group(1), match.group(2))
+        if root is not None:
+            result = _from_hydration(root, url, attachments)
+            if result is not None:
+                if result.padlet.title is None:
+                    result.padlet.title = _h1_text(_parse_tree(html))
+                return result
+            # A state without usable posts may still say how many the markup should hold
+            if expected is None:
+                expected = _post_count(root)
+
+    root = _parse_tree(html)
+    return _from_dom(root, url, _h1_text(root), attachments, expected)
+
+
+async def fetch_board(url: str, pool: HttpPool, attachments: bool = False) -> Optional[FastPathResult]:
+    """
+    Fetch a board page over HTTP and parse it with parse_board_html().
+
+    Raises:
+        ThrottledError: If the host answered with a throttling status
+        HttpError: For any other non-2xx status
+    """
+    response = await pool.aget(url, headers={"Accept": "text/html,application/xhtml+xml"})
+    if response.status in THROTTLE_STATUSES:
+        raise ThrottledError(url, response.status)
+    response.raise_for_status()
+    # Parsing a big board takes tens of milliseconds; keep it off the event loop
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, parse_board_html, response.text(), url, attachments)
@@ -0,0 +1,266 @@
+"""Small pooled keep-alive HTTP client built on http.client."""
+
+import asyncio
+import contextlib
+import gzip
+import http.client
+import threading
+import zlib
+from typing import IO, Iterator, Optional
+from urllib.parse import urljoin, urlsplit
+
+DEFAULT_USER_AGENT = (
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0 Safari/537.36"
+)
+
+# Errors that mean a pooled keep-alive connection was closed by the server
+_STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError)
+
+
+class HttpError(Exception):
+    """Raised for responses with an unexpected status code."""
+
+    def __init__(self, url: str, status: int):
+        super().__init__(f"HTTP {status} for {url}")
+        self.url = url
+        self.status = status
+
+
+class HttpResponse:
+    """A fully read HTTP response."""
+
+    def __init__(self, url: str, status: int, headers: dict[str, str], body: bytes):
+        self.url = url
+        self.status = status
+        self.headers = headers
+        self.body = body
+
+    def text(self) -> str:
+        """Decode the body using the charset from Content-Type (UTF-8 by default)."""
+        charset = "utf-8"
+        for param in self.headers.get("content-type", "").split(";")[1:]:
+            key, _, value = param.strip().partition("=")
+            if key.lower() == "charset" and value:
+                charset = value.strip('"')
+        return self.body.decode(charset, errors="replace")
+
+    def raise_for_status(self) -> None:
+        """Raise HttpError unless the status is 2xx."""
+        if not 200 <= self.status < 300:
+            raise HttpError(self.url, self.status)
+
+
+def _decode_body(body: bytes, encoding: str) -> bytes:
+    if encoding == "gzip":
+        return gzip.decompress(body)
+    if encoding == "deflate":
+        return zlib.decompress(body)
+    return body
+
+
+class HttpPool:
+    """Thread-safe pool of keep-alive HTTP(S) connections with a per-host limit.
+
+    get() can be called from any thread; aget() runs it on the event loop's
+    default executor.
+    """
+
+    def __init__(self, max_per_host: int = 4, timeout: float = 15.0, user_agent: str = DEFAULT_USER_AGENT,
+                 max_redirects: int = 5):
+        """
+        Initialize the pool.
+
+        Args:
+            max_per_host: Maximum concurrent connections to one host
+            timeout: Socket timeout in seconds
+            user_agent: User-Agent header sent with every request
+            max_redirects: Redirects followed before giving up
+        """
+        self.max_per_host = max_per_host
+        self.timeout = timeout
+        self.user_agent = user_agent
+        self.max_redirects = max_redirects
+        self._lock = threading.Lock()
+        self._idle: dict[tuple, list[http.client.HTTPConnection]] = {}
+        self._slots: dict[tuple, threading.BoundedSemaphore] = {}
+
+    @staticmethod
+    def _key(url: str) -> tuple:
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https"):
+            raise ValueError(f"Unsupported URL scheme: {url}")
+        port = parts.port or (443 if parts.scheme == "https" else 80)
+        return parts.scheme, parts.hostname, port
+
+    def _slot(self, key: tuple) -> threading.BoundedSemaphore:
+        with self._lock:
+            slot = self._slots.get(key)
+            if slot is None:
+                slot = self._slots[key] = threading.BoundedSemaphore(self.max_per_host)
+            return slot
+
+    def _connect(self, key: tuple) -> http.client.HTTPConnection:
+        scheme, host, port = key
+        cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        return cls(host, port, timeout=self.timeout)
+
+    def _checkout(self, key: tuple) -> tuple[http.client.HTTPConnection, bool]:
+        """Return (connection, reused)."""
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                return idle.pop(), True
+        return self._connect(key), False
+
+    def _checkin(self, key: tuple, conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            self._idle.setdefault(key, []).append(conn)
+
+    @contextlib.contextmanager
+    def _open(self, url: str, headers: Optional[dict[str, str]], method: str = "GET",
+              body: Optional[bytes] = None) -> Iterator[http.client.HTTPResponse]:
+        """Send a request and yield the unread response; the connection returns to the pool afterwards."""
+        key = self._key(url)
+        parts = urlsplit(url)
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+        request_headers = {
+            "User-Agent": self.user_agent,
+            "Accept-Encoding": "gzip, deflate",
+            "Connection": "keep-alive",
+            **(headers or {}),
+        }
+
+        with self._slot(key):
+            conn, reused = self._checkout(key)
+            try:
+                try:
+                    conn.request(method, path, body=body, headers=request_headers)
+                    response = conn.getresponse()
+                except _STALE_CONNECTION_ERRORS:
+                    if not reused:
+                        raise
+                    # The server closed an idle keep-alive connection; retry once on a fresh one
+                    conn.close()
+                    conn = self._connect(key)
+                    conn.request(method, path, body=body, headers=request_headers)
+                    response = conn.getresponse()
+                yield response
+            except BaseException:
+                conn.close()
+                raise
+            if response.isclosed() and not response.will_close:
+                self._checkin(key, conn)
+            else:
+                conn.close()
+
+    def _follow(self, url: str, status: int, location: Optional[str], redirects: int) -> Optional[str]:
+        if status in (301, 302, 303, 307, 308) and location:
+            if redirects >= self.max_redirects:
+                raise HttpError(url, status)
+            return urljoin(url, location)
+        return None
+
+    def get(self, url: str, headers: Optional[dict[str, str]] = None) -> HttpResponse:
+        """
+        Fetch a URL, following redirects and decoding gzip/deflate bodies.
+
+        Returns:
+            The final HttpResponse (any status; see raise_for_status)
+        """
+        for redirects in range(self.max_redirects + 1):
+            with self._open(url, headers) as response:
+                body = response.read()
+                status = response.status
+                response_headers = {k.lower(): v for k, v in response.getheaders()}
+            next_url = self._follow(url, status, response_headers.get("location"), redirects)
+            if next_url is None:
+                body = _decode_body(body, response_headers.get("content-encoding", ""))
+                return HttpResponse(url, status, response_headers, body)
+            url = next_url
+        raise HttpError(url, status)
+
+    async def aget(self, url: str, headers: Optional[dict[str, str]] = None) -> HttpResponse:
+        """Async version of get(), run on the default executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.get, url, headers)
+
+    def stream_to(self, url: str, f: IO[bytes], headers: Optional[dict[str, str]] = None,
+                  max_bytes: Optional[int] = None, chunk_size: int = 64 * 1024) -> HttpResponse:
+        """
+        Fetch a URL and stream the (decoded) body into a binary file.
+
+        Args:
+            url: URL to download
+            f: Open binary file to write to
+            headers: Extra request headers
+            max_bytes: Abort with ValueError if the body is larger than this
+            chunk_size: Read size in bytes
+
+        Returns:
+            HttpResponse for the final URL, with an empty body
+
+        Raises:
+            HttpError: If the final status is not 2xx
+        """
+        for redirects in range(self.max_redirects + 1):
+            with self._open(url, headers) as response:
+                status = response.status
+                response_headers = {k.lower(): v for k, v in response.getheaders()}
+                next_url = self._follow(url, status, response_headers.get("location"), redirects)
+                if next_url is None:
+                    result = HttpResponse(url, status, response_headers, b"")
+                    result.raise_for_status()
+                    encoding = response_headers.get("content-encoding", "")
+                    decoder = zlib.decompressobj(31 if encoding == "gzip" else 15) if encoding in ("gzip", "deflate") else None
+                    written = 0
+                    while True:
+                        chunk = response.read(chunk_size)
+                        if not chunk:
+                            break
+                        if decoder is not None:
+                            chunk = decoder.decompress(chunk)
+                        written += len(chunk)
+                        if max_bytes is not None and written > max_bytes:
+                            raise ValueError(f"Response from {url} exceeds {max_bytes} bytes")
+                        f.write(chunk)
+                    if decoder is not None:
+                        f.write(decoder.flush())
+                    return result
+                response.read()  # drain so the connection can be reused
+            url = next_url
+        raise HttpError(url, status)
+
+    def post(self, url: str, body: bytes, headers: Optional[dict[str, str]] = None) -> HttpResponse:
+        """
+        Send a POST request (redirects are not followed).
+
+        Returns:
+            The HttpResponse (any status; see raise_for_status)
+        """
+        with self._open(url, headers, "POST", body) as response:
+            data = response.read()
+            status = response.status
+            response_headers = {k.lower(): v for k, v in response.getheaders()}
+        return HttpResponse(url, status, response_headers, _decode_body(data, response_headers.get("content-encoding", "")))
+
+    async def apost(self, url: str, body: bytes, headers: Optional[dict[str, str]] = None) -> HttpResponse:
+        """Async version of post(), run on the default executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.post, url, body, headers)
+
+    def close(self) -> None:
+        """Close every idle connection."""
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for conns in idle.values():
+            for conn in conns:
+                conn.close()
+
+    def __enter__(self) -> "HttpPool":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
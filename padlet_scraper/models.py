@@ -1,6 +1,6 @@
 """Data models for Padlet scraping."""
 
-from typing import Optional
+from typing import Iterator, Optional
 from pydantic import BaseModel, Field
 
 
@@ -14,6 +14,19 @@ class Link(BaseModel):
         return f"[{self.text}]({self.url})"
 
 
+class Attachment(BaseModel):
+    """Represents an image, file, media or link attached to a post."""
+
+    url: str = Field(description="The URL the attachment was found at")
+    kind: str = Field(description="One of 'image', 'video', 'audio', 'file' or 'link'")
+    cache_key: Optional[str] = Field(default=None, description="SHA-256 of the downloaded content in the AttachmentCache, if fetched")
+    content_type: Optional[str] = Field(default=None, description="Content-Type reported when it was downloaded")
+    size: Optional[int] = Field(default=None, description="Size in bytes of the downloaded content")
+
+    def __str__(self) -> str:
+        return f"{self.kind}: {self.url}"
+
+
 class Post(BaseModel):
     """Represents a single post within a Padlet section.
 
@@ -23,6 +36,7 @@ class Post(BaseModel):
     subject: str = Field(description="The subject/title of the post")
     body: str = Field(description="The body content of the post (with inline Markdown links)")
     section_id: Optional[str] = Field(default=None, description="ID of the parent section")
+    attachments: list[Attachment] = Field(default_factory=list, description="Attachments of the post (only captured when requested)")
 
     def __str__(self) -> str:
         return f"{self.subject}: {self.body[:50]}..." if len(self.body) > 50 else f"{self.subject}: {self.body}"
@@ -45,6 +59,7 @@ class Padlet(BaseModel):
     url: str = Field(description="The URL of the Padlet board")
     title: Optional[str] = Field(default=None, description="The title of the Padlet board")
     sections: list[Section] = Field(default_factory=list, description="Sections within the Padlet")
+    partial: bool = Field(default=False, description="True if the scrape ran out of time before loading everything")
 
     @property
     def total_posts(self) -> int:
@@ -54,21 +69,34 @@ class Padlet(BaseModel):
     def __str__(self) -> str:
         return f"Padlet '{self.title or self.url}' with {len(self.sections)} section(s) and {self.total_posts} post(s)"
 
-    def to_markdown(self) -> str:
-        """Convert the Padlet data to Markdown format.
+    def iter_markdown(self) -> Iterator[str]:
+        """Yield the Markdown rendering of the Padlet piece by piece.
 
-        Note: Links are already inline as Markdown within post bodies.
+        Lets writers stream large boards to disk without holding the whole
+        document in memory. Joining the pieces gives ``to_markdown()``.
         """
-        lines = []
+        first = True
+
+        def line(text: str) -> Iterator[str]:
+            nonlocal first
+            if not first:
+                yield "\n"
+            first = False
+            yield text
 
         if self.title:
-            lines.append(f"# {self.title}\n")
+            yield from line(f"# {self.title}\n")
 
         for section in self.sections:
-            lines.append(f"## {section.title}\n")
+            yield from line(f"## {section.title}\n")
 
             for post in section.posts:
-                lines.append(f"### {post.subject}\n")
-                lines.append(f"{post.body}\n")
+                yield from line(f"### {post.subject}\n")
+                yield from line(f"{post.body}\n")
 
-        return "\n".join(lines)
+    def to_markdown(self) -> str:
+        """Convert the Padlet data to Markdown format.
+
+        Note: Links are already inline as Markdown within post bodies.
+        """
+        return "".join(self.iter_markdown())
@@ -0,0 +1,148 @@
+"""Helpers for inspecting and killing browser process trees."""
+
+import os
+import signal
+import sys
+import threading
+from typing import Optional
+
+_SIGKILL = getattr(signal, "SIGKILL", signal.SIGTERM)
+
+
+def pid_alive(pid: int) -> bool:
+    """Return True if a process with this pid exists and hasn't exited (zombies count as exited)."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    except OSError:
+        return False
+    try:
+        with open(f"/proc/{pid}/stat", "rb") as f:
+            stat = f.read()
+    except OSError:
+        return True  # No /proc; the signal check is all we have
+    # The state follows the parenthesised command name
+    return stat[stat.rfind(b")") + 2:stat.rfind(b")") + 3] != b"Z"
+
+
+def _parent_pids() -> dict[int, int]:
+    """Map every visible pid to its parent pid (empty where /proc is unavailable)."""
+    parents = {}
+    try:
+        entries = os.listdir("/proc")
+    except OSError:
+        return parents
+
+    for entry in entries:
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat", "rb") as f:
+                stat = f.read()
+        except OSError:
+            continue
+        # The command name is wrapped in parentheses and may contain spaces
+        fields = stat[stat.rfind(b")") + 2:].split()
+        if len(fields) > 1:
+            parents[int(entry)] = int(fields[1])
+    return parents
+
+
+def child_pids(pid: int) -> list[int]:
+    """
+    Return the direct children of pid.
+
+    Reads /proc, so on platforms without it this returns an empty list.
+    """
+    return [child for child, parent in _parent_pids().items() if parent == pid]
+
+
+def process_tree(pid: int) -> list[int]:
+    """Return pid followed by all of its descendants."""
+    children: dict[int, list[int]] = {}
+    for child, parent in _parent_pids().items():
+        children.setdefault(parent, []).append(child)
+
+    tree = [pid]
+    i = 0
+    while i < len(tree):
+        tree.extend(children.get(tree[i], []))
+        i += 1
+    return tree
+
+
+def rss_bytes(pid: int) -> int:
+    """
+    Return the resident set size of one process in bytes.
+
+    Reads /proc/<pid>/status, so returns 0 where /proc is unavailable or the
+    process has exited.
+    """
+    try:
+        with open(f"/proc/{pid}/status", "r", encoding="ascii", errors="replace") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024  # reported in kB
+    except (OSError, ValueError, IndexError):
+        pass
+    return 0
+
+
+def tree_rss_bytes(pid: int) -> int:
+    """Return the combined resident set size of a process and its descendants."""
+    return sum(rss_bytes(p) for p in process_tree(pid))
+
+
+def kill_process_tree(pid: int) -> None:
+    """Forcefully kill a process and all of its descendants."""
+    # Children first, so they can't be re-parented out of reach
+    for p in reversed(process_tree(pid)):
+        try:
+            os.kill(p, _SIGKILL)
+        except OSError:
+            pass
+
+
+class ProcessWatchdog:
+    """Kills a process tree if it is still alive when a timer expires.
+
+    The timer runs on a daemon thread, so it fires even when the event loop
+    that owns the process is blocked.
+    """
+
+    def __init__(self, pid: Optional[int], timeout: float, name: str = "browser"):
+        """
+        Arm the watchdog.
+
+        Args:
+            pid: Process to kill (the watchdog does nothing if None)
+            timeout: Seconds from now after which the process is killed
+            name: Description used in the warning message
+        """
+        self.pid = pid
+        self.name = name
+        self.fired = False
+        self._timer: Optional[threading.Timer] = None
+        if pid is not None:
+            self._timer = threading.Timer(max(0.0, timeout), self._fire)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _fire(self) -> None:
+        if self.pid is not None and pid_alive(self.pid):
+            self.fired = True
+            print(f"Warning: {self.name} (pid {self.pid}) outlived its deadline; killing it", file=sys.stderr)
+            kill_process_tree(self.pid)
+
+    def cancel(self) -> None:
+        """Disarm the watchdog."""
+        if self._timer is not None:
+            self._timer.cancel()
+
+    def cancel_if_exited(self) -> None:
+        """Disarm the watchdog if the process has already exited."""
+        if self.pid is None or not pid_alive(self.pid):
+            self.cancel()
@@ -0,0 +1,328 @@
+"""Record the CDP traffic of a scrape and replay it without a browser.
+
+A recording is a JSON Lines file with one entry per CDP command a tab
+sent: the method, its params, the raw result (or protocol error), when it
+was sent, how long Chrome took to answer and which of the scrape's tabs
+sent it. Replaying feeds those results
+back to the same nodriver and scraper code, so a scrape runs offline and
+deterministically - at full speed to profile the Python side alone, or
+with the recorded latencies to reproduce the original timing.
+
+Usage:
+    async with RecordingSession("board.cdp.jsonl") as session:
+        await PadletScraper(session=session).scrape(url)
+
+    padlet = await PadletScraper(session=ReplaySession("board.cdp.jsonl")).scrape(url)
+"""
+
+import asyncio
+import bisect
+import collections
+import contextlib
+import json
+import time
+from pathlib import Path
+from typing import AsyncIterator, Optional, Union
+import nodriver as uc
+from nodriver import cdp
+from .session import BrowserSession
+
+
+def _key(method: str, params: Optional[dict]) -> str:
+    return method + json.dumps(params or {}, sort_keys=True, separators=(",", ":"))
+
+
+def _tap(cdp_obj, entry: dict):
+    """Wrap a nodriver CDP command generator, copying its request and raw result into entry."""
+    request = next(cdp_obj)
+    entry["method"] = request["method"]
+    entry["params"] = request.get("params") or {}
+    result = yield request
+    entry["result"] = result
+    try:
+        cdp_obj.send(result)
+    except StopIteration as e:
+        return e.value
+    raise RuntimeError(f"CDP command {entry['method']} did not finish after its response")
+
+
+class CdpRecorder:
+    """Appends every CDP command sent by attached tabs to a recording file."""
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Open a recording for writing (an existing file is replaced).
+
+        Args:
+            path: Recording file path
+        """
+        self.path = Path(path)
+        self.commands = 0
+        self._file = open(self.path, "w", encoding="utf-8")
+        self._started = time.perf_counter()
+
+    def attach(self, tab, index: int = 0) -> None:
+        """
+        Start recording a nodriver Tab's commands.
+
+        Args:
+            tab: The tab to record
+            index: Which of a multi-tab scrape's tabs this is
+        """
+        send = tab.send
+
+        async def recording_send(cdp_obj, *args, **kwargs):
+            entry = {"tab": index}
+            started = time.perf_counter()
+            try:
+                return await send(_tap(cdp_obj, entry), *args, **kwargs)
+            except uc.ProtocolException as e:
+                error = e.args[0] if e.args and isinstance(e.args[0], dict) else {"message": str(e)}
+                entry["error"] = error
+                raise
+            finally:
+                if "result" in entry or "error" in entry:
+                    entry["t"] = round(started - self._started, 6)
+                    entry["duration"] = round(time.perf_counter() - started, 6)
+                    self._write(entry)
+
+        tab.send = recording_send
+
+    def detach(self, tab) -> None:
+        """Stop recording a tab."""
+        tab.__dict__.pop("send", None)
+
+    def _write(self, entry: dict) -> None:
+        if self._file.closed:
+            return
+        self._file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self._file.flush()  # a crashed scrape still leaves a usable recording
+        self.commands += 1
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def load_recording(path: Union[str, Path]) -> list[dict]:
+    """Read the entries of a recording file."""
+    with open(path, "r", encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+class ReplayTab(uc.Tab):
+    """A nodriver Tab that answers CDP commands from a recording instead of a browser.
+
+    Responses are matched by method and params and follow the recorded call
+    sequence. A command normally gets the next unused response recorded for
+    it. Two cases need more care:
+
+    - Concurrent commands may arrive in a different order than recorded, so
+      a command seen for the first time may skip ahead, and one whose
+      responses all lie behind the sequence takes the earliest unused one.
+    - Polling loops such as Tab.find don't always repeat as often as they
+      did while recording. A repeated command whose next response lies
+      beyond commands that haven't been replayed yet, or that has no
+      responses left, gets its last response again. From then on sleeps take
+      their real time, so time-bounded polls still end.
+    """
+
+    def __init__(self, entries: list[dict], realtime: bool = False, index: int = 0):
+        """
+        Initialize the tab.
+
+        Args:
+            entries: Recorded commands (see load_recording())
+            realtime: Wait the recorded latency before each response and honour
+                      sleeps, instead of answering immediately
+            index: Replay the commands of this tab of a multi-tab scrape
+        """
+        super().__init__()
+        self.realtime = realtime
+        self._entries = [entry for entry in entries if entry.get("tab", 0) == index]
+        self._used = [False] * len(self._entries)
+        self._positions: dict[str, list[int]] = collections.defaultdict(list)
+        for position, entry in enumerate(self._entries):
+            self._positions[_key(entry["method"], entry.get("params"))].append(position)
+        self._last: dict[str, dict] = {}  # last response served per command
+        self._cursor = 0  # position after the furthest response served
+        self._unused = len(self._entries)
+        self._repeating = False
+
+    @property
+    def remaining(self) -> int:
+        """Number of recorded responses not consumed yet."""
+        return self._unused
+
+    def _take(self, key: str, position: int) -> dict:
+        self._used[position] = True
+        self._unused -= 1
+        self._cursor = max(self._cursor, position + 1)
+        self._repeating = False
+        self._last[key] = self._entries[position]
+        return self._entries[position]
+
+    def _next_entry(self, key: str) -> Optional[dict]:
+        positions = self._positions.get(key, ())
+        start = bisect.bisect_left(positions, self._cursor)
+        ahead = next((p for p in positions[start:] if not self._used[p]), None)
+        if ahead is not None:
+            skips_pending = not all(self._used[self._cursor:ahead])
+            if key not in self._last or not skips_pending:
+                return self._take(key, ahead)
+        else:
+            behind = next((p for p in positions[:start] if not self._used[p]), None)
+            if behind is not None:
+                return self._take(key, behind)
+        if key not in self._last:
+            return None
+        # An extra round of a poll
+        self._repeating = True
+        return self._last[key]
+
+    async def send(self, cdp_obj, *args, **kwargs):
+        request = next(cdp_obj)
+        entry = self._next_entry(_key(request["method"], request.get("params")))
+        if entry is None:
+            params = json.dumps(request.get("params") or {})
+            raise LookupError(f"No recorded response for {request['method']} {params[:200]}")
+
+        if self.realtime:
+            await asyncio.sleep(entry.get("duration", 0))
+        else:
+            await asyncio.sleep(0)  # still yield like a real round trip
+
+        if "error" in entry:
+            raise uc.ProtocolException(entry["error"])
+        try:
+            cdp_obj.send(entry["result"])
+        except StopIteration as e:
+            return e.value
+        raise RuntimeError(f"CDP command {request['method']} did not finish after its response")
+
+    async def get(self, url: str = "about:blank", new_tab: bool = False, new_window: bool = False):
+        await self.send(cdp.page.navigate(url))
+        return self
+
+    async def attach(self, *args, **kwargs) -> None:
+        pass
+
+    async def sleep(self, t: float = 1) -> None:
+        await asyncio.sleep(t if self.realtime or self._repeating else 0)
+
+    async def close(self) -> None:
+        pass
+
+    def __repr__(self) -> str:
+        return f"<ReplayTab remaining={self.remaining}>"
+
+
+class RecordingSession:
+    """A BrowserSession whose tabs record their CDP traffic to a file.
+
+    Pass it to PadletScraper(session=...) like a BrowserSession. Recording
+    one scrape per file keeps replays unambiguous.
+    """
+
+    def __init__(self, path: Union[str, Path], session: Optional[BrowserSession] = None, **session_kwargs):
+        """
+        Initialize the session.
+
+        Args:
+            path: Recording file path
+            session: Browser session to take tabs from (one is created and
+                     owned if None)
+            **session_kwargs: Passed to BrowserSession when creating one
+        """
+        self.recorder = CdpRecorder(path)
+        self._owned = session is None
+        self.session = session or BrowserSession(**session_kwargs)
+
+    async def start(self) -> "RecordingSession":
+        await self.session.start()
+        return self
+
+    async def close(self) -> None:
+        """Finish the recording (and stop the browser if this session created it)."""
+        self.recorder.close()
+        if self._owned:
+            await self.session.close()
+
+    async def __aenter__(self) -> "RecordingSession":
+        return await self.start()
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+
+    @contextlib.asynccontextmanager
+    async def tab(self) -> AsyncIterator:
+        """Lease a tab from the underlying session and record it until it is returned."""
+        async with self.tabs(1) as tabs:
+            yield tabs[0]
+
+    @contextlib.asynccontextmanager
+    async def tabs(self, count: int) -> AsyncIterator[list]:
+        """Lease several recorded tabs at once."""
+        async with self.session.tabs(count) as tabs:
+            for index, tab in enumerate(tabs):
+                self.recorder.attach(tab, index)
+            try:
+                yield tabs
+            finally:
+                # Session housekeeping (heap checks, closing) isn't part of the scrape
+                for tab in tabs:
+                    self.recorder.detach(tab)
+
+    def discard(self, tab) -> None:
+        self.session.discard(tab)
+
+
+class ReplaySession:
+    """Hands out ReplayTabs over a recording, for PadletScraper(session=...).
+
+    Every lease gets a fresh tab, so one session can replay the same scrape
+    any number of times (e.g. in a profiling loop).
+    """
+
+    def __init__(self, path: Union[str, Path], realtime: bool = False):
+        """
+        Load a recording.
+
+        Args:
+            path: Recording file path
+            realtime: Replay with the recorded latencies (see ReplayTab)
+        """
+        self.entries = load_recording(path)
+        self.realtime = realtime
+
+    @property
+    def url(self) -> Optional[str]:
+        """The first URL the recorded tab navigated to."""
+        for entry in self.entries:
+            if entry["method"] == "Page.navigate":
+                return entry["params"].get("url")
+        return None
+
+    async def start(self) -> "ReplaySession":
+        return self
+
+    async def close(self) -> None:
+        pass
+
+    async def __aenter__(self) -> "ReplaySession":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        pass
+
+    @contextlib.asynccontextmanager
+    async def tab(self) -> AsyncIterator[ReplayTab]:
+        """Lease a fresh ReplayTab."""
+        yield ReplayTab(self.entries, self.realtime)
+
+    @contextlib.asynccontextmanager
+    async def tabs(self, count: int) -> AsyncIterator[list[ReplayTab]]:
+        """Lease several fresh ReplayTabs, each replaying the recorded tab at its position."""
+        yield [ReplayTab(self.entries, self.realtime, index) for index in range(count)]
+
+    def discard(self, tab) -> None:
+        pass
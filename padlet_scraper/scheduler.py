@@ -0,0 +1,259 @@
+"""Rate-limited, adaptively concurrent scheduling of Padlet scrapes."""
+
+import asyncio
+import math
+import sys
+from typing import Iterable, Optional
+from urllib.parse import urlsplit
+from pydantic import BaseModel, Field
+from .models import Padlet
+from .scraper import PadletScraper, ThrottledError
+
+
+class TokenBucket:
+    """Token-bucket rate limiter: `rate` requests per second with bursts of up to `burst`."""
+
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        Initialize the bucket (full).
+
+        Args:
+            rate: Tokens added per second
+            burst: Maximum number of tokens the bucket can hold
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated: Optional[float] = None
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float) -> None:
+        if self._updated is not None:
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    @property
+    def paused(self) -> bool:
+        """True while the bucket is paused by pause()."""
+        return asyncio.get_running_loop().time() < self._paused_until
+
+    def pause(self, seconds: float) -> None:
+        """Hand out no tokens for the next `seconds` (used after the host throttles us)."""
+        now = asyncio.get_running_loop().time()
+        self._paused_until = max(self._paused_until, now + seconds)
+        self._tokens = 0.0
+        self._updated = now
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        loop = asyncio.get_running_loop()
+        # The lock makes waiters take tokens in FIFO order
+        async with self._lock:
+            while True:
+                now = loop.time()
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class SchedulerStats(BaseModel):
+    """Snapshot of a ScrapeScheduler's queue and limits."""
+
+    queue_depth: int = Field(description="Scrapes waiting for a concurrency slot or rate-limit token")
+    in_flight: int = Field(description="Scrapes currently running")
+    concurrency_limit: int = Field(description="Current adaptive concurrency limit")
+    max_concurrency: int = Field(description="Hard global concurrency cap")
+    completed: int = Field(default=0, description="Scrapes that finished successfully")
+    failed: int = Field(default=0, description="Scrapes that raised an exception")
+    throttled: int = Field(default=0, description="Scrapes rejected by the host with a throttling status")
+    avg_latency: Optional[float] = Field(default=None, description="Smoothed scrape latency in seconds")
+    host_rates: dict[str, float] = Field(default_factory=dict, description="Requests per second allowed per host")
+
+
+class ScrapeScheduler:
+    """Runs scrapes through per-host token buckets and an AIMD concurrency limit.
+
+    The concurrency limit grows by one slot per "round" of successful scrapes
+    (additive increase) and is multiplied by `decrease_factor` when a scrape
+    fails, is throttled, or takes longer than `target_latency` (multiplicative
+    decrease). Decreases are applied at most once per round so one burst of
+    slow pages does not collapse the limit to the minimum.
+    """
+
+    def __init__(
+        self,
+        scraper: Optional[PadletScraper] = None,
+        max_concurrency: int = 8,
+        min_concurrency: int = 1,
+        initial_concurrency: int = 2,
+        rate_per_host: float = 1.0,
+        burst: int = 2,
+        target_latency: float = 20.0,
+        decrease_factor: float = 0.5,
+        throttle_backoff: float = 30.0,
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            scraper: Scraper used for every job (a default PadletScraper if None)
+            max_concurrency: Global cap on concurrent scrapes
+            min_concurrency: The adaptive limit never drops below this
+            initial_concurrency: Adaptive limit to start from
+            rate_per_host: Page loads per second allowed for each host
+            burst: Page loads a host may receive back-to-back
+            target_latency: Scrapes slower than this (seconds) count as congestion
+            decrease_factor: Multiplier applied to the limit on congestion
+            throttle_backoff: Seconds to stop sending to a host that throttled us
+        """
+        if not 1 <= min_concurrency <= max_concurrency:
+            raise ValueError("Require 1 <= min_concurrency <= max_concurrency")
+        self.scraper = scraper or PadletScraper()
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        self.rate_per_host = rate_per_host
+        self.burst = burst
+        self.target_latency = target_latency
+        self.decrease_factor = decrease_factor
+        self.throttle_backoff = throttle_backoff
+
+        self._limit = float(min(max(initial_concurrency, min_concurrency), max_concurrency))
+        self._buckets: dict[str, TokenBucket] = {}
+        self._in_flight = 0
+        self._waiting = 0
+        # Completions since the last decrease; starts "a full round ago" so the
+        # first congestion signal already lowers the limit
+        self._since_decrease = max_concurrency
+        self._completed = 0
+        self._failed = 0
+        self._throttled = 0
+        self._avg_latency: Optional[float] = None
+        self._slot_freed: Optional[asyncio.Condition] = None
+
+    @property
+    def concurrency_limit(self) -> int:
+        """Current number of scrapes allowed to run at once."""
+        return int(self._limit)
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of scrapes waiting to start."""
+        return self._waiting
+
+    def stats(self) -> SchedulerStats:
+        """Return a snapshot of the scheduler's queue depth, limits and counters."""
+        return SchedulerStats(
+            queue_depth=self._waiting,
+            in_flight=self._in_flight,
+            concurrency_limit=self.concurrency_limit,
+            max_concurrency=self.max_concurrency,
+            completed=self._completed,
+            failed=self._failed,
+            throttled=self._throttled,
+            avg_latency=self._avg_latency,
+            host_rates={host: bucket.rate for host, bucket in self._buckets.items()},
+        )
+
+    def _bucket_for(self, url: str) -> TokenBucket:
+        host = urlsplit(url).hostname or ""
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = self._buckets[host] = TokenBucket(self.rate_per_host, self.burst)
+        return bucket
+
+    async def _acquire_slot(self) -> None:
+        if self._slot_freed is None:
+            self._slot_freed = asyncio.Condition()
+        async with self._slot_freed:
+            await self._slot_freed.wait_for(lambda: self._in_flight < self.concurrency_limit)
+            self._in_flight += 1
+
+    async def _release_slot(self) -> None:
+        async with self._slot_freed:
+            self._in_flight -= 1
+            self._slot_freed.notify_all()
+
+    def _record(self, latency: float, congested: bool) -> None:
+        """Feed one completed scrape into the AIMD controller."""
+        if self._avg_latency is None:
+            self._avg_latency = latency
+        else:
+            self._avg_latency = 0.8 * self._avg_latency + 0.2 * latency
+
+        self._since_decrease += 1
+        if congested:
+            # At most one decrease per round of completions
+            if self._since_decrease >= self.concurrency_limit:
+                self._limit = max(float(self.min_concurrency), math.floor(self._limit * self.decrease_factor))
+                self._since_decrease = 0
+        else:
+            # +1 slot after `limit` successes, like TCP congestion avoidance
+            self._limit = min(float(self.max_concurrency), self._limit + 1.0 / self._limit)
+
+    async def scrape(self, url: str) -> Padlet:
+        """
+        Scrape a Padlet once a concurrency slot and a rate-limit token are available.
+
+        Args:
+            url: The URL of the Padlet to scrape
+
+        Returns:
+            Padlet object containing all sections and posts
+        """
+        bucket = self._bucket_for(url)
+        self._waiting += 1
+        try:
+            # Wait for the host before taking a global slot, so a throttled or
+            # paused host never holds slots that scrapes of other hosts could use
+            while True:
+                await bucket.acquire()
+                await self._acquire_slot()
+                if not bucket.paused:
+                    break
+                # The host throttled us while we waited for the slot
+                await self._release_slot()
+        finally:
+            self._waiting -= 1
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        congested = True
+        try:
+            padlet = await self.scraper.scrape(url)
+            self._completed += 1
+            congested = loop.time() - started > self.target_latency
+            return padlet
+        except ThrottledError:
+            self._throttled += 1
+            self._failed += 1
+            bucket.pause(self.throttle_backoff)
+            print(f"Warning: {urlsplit(url).hostname} is throttling; pausing for {self.throttle_backoff}s",
+                  file=sys.stderr)
+            raise
+        except asyncio.CancelledError:
+            congested = None  # Says nothing about the host; don't feed the controller
+            raise
+        except Exception:
+            self._failed += 1
+            raise
+        finally:
+            if congested is not None:
+                self._record(loop.time() - started, congested)
+            await self._release_slot()
+
+    async def scrape_many(self, urls: Iterable[str]) -> list:
+        """
+        Scrape many Padlets through the scheduler.
+
+        Returns:
+            One entry per URL, in order: a Padlet, or the exception that scrape raised
+        """
+        return await asyncio.gather(*(self.scrape(url) for url in urls), return_exceptions=True)
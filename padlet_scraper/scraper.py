@@ -1,19 +1,40 @@
 """Padlet scraper using nodriver for browser automation."""
 
 import asyncio
+import contextlib
 import json
 import os
 import sys
 from typing import Optional
-import nodriver as uc
 from nodriver import cdp
-from .models import Post, Section, Padlet
+from .deadline import Deadline
+from .attachments import AttachmentFetcher, attachment_kind
+from .errors import THROTTLE_STATUSES, ThrottledError
+from .fastpath import fetch_board
+from .httpclient import HttpPool
+from .models import Attachment, Post, Section, Padlet
+from .process import ProcessWatchdog
+from .session import browser_pid, launch_browser
+
+LOADING_MODES = ("scroll", "tall")
+
+# Tallest viewport the "tall" loading mode will emulate; boards taller than
+# this are loaded by scrolling instead (the compositor rasterizes the whole
+# visible area, so memory grows with the height)
+TALL_VIEWPORT_MAX_HEIGHT = 16384
+
+# Marks the stylesheet that un-clips section containers in "tall" mode
+_EXPAND_STYLE_ID = "padlet-scraper-expand"
 
 
 class PadletScraper:
     """Scraper for extracting structured data from Padlet boards."""
 
-    def __init__(self, headless: bool = True, timeout: int = 30, browser_executable_path: Optional[str] = None, sandbox: bool = True):
+    def __init__(self, headless: bool = True, timeout: int = 30, browser_executable_path: Optional[str] = None, sandbox: bool = True,
+                 deadline: Optional[float] = None, phase_weights: Optional[dict[str, float]] = None, kill_grace: float = 5.0,
+                 session=None, fast_path: bool = False, http_pool: Optional[HttpPool] = None, tabs: int = 1,
+                 loading: str = "scroll", attachments: bool = False,
+                 attachment_fetcher: Optional[AttachmentFetcher] = None):
         """
         Initialize the Padlet scraper.
 
@@ -23,11 +44,56 @@ class PadletScraper:
             browser_executable_path: Path to browser executable (Chrome, Edge, Brave, Arc).
                                     If None, nodriver will attempt to download Chromium.
             sandbox: Whether to use Chrome sandbox (set to False if having connection issues)
+            deadline: Maximum time for a whole scrape (seconds). When it runs out the
+                      scrape returns what it has with `partial=True`. None means no limit.
+            phase_weights: Override how the deadline is split between the
+                           navigate/load/scroll/extract/teardown phases
+            kill_grace: Seconds past the deadline after which a browser that is
+                        still running gets killed
+            session: Optional BrowserSession to take tabs from. By default every
+                     scrape launches (and stops) its own browser.
+            fast_path: Try to read the board from its HTML over plain HTTP first and
+                       only use the browser if that data is incomplete
+            http_pool: Connection pool for the fast path (created on first use if None)
+            tabs: Open the board in this many tabs and split its sections between
+                  them by data-rank, so scrolling and extraction of very large
+                  boards run in parallel renderers
+            loading: How to make the board render lazy-loaded content: "scroll" scrolls
+                     the page and every section container; "tall" sizes the viewport
+                     to the whole board with un-clipped containers so everything is
+                     rendered without scrolling, and falls back to scrolling when
+                     that doesn't work
+            attachments: Collect each post's images, media, files and links into
+                         Post.attachments
+            attachment_fetcher: Download the collected attachments into its cache
+                                after each scrape (implies attachments=True)
         """
+        if tabs < 1:
+            raise ValueError("tabs must be at least 1")
+        if loading not in LOADING_MODES:
+            raise ValueError(f"loading must be one of {', '.join(LOADING_MODES)}")
         self.headless = headless
         self.timeout = timeout
         self.browser_executable_path = browser_executable_path
         self.sandbox = sandbox
+        self.deadline = deadline
+        self.phase_weights = phase_weights
+        self.kill_grace = kill_grace
+        self.session = session
+        self.fast_path = fast_path
+        self.http_pool = http_pool
+        self._owns_http_pool = False
+        self.tabs = tabs
+        self.loading = loading
+        self.attachments = attachments or attachment_fetcher is not None
+        self.attachment_fetcher = attachment_fetcher
+
+    def close(self) -> None:
+        """Close the fast-path connection pool if the scraper created it."""
+        if self._owns_http_pool and self.http_pool is not None:
+            self.http_pool.close()
+            self.http_pool = None
+            self._owns_http_pool = False
 
     async def scrape(self, url: str) -> Padlet:
         """
@@ -37,79 +103,74 @@ class PadletScraper:
             url: The URL of the Padlet to scrape
 
         Returns:
-            Padlet object containing all sections and posts
+            Padlet object containing all sections and posts. If the deadline
+            ran out, it holds whatever was extracted (and downloaded) in time
+            and `partial` is True.
         """
-        # Start browser
-        try:
-            if self.browser_executable_path:
-                browser = await uc.start(
-                    headless=self.headless,
-                    browser_executable_path=self.browser_executable_path,
-                    sandbox=self.sandbox
-                )
-            else:
-                browser = await uc.start(headless=self.headless, sandbox=self.sandbox)
-        except FileNotFoundError as e:
-            raise FileNotFoundError(
-                "Chrome/Chromium browser not found. Please either:\n"
-                "1. Install Chrome from https://www.google.com/chrome/\n"
-                "2. Or specify browser path: PadletScraper(browser_executable_path='/path/to/browser')\n"
-                "   Common paths:\n"
-                "   - Arc: '/Applications/Arc.app/Contents/MacOS/Arc'\n"
-                "   - Chrome: '/Applications/Google Chrome.app/Contents/MacOS/Google Chrome'\n"
-                "   - Brave: '/Applications/Brave Browser.app/Contents/MacOS/Brave Browser'\n"
-                "   - Edge: '/Applications/Microsoft Edge.app/Contents/MacOS/Microsoft Edge'"
-            ) from e
+        deadline = Deadline(self.deadline, self.phase_weights)
+        padlet = await self._scrape_board(url, deadline)
+        if self.attachment_fetcher is not None:
+            # Downloads get whatever the scrape left of the deadline
+            stats = await self.attachment_fetcher.fetch(padlet, timeout=deadline.remaining())
+            if stats.unique:
+                print(f"Attachments: {stats.downloaded} downloaded, {stats.cached} cached, "
+                      f"{stats.failed} failed, {stats.unfinished} unfinished", file=sys.stderr, flush=True)
+        return padlet
+
+    async def _scrape_board(self, url: str, deadline: Deadline) -> Padlet:
+        """Scrape a board's sections and posts (fast path, session tab or own browser)."""
+
+        if self.fast_path:
+            padlet = await self._scrape_fast_path(url, deadline)
+            if padlet is not None:
+                return padlet
+
+        if self.session is not None:
+            # The session owns the browser; a tab that ran out of time may
+            # still have work queued in its renderer, so it is not reused.
+            async with contextlib.AsyncExitStack() as stack:
+                try:
+                    # Waiting for (and opening) tabs counts against the deadline too
+                    tabs = await deadline.run("navigate", stack.enter_async_context(self.session.tabs(self.tabs)))
+                except asyncio.TimeoutError:
+                    return Padlet(url=url, partial=True)
+
+                # A shared browser still stuck past the deadline is killed like
+                # our own would be; the session restarts it once its scrapes drain
+                watchdog = None
+                if deadline.total is not None:
+                    # Replay sessions have no browser; recording sessions wrap one that has
+                    owner = getattr(self.session, "session", self.session)
+                    watchdog = ProcessWatchdog(browser_pid(getattr(owner, "browser", None)),
+                                               deadline.remaining() + self.kill_grace)
+                try:
+                    padlet = await self._scrape_targets(tabs, url, deadline)
+                finally:
+                    if watchdog is not None:
+                        watchdog.cancel()
+                if padlet.partial:
+                    for tab in tabs:
+                        self.session.discard(tab)
+                return padlet
+
+        browser = await launch_browser(self.headless, self.browser_executable_path, self.sandbox)
+
+        # Kill the browser from another thread if it outlives the deadline,
+        # even if this event loop is stuck
+        watchdog = None
+        if deadline.total is not None:
+            watchdog = ProcessWatchdog(browser_pid(browser), deadline.remaining() + self.kill_grace)
 
         try:
-            page = await browser.get(url)
+            # The first target navigates the browser's own tab, the rest get new tabs
+            async def open_tabs() -> list:
+                return [await browser.get("about:blank", new_tab=True) for _ in range(self.tabs - 1)]
 
-            # Set viewport size in headless mode to fix scrolling/lazy-loading
-            if self.headless:
-                try:
-                    await page.send(
-                        cdp.emulation.set_device_metrics_override(
-                            width=1920, height=1080,
-                            device_scale_factor=1,
-                            mobile=False,
-                            # These two are important for changing window.screen.* values
-                            screen_width=1920, screen_height=1080,
-                            position_x=0, position_y=0
-                        )
-                    )
-                except Exception as e:
-                    print(f"Warning: Could not set viewport size: {e}")
-
-            # Wait for the page to load - Padlets are JavaScript-heavy
-            await page.sleep(.5)  # Initial load time
-
-            # Try to wait for sections to appear
             try:
-                await page.find('[data-testid="sectionTitleText"]', timeout=self.timeout)
-            except Exception:
-                # Padlet might not have sections, or they might be named differently
-                pass
-
-            # First scroll the main page to load all sections/rows
-            await self._scroll_main_page(page)
-
-            # Then scroll individual section containers to load all posts
-            await self._scroll_section_containers(page)
-
-            # Wait for DOM to fully render all lazy-loaded content
-            await page.sleep(.2)
-
-            # Extract Padlet title
-            title = await self._extract_title(page)
-
-            # Extract all sections
-            sections = await self._extract_sections(page)
-
-            return Padlet(
-                url=url,
-                title=title,
-                sections=sections
-            )
+                targets = [browser] + await deadline.run("navigate", open_tabs())
+            except asyncio.TimeoutError:
+                return Padlet(url=url, partial=True)
+            return await self._scrape_targets(targets, url, deadline)
 
         finally:
             # Stop browser and cleanup properly
@@ -119,7 +180,368 @@ class PadletScraper:
             try:
                 browser.stop()
             finally:
-                await asyncio.sleep(0.75)
+                teardown = deadline.budget_for("teardown")
+                await asyncio.sleep(0.75 if teardown is None else min(0.75, teardown))
+                if watchdog is not None:
+                    watchdog.cancel_if_exited()
+
+    async def _scrape_fast_path(self, url: str, deadline: Deadline) -> Optional[Padlet]:
+        """Scrape over plain HTTP; return None when the browser is needed."""
+        if self.http_pool is None:
+            self.http_pool = HttpPool()
+            self._owns_http_pool = True
+        try:
+            result = await asyncio.wait_for(
+                fetch_board(url, self.http_pool, self.attachments), deadline.budget_for("navigate")
+            )
+        except ThrottledError:
+            raise
+        except Exception as e:
+            print(f"Fast path failed, falling back to browser: {e}", file=sys.stderr)
+            return None
+
+        if result is None or not result.complete:
+            reason = "no board data in page" if result is None else f"incomplete {result.source} data"
+            print(f"Fast path: {reason}, falling back to browser", file=sys.stderr, flush=True)
+            return None
+
+        print(f"Fast path: loaded board from {result.source} data", file=sys.stderr, flush=True)
+        return result.padlet
+
+    async def _scrape_target(self, target, url: str, deadline: Deadline) -> Padlet:
+        """Run the navigate/load/scroll/extract phases in a browser or tab."""
+        try:
+            page = await deadline.run("navigate", self._navigate(target, url))
+        except asyncio.TimeoutError:
+            return Padlet(url=url, partial=True)
+
+        try:
+            await deadline.run("load", self._wait_for_load(page))
+        except asyncio.TimeoutError:
+            pass  # Scrolling below triggers any loading that is still missing
+
+        partial = False
+        try:
+            await deadline.run("scroll", self._scroll(page))
+        except asyncio.TimeoutError:
+            partial = True
+
+        title, sections, complete = await self._extract(page, deadline.budget_for("extract"))
+
+        return Padlet(
+            url=url,
+            title=title,
+            sections=sections,
+            partial=partial or not complete
+        )
+
+    async def _scrape_targets(self, targets: list, url: str, deadline: Deadline) -> Padlet:
+        """Scrape in one target, or split the board's sections between several."""
+        if len(targets) == 1:
+            return await self._scrape_target(targets[0], url, deadline)
+
+        try:
+            pages = await deadline.run("navigate", asyncio.gather(*(self._navigate(t, url) for t in targets)))
+        except asyncio.TimeoutError:
+            return Padlet(url=url, partial=True)
+
+        try:
+            await deadline.run("load", asyncio.gather(*(self._wait_for_load(page) for page in pages)))
+        except asyncio.TimeoutError:
+            pass
+
+        ranks: dict[str, float] = {}
+        try:
+            ranks, shares, covered = await deadline.run("scroll", self._scroll_split(pages))
+            partial = not covered
+        except asyncio.TimeoutError:
+            # Without every tab knowing its share, fall back to the first tab's view
+            pages, shares = pages[:1], [None]
+            partial = True
+
+        budget = deadline.budget_for("extract")
+        (title, first, complete), *rest = await asyncio.gather(
+            self._extract(pages[0], budget, shares[0]),
+            *(self._extract_sections(page, budget, share) for page, share in zip(pages[1:], shares[1:]))
+        )
+
+        results = [first] + [sections for sections, _ in rest]
+        return Padlet(
+            url=url,
+            title=title,
+            sections=self._merge_sections(results, ranks),
+            partial=partial or not complete or not all(done for _, done in rest)
+        )
+
+    async def _scroll_split(self, pages: list) -> tuple[dict[str, float], list[Optional[set[str]]], bool]:
+        """
+        Render all sections in every tab, then give each tab a data-rank range to scroll.
+
+        Returns:
+            (ranks, shares, covered): section id -> rank as seen by the first tab,
+            the ids of the sections each tab is responsible for (None means all),
+            and whether every section any tab rendered is in some tab's share
+        """
+        # Every tab needs the sections rendered before it can work on its share
+        expanded = [False] * len(pages)
+        if self.loading == "tall":
+            expanded = await asyncio.gather(*(self._expand_viewport(page) for page in pages))
+        await asyncio.gather(*(self._scroll_main_page(page) for page, done in zip(pages, expanded) if not done))
+
+        ranks = await self._section_ranks(pages[0])
+        if not ranks:
+            # Nothing to split; the first tab scrapes the board on its own
+            shares = [None] + [set() for _ in pages[1:]]
+            if not expanded[0]:
+                await self._scroll_section_containers(pages[0])
+            return ranks, shares, True
+
+        # Tabs may number sections slightly differently, so each picks its share by rank from its own view
+        tab_ranks = [ranks] + list(await asyncio.gather(*(self._section_ranks(page) for page in pages[1:])))
+        shares = []
+        for seen, bounds in zip(tab_ranks, self._split_ranks(ranks, len(pages))):
+            if bounds is None:
+                shares.append(set())
+            else:
+                low, high = bounds
+                shares.append({section_id for section_id, rank in seen.items() if low <= rank < high})
+        print(f"Split {len(ranks)} sections between {len(pages)} tabs: {[len(share) for share in shares]}",
+              file=sys.stderr, flush=True)
+
+        # A section whose rank falls in a tab that doesn't show it is scraped by nobody
+        unassigned = set().union(*tab_ranks) - set().union(*shares)
+        if unassigned:
+            print(f"Warning: {len(unassigned)} section(s) fell outside every tab's share", file=sys.stderr)
+
+        await asyncio.gather(*(
+            self._scroll_section_containers(page, share)
+            for page, share, done in zip(pages, shares, expanded) if share and not done
+        ))
+        await pages[0].sleep(.2)
+        return ranks, shares, not unassigned
+
+    async def _section_ranks(self, page) -> dict[str, float]:
+        """Map the id of every rendered section to its data-rank."""
+        try:
+            result_json = await page.evaluate('''
+                JSON.stringify(Array.from(document.querySelectorAll('section[data-id][data-rank]'))
+                    .map(section => [section.getAttribute('data-id'), section.getAttribute('data-rank')]))
+            ''')
+            pairs = json.loads(result_json) if isinstance(result_json, str) else []
+        except Exception as e:
+            print(f"Warning: Could not read section ranks: {e}", file=sys.stderr)
+            return {}
+
+        ranks = {}
+        for position, (section_id, rank) in enumerate(pairs):
+            try:
+                ranks[section_id] = float(rank)
+            except (TypeError, ValueError):
+                ranks[section_id] = float(position)
+        return ranks
+
+    @staticmethod
+    def _split_ranks(ranks: dict[str, float], parts: int) -> list[Optional[tuple[float, float]]]:
+        """
+        Split sections into `parts` data-rank ranges holding about as many sections each.
+
+        The ranges are half-open, [low, high), and together cover every rank
+        (the first starts at -inf, the last ends at +inf), so a section another
+        tab numbers slightly differently still lands in exactly one range.
+        A part with no sections gets None.
+        """
+        ordered = sorted(ranks.values())
+        lows: list[Optional[float]] = []
+        for i in range(parts):
+            start, end = i * len(ordered) // parts, (i + 1) * len(ordered) // parts
+            lows.append(ordered[start] if start < end else None)
+
+        ranges: list[Optional[tuple[float, float]]] = [None] * parts
+        bounds = [i for i, low in enumerate(lows) if low is not None]
+        for n, i in enumerate(bounds):
+            low = float("-inf") if n == 0 else lows[i]
+            high = lows[bounds[n + 1]] if n + 1 < len(bounds) else float("inf")
+            ranges[i] = (low, high)
+        return ranges
+
+    @staticmethod
+    def _merge_sections(results: list[list[Section]], ranks: dict[str, float]) -> list[Section]:
+        """Merge sections extracted by several tabs, dropping duplicates and ordering by data-rank."""
+        merged: dict[str, Section] = {}
+        for sections in results:
+            for section in sections:
+                merged.setdefault(section.section_id, section)
+        return sorted(merged.values(), key=lambda section: ranks.get(section.section_id, float("inf")))
+
+    async def _navigate(self, target, url: str):
+        """Open the Padlet in target (a Browser or a Tab) and prepare the page for scraping."""
+        page = await target.get(url)
+
+        # Fail fast (and visibly to schedulers) when the host is throttling us
+        await self._check_response_status(page, url)
+
+        # Set viewport size in headless mode to fix scrolling/lazy-loading
+        if self.headless:
+            try:
+                await self._set_viewport(page)
+            except Exception as e:
+                print(f"Warning: Could not set viewport size: {e}")
+
+        return page
+
+    async def _set_viewport(self, page, height: int = 1080) -> None:
+        """Emulate a 1920px wide viewport of the given height."""
+        await page.send(
+            cdp.emulation.set_device_metrics_override(
+                width=1920, height=height,
+                device_scale_factor=1,
+                mobile=False,
+                # These two are important for changing window.screen.* values
+                screen_width=1920, screen_height=height,
+                position_x=0, position_y=0
+            )
+        )
+
+    async def _wait_for_load(self, page) -> None:
+        """Wait for the JavaScript-heavy board to render its sections."""
+        # Wait for the page to load - Padlets are JavaScript-heavy
+        await page.sleep(.5)  # Initial load time
+
+        # Try to wait for sections to appear
+        try:
+            await page.find('[data-testid="sectionTitleText"]', timeout=self.timeout)
+        except Exception:
+            # Padlet might not have sections, or they might be named differently
+            pass
+
+    async def _scroll(self, page) -> None:
+        """Scroll the board so that all lazy-loaded sections and posts are rendered."""
+        if self.loading == "tall" and await self._expand_viewport(page):
+            return
+
+        # First scroll the main page to load all sections/rows
+        await self._scroll_main_page(page)
+
+        # Then scroll individual section containers to load all posts
+        await self._scroll_section_containers(page)
+
+        # Wait for DOM to fully render all lazy-loaded content
+        await page.sleep(.2)
+
+    async def _expand_viewport(self, page) -> bool:
+        """
+        Render the whole board at once by making the viewport as tall as the board.
+
+        Section containers are un-clipped so their posts are inside the
+        viewport too, which lets Padlet's intersection-based lazy loading
+        fire for everything without scrolling. The viewport grows with the
+        board until the layout settles.
+
+        Returns:
+            True if everything fits and is visible; otherwise the normal
+            viewport is restored and False is returned so the caller scrolls
+        """
+        reason = None
+        try:
+            await page.evaluate(f'''
+                (function() {{
+                    if (document.getElementById("{_EXPAND_STYLE_ID}")) return;
+                    const style = document.createElement("style");
+                    style.id = "{_EXPAND_STYLE_ID}";
+                    style.textContent = '[id^="group-posts-"] {{ max-height: none !important; ' +
+                        'height: auto !important; overflow: visible !important; }}';
+                    document.head.appendChild(style);
+                }})()
+            ''')
+
+            previous = None
+            for _ in range(20):
+                layout = await self._layout(page)
+                if layout["height"] > TALL_VIEWPORT_MAX_HEIGHT:
+                    reason = f"board is {layout['height']}px tall"
+                    break
+                if layout == previous and layout["viewport"] >= layout["height"]:
+                    break  # Nothing new loaded since the last pass
+                if layout["viewport"] < layout["height"]:
+                    await self._set_viewport(page, layout["height"])
+                previous = layout
+                await page.sleep(0.1)
+            else:
+                reason = "layout did not settle"
+
+            if reason is None:
+                if not layout["sections"]:
+                    reason = "no sections rendered"
+                elif layout["clipped"]:
+                    reason = f"{layout['clipped']} section container(s) still clipped"
+                else:
+                    print(f"Tall viewport ({layout['height']}px) loaded {layout['sections']} sections, "
+                          f"{layout['posts']} posts", file=sys.stderr, flush=True)
+                    return True
+        except Exception as e:
+            reason = str(e)
+
+        print(f"Tall viewport loading failed ({reason}), falling back to scrolling", file=sys.stderr, flush=True)
+        try:
+            await page.evaluate(f'document.getElementById("{_EXPAND_STYLE_ID}")?.remove()')
+            if self.headless:
+                await self._set_viewport(page)
+            else:
+                await page.send(cdp.emulation.clear_device_metrics_override())
+        except Exception as e:
+            print(f"Warning: Could not restore viewport: {e}", file=sys.stderr)
+        return False
+
+    async def _layout(self, page) -> dict:
+        """Measure the board: its height, the viewport height and what is rendered."""
+        result_json = await page.evaluate('''
+            JSON.stringify({
+                height: Math.ceil(Math.max(document.documentElement.scrollHeight, document.body.scrollHeight)),
+                viewport: window.innerHeight,
+                sections: document.querySelectorAll('section[data-id][data-rank]').length,
+                posts: document.querySelectorAll('[data-testid="surfacePost"]').length,
+                clipped: Array.from(document.querySelectorAll('[id^="group-posts-"]'))
+                    .filter(c => c.scrollHeight - c.clientHeight > 1).length
+            })
+        ''')
+        return json.loads(result_json)
+
+    async def _extract(self, page, timeout: Optional[float] = None,
+                       section_ids: Optional[set[str]] = None) -> tuple[Optional[str], list[Section], bool]:
+        """
+        Extract the title and sections (only those in section_ids, if given), stopping when timeout runs out.
+
+        Returns:
+            (title, sections, complete) where complete is False if time ran out
+        """
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+
+        # Extract Padlet title
+        try:
+            title = await asyncio.wait_for(self._extract_title(page), timeout)
+        except asyncio.TimeoutError:
+            return None, [], False
+
+        # Extract all sections
+        remaining = None if timeout is None else max(0.0, timeout - (loop.time() - started))
+        sections, complete = await self._extract_sections(page, remaining, section_ids)
+        return title, sections, complete
+
+    async def _check_response_status(self, page, url: str) -> None:
+        """Raise ThrottledError if the main document came back with a throttling status."""
+        try:
+            status = await page.evaluate('''
+                (function() {
+                    const nav = performance.getEntriesByType('navigation')[0];
+                    return (nav && nav.responseStatus) || 0;
+                })()
+            ''')
+        except Exception:
+            return  # Older browsers don't expose responseStatus; assume success
+
+        if isinstance(status, int) and status in THROTTLE_STATUSES:
+            raise ThrottledError(url, status)
 
     async def _scroll_main_page(self, page) -> None:
         """Scroll the main page to load all sections/rows."""
@@ -159,12 +581,15 @@ class PadletScraper:
         except Exception as e:
             print(f"Warning: Error during main page scrolling: {e}", file=sys.stderr)
 
-    async def _scroll_section_containers(self, page) -> None:
-        """Scroll each section container to load all posts within sections."""
+    async def _scroll_section_containers(self, page, section_ids: Optional[set[str]] = None) -> None:
+        """Scroll each section container (only those of section_ids, if given) to load all posts within sections."""
         try:
             # Find all section containers with scrollable posts
             # These have class "overflow-y-auto" and id like "group-posts-{section_id}"
             scroll_containers = await page.query_selector_all('[class*="overflow-y-auto"][id^="group-posts-"]')
+            if section_ids is not None:
+                wanted = {f"group-posts-{section_id}" for section_id in section_ids}
+                scroll_containers = [c for c in scroll_containers if c.attrs.get('id') in wanted]
 
             print(f"Found {len(scroll_containers)} scrollable section containers", file=sys.stderr, flush=True)
 
@@ -224,34 +649,60 @@ class PadletScraper:
 
         return None
 
-    async def _extract_sections(self, page) -> list[Section]:
-        """Extract all sections/columns from the Padlet (parallelized)."""
+    async def _extract_sections(self, page, timeout: Optional[float] = None,
+                                section_ids: Optional[set[str]] = None) -> tuple[list[Section], bool]:
+        """
+        Extract all sections/columns (only those in section_ids, if given) from the Padlet (parallelized).
+
+        Sections that haven't finished when timeout runs out are cancelled and left out.
+
+        Returns:
+            (sections, complete) where complete is False if any section was cut off
+        """
+        loop = asyncio.get_running_loop()
+        started = loop.time()
         try:
             # Find all top-level sections (columns)
-            section_elements = await page.query_selector_all('section[data-id][data-rank]')
+            try:
+                section_elements = await asyncio.wait_for(
+                    page.query_selector_all('section[data-id][data-rank]'), timeout
+                )
+            except asyncio.TimeoutError:
+                return [], False
+            if section_ids is not None:
+                section_elements = [e for e in section_elements if e.attrs.get('data-id') in section_ids]
 
             # Create tasks for parallel extraction
             tasks = [
-                self._extract_single_section(page, section_element)
+                asyncio.ensure_future(self._extract_single_section(page, section_element))
                 for section_element in section_elements
             ]
-
-            # Process all sections in parallel
-            sections = await asyncio.gather(*tasks, return_exceptions=True)
-
-            # Filter out None values and exceptions
+            if not tasks:
+                return [], True
+
+            # Process all sections in parallel, within whatever time is left
+            remaining = None if timeout is None else max(0.0, timeout - (loop.time() - started))
+            done, pending = await asyncio.wait(tasks, timeout=remaining)
+            for task in pending:
+                task.cancel()
+            if pending:
+                print(f"Warning: Ran out of time with {len(pending)} section(s) still extracting", file=sys.stderr)
+
+            # Filter out None values, exceptions and sections that ran out of time
             valid_sections = []
-            for section in sections:
-                if isinstance(section, Section):
-                    valid_sections.append(section)
-                elif isinstance(section, Exception):
-                    print(f"Warning: Section extraction failed: {section}")
+            for task in tasks:
+                if task not in done:
+                    continue
+                if task.exception() is not None:
+                    print(f"Warning: Section extraction failed: {task.exception()}")
+                elif isinstance(task.result(), Section):
+                    valid_sections.append(task.result())
 
-            return valid_sections
+            return valid_sections, not pending
 
         except Exception as e:
             print(f"Error extracting sections: {e}")
-            return []
+            return [], True
 
     async def _extract_single_section(self, page, section_element) -> Optional[Section]:
         """Extract a single section/column from the Padlet."""
@@ -311,6 +762,7 @@ class PadletScraper:
                     }}
 
                     const postElements = section.querySelectorAll('[data-testid="surfacePost"]');
+                    const collectAttachments = {json.dumps(self.attachments)};
 
                     const normalize = (s) => {{
                         if (!s) return null;
@@ -343,6 +795,33 @@ class PadletScraper:
                         return normalize(clone.innerText || clone.textContent || '');
                     }};
 
+                    // Images, media and links outside the body (links in the body are
+                    // already inline Markdown); the kind of a link is refined in Python
+                    const getAttachments = (post, bodyEl) => {{
+                        const seen = new Set();
+                        const attachments = [];
+                        const add = (url, kind) => {{
+                            if (!url || !/^https?:/.test(url) || seen.has(url)) return;
+                            seen.add(url);
+                            attachments.push({{url: url, kind: kind}});
+                        }};
+                        post.querySelectorAll('img').forEach(img => {{
+                            // Skip avatars and icons
+                            if (img.naturalWidth && img.naturalWidth < 48) return;
+                            add(img.currentSrc || img.src, 'image');
+                        }});
+                        post.querySelectorAll('video, audio').forEach(media => {{
+                            const kind = media.tagName.toLowerCase();
+                            add(media.currentSrc || media.src, kind);
+                            media.querySelectorAll('source[src]').forEach(source => add(source.src, kind));
+                        }});
+                        post.querySelectorAll('a[href]').forEach(link => {{
+                            if (bodyEl && bodyEl.contains(link)) return;
+                            add(link.href, link.hasAttribute('download') ? 'file' : 'link');
+                        }});
+                        return attachments;
+                    }};
+
                     const posts = Array.from(postElements).map(post => {{
                         // Extract subject
                         const subjectEl = post.querySelector('[data-pw="postSubject"]');
@@ -389,11 +868,14 @@ class PadletScraper:
                             }}
                         }}
 
+                        const attachments = collectAttachments ? getAttachments(post, bodyEl) : [];
+
                         return {{
                             subject: subject,
-                            body: bodyText
+                            body: bodyText,
+                            attachments: attachments
                         }};
-                    }}).filter(post => post.subject || post.body);
+                    }}).filter(post => post.subject || post.body || post.attachments.length);
 
                     let sample = null;
                     try {{
@@ -445,7 +927,11 @@ class PadletScraper:
                 posts.append(Post(
                     subject=post_data.get('subject') or "Untitled",
                     body=post_data.get('body') or "",
-                    section_id=section_id
+                    section_id=section_id,
+                    attachments=[
+                        Attachment(url=a['url'], kind=attachment_kind(a['url'], a.get('kind')))
+                        for a in post_data.get('attachments') or []
+                    ]
                 ))
 
             return posts
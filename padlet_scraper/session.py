@@ -0,0 +1,343 @@
+"""Long-lived browser sessions with tab reuse and memory-based recycling."""
+
+import asyncio
+import contextlib
+import sys
+from typing import AsyncIterator, Optional
+import nodriver as uc
+from nodriver import cdp
+from pydantic import BaseModel, Field
+from .process import pid_alive, tree_rss_bytes
+
+_MB = 1024 * 1024
+
+
+async def launch_browser(headless: bool = True, browser_executable_path: Optional[str] = None, sandbox: bool = True):
+    """
+    Launch a browser through nodriver.
+
+    Args:
+        headless: Whether to run browser in headless mode
+        browser_executable_path: Path to browser executable (None lets nodriver find one)
+        sandbox: Whether to use Chrome sandbox
+
+    Returns:
+        The started nodriver Browser
+    """
+    try:
+        if browser_executable_path:
+            return await uc.start(
+                headless=headless,
+                browser_executable_path=browser_executable_path,
+                sandbox=sandbox
+            )
+        else:
+            return await uc.start(headless=headless, sandbox=sandbox)
+    except FileNotFoundError as e:
+        raise FileNotFoundError(
+            "Chrome/Chromium browser not found. Please either:\n"
+            "1. Install Chrome from https://www.google.com/chrome/\n"
+            "2. Or specify browser path: PadletScraper(browser_executable_path='/path/to/browser')\n"
+            "   Common paths:\n"
+            "   - Arc: '/Applications/Arc.app/Contents/MacOS/Arc'\n"
+            "   - Chrome: '/Applications/Google Chrome.app/Contents/MacOS/Google Chrome'\n"
+            "   - Brave: '/Applications/Brave Browser.app/Contents/MacOS/Brave Browser'\n"
+            "   - Edge: '/Applications/Microsoft Edge.app/Contents/MacOS/Microsoft Edge'"
+        ) from e
+
+
+def browser_pid(browser) -> Optional[int]:
+    """Return the OS pid of a nodriver Browser, if known."""
+    return getattr(browser, "_process_pid", None)
+
+
+class RecyclePolicy(BaseModel):
+    """When a BrowserSession replaces tabs and restarts its browser. None disables a limit."""
+
+    max_scrapes_per_tab: Optional[int] = Field(default=25, description="Close a tab after this many scrapes")
+    max_tab_heap_mb: Optional[float] = Field(default=512, description="Close a tab whose JS heap exceeds this (MB)")
+    max_scrapes_per_browser: Optional[int] = Field(default=250, description="Restart the browser after this many scrapes")
+    max_browser_rss_mb: Optional[float] = Field(default=3072, description="Restart the browser when its process tree RSS exceeds this (MB)")
+    heap_probe_timeout: float = Field(default=5.0, description="Seconds to wait for a tab's heap size; a tab that doesn't answer is closed")
+    rss_check_interval: float = Field(default=10.0, description="Minimum seconds between browser RSS checks (each one scans /proc)")
+
+
+class SessionStats(BaseModel):
+    """Snapshot of a BrowserSession's usage and memory footprint."""
+
+    running: bool = Field(description="Whether a browser is currently running")
+    tabs_open: int = Field(description="Tabs owned by the session (idle and in use)")
+    tabs_in_use: int = Field(description="Tabs currently leased to scrapes")
+    browser_scrapes: int = Field(description="Scrapes served by the current browser")
+    total_scrapes: int = Field(description="Scrapes served since the session started")
+    tab_recycles: int = Field(description="Tabs closed and replaced (policy limits, failures or discard())")
+    browser_restarts: int = Field(description="Browser restarts triggered by the recycle policy")
+    browser_rss_mb: Optional[float] = Field(default=None, description="RSS of the browser process tree (MB) at the last check (see BrowserSession.sample_rss())")
+
+
+class _TabState:
+    """Bookkeeping for one reusable tab."""
+
+    def __init__(self, tab):
+        self.tab = tab
+        self.scrapes = 0
+        self.dirty = False
+
+
+class BrowserSession:
+    """A browser that stays warm across scrapes, handing out reusable tabs.
+
+    Tabs are returned to an idle pool after each scrape and closed when the
+    RecyclePolicy says so (scrape count or JS heap size). When the browser
+    itself hits its scrape count or RSS limit (or its process has died), the
+    session stops handing out tabs, waits for in-flight scrapes to drain and
+    then restarts it.
+
+    Usage:
+        async with BrowserSession() as session:
+            scraper = PadletScraper(session=session)
+            padlet = await scraper.scrape(url)
+    """
+
+    def __init__(self, headless: bool = True, browser_executable_path: Optional[str] = None, sandbox: bool = True,
+                 policy: Optional[RecyclePolicy] = None):
+        """
+        Initialize the session (the browser is launched on first use).
+
+        Args:
+            headless: Whether to run browser in headless mode
+            browser_executable_path: Path to browser executable (None lets nodriver find one)
+            sandbox: Whether to use Chrome sandbox
+            policy: Tab and browser recycling limits (defaults to RecyclePolicy())
+        """
+        self.headless = headless
+        self.browser_executable_path = browser_executable_path
+        self.sandbox = sandbox
+        self.policy = policy or RecyclePolicy()
+
+        self.browser = None
+        self._idle: list[_TabState] = []
+        self._in_use: dict[int, _TabState] = {}
+        self._leases = 0
+        self._draining = False
+        self._browser_scrapes = 0
+        self._total_scrapes = 0
+        self._tab_recycles = 0
+        self._browser_restarts = 0
+        self._rss_checked_at: Optional[float] = None
+        self._rss: Optional[int] = None
+        self._changed: Optional[asyncio.Condition] = None
+
+    @property
+    def _cond(self) -> asyncio.Condition:
+        if self._changed is None:
+            self._changed = asyncio.Condition()
+        return self._changed
+
+    async def start(self) -> "BrowserSession":
+        """Launch the browser if it isn't running yet."""
+        if self.browser is None:
+            self.browser = await launch_browser(self.headless, self.browser_executable_path, self.sandbox)
+            self._browser_scrapes = 0
+            self._rss_checked_at = None
+            self._rss = None
+        return self
+
+    async def close(self) -> None:
+        """Close all tabs and stop the browser."""
+        async with self._cond:
+            await self._stop_browser()
+            self._cond.notify_all()
+
+    async def __aenter__(self) -> "BrowserSession":
+        return await self.start()
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+
+    async def _stop_browser(self) -> None:
+        browser, self.browser = self.browser, None
+        self._idle.clear()
+        if browser is None:
+            return
+        # IMPORTANT: nodriver Browser.stop() schedules async disconnect work
+        # on the current loop; give it a moment before moving on.
+        try:
+            browser.stop()
+        finally:
+            await asyncio.sleep(0.75)
+
+    @contextlib.asynccontextmanager
+    async def tab(self) -> AsyncIterator:
+        """
+        Lease a tab for one scrape.
+
+        The tab is returned to the idle pool afterwards unless the scrape
+        raised, the tab was marked with discard(), or the recycle policy
+        says it should be replaced.
+        """
+        async with self.tabs(1) as tabs:
+            yield tabs[0]
+
+    @contextlib.asynccontextmanager
+    async def tabs(self, count: int) -> AsyncIterator[list]:
+        """
+        Lease several tabs for one scrape (e.g. to split a board between them).
+
+        All tabs are leased together, so a pending browser restart can't
+        leave a scrape holding some of its tabs while waiting for the rest.
+        """
+        states = await self._acquire(count)
+        failed = False
+        try:
+            yield [state.tab for state in states]
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            await self._release(states, failed)
+
+    def discard(self, tab) -> None:
+        """Mark a leased tab to be closed instead of reused (e.g. after a timeout)."""
+        state = self._in_use.get(id(tab))
+        if state is not None:
+            state.dirty = True
+
+    async def _acquire(self, count: int) -> list[_TabState]:
+        async with self._cond:
+            # While draining for a browser restart, new work waits
+            await self._cond.wait_for(lambda: not self._draining)
+            await self.start()
+            states = [self._idle.pop() for _ in range(min(count, len(self._idle)))]
+            browser = self.browser
+            # Counted before the tabs exist so a restart can't pull the browser from under us
+            self._leases += count
+
+        try:
+            while len(states) < count:
+                states.append(_TabState(await browser.get("about:blank", new_tab=True)))
+        except BaseException:
+            async with self._cond:
+                self._idle.extend(states)
+                self._leases -= count
+                self._cond.notify_all()
+            raise
+        for state in states:
+            self._in_use[id(state.tab)] = state
+        return states
+
+    async def _release(self, states: list[_TabState], failed: bool) -> None:
+        # One lease is one scrape, however many tabs it used
+        self._browser_scrapes += 1
+        self._total_scrapes += 1
+
+        async def put_back(state: _TabState) -> None:
+            self._in_use.pop(id(state.tab), None)
+            state.scrapes += 1
+            if self.browser is None:
+                pass  # Session was closed while this tab was in use
+            elif failed or state.dirty or await self._tab_needs_recycling(state):
+                await self._close_tab(state)
+            else:
+                self._idle.append(state)
+
+        await asyncio.gather(*(put_back(state) for state in states))
+        needs_restart = self.browser is not None and not self._draining and await self._browser_needs_restart()
+
+        async with self._cond:
+            self._leases -= len(states)
+            if needs_restart and self.browser is not None:
+                self._draining = True
+            if self._draining and not self._leases:
+                self._browser_restarts += 1
+                print(f"Restarting browser after {self._browser_scrapes} scrapes", file=sys.stderr)
+                await self._stop_browser()
+                self._draining = False
+            self._cond.notify_all()
+
+    async def _close_tab(self, state: _TabState) -> None:
+        self._tab_recycles += 1
+        try:
+            await asyncio.wait_for(state.tab.close(), 5)
+        except Exception as e:
+            print(f"Warning: Could not close tab: {e}", file=sys.stderr)
+
+    async def _tab_needs_recycling(self, state: _TabState) -> bool:
+        limit = self.policy.max_scrapes_per_tab
+        if limit is not None and state.scrapes >= limit:
+            return True
+        if self.policy.max_tab_heap_mb is not None:
+            try:
+                heap = await asyncio.wait_for(self.tab_heap_bytes(state.tab), self.policy.heap_probe_timeout)
+            except asyncio.TimeoutError:
+                print("Warning: Tab did not report its heap size in time; replacing it", file=sys.stderr)
+                return True
+            if heap is not None and heap > self.policy.max_tab_heap_mb * _MB:
+                return True
+        return False
+
+    async def _browser_needs_restart(self) -> bool:
+        pid = browser_pid(self.browser)
+        if pid is not None and not pid_alive(pid):
+            return True  # Crashed, or killed by a scrape's watchdog
+        limit = self.policy.max_scrapes_per_browser
+        if limit is not None and self._browser_scrapes >= limit:
+            return True
+        if self.policy.max_browser_rss_mb is not None:
+            # Scanning /proc is slow on busy hosts: do it now and then, off the event loop
+            now = asyncio.get_running_loop().time()
+            if self._rss_checked_at is not None and now - self._rss_checked_at < self.policy.rss_check_interval:
+                return False
+            self._rss_checked_at = now
+            rss = await self.sample_rss()
+            if rss is not None and rss > self.policy.max_browser_rss_mb * _MB:
+                return True
+        return False
+
+    @staticmethod
+    async def tab_heap_bytes(tab) -> Optional[int]:
+        """Return the tab's used JS heap in bytes from the CDP Performance domain, if available."""
+        try:
+            await tab.send(cdp.performance.enable())
+            for metric in await tab.send(cdp.performance.get_metrics()):
+                if metric.name == "JSHeapUsedSize":
+                    return int(metric.value)
+        except Exception:
+            pass
+        try:
+            # Runtime.getHeapUsage: (usedSize, totalSize, ...)
+            usage = await tab.send(cdp.runtime.get_heap_usage())
+            return int(usage[0])
+        except Exception:
+            return None
+
+    def browser_rss_bytes(self) -> Optional[int]:
+        """Return the RSS of the browser process tree in bytes (from /proc), if known."""
+        pid = browser_pid(self.browser) if self.browser is not None else None
+        if pid is None:
+            return None
+        return tree_rss_bytes(pid) or None
+
+    async def sample_rss(self) -> Optional[int]:
+        """Measure the browser's RSS off the event loop (see browser_rss_bytes()) and remember it for stats()."""
+        self._rss = await asyncio.to_thread(self.browser_rss_bytes)
+        return self._rss
+
+    def stats(self) -> SessionStats:
+        """
+        Return a snapshot of the session's usage counters and memory footprint.
+
+        The RSS is the one last measured, by the recycle policy's checks or
+        by sample_rss(); scanning /proc here would block the event loop.
+        """
+        rss = self._rss if self.browser is not None else None
+        return SessionStats(
+            running=self.browser is not None,
+            tabs_open=len(self._idle) + len(self._in_use),
+            tabs_in_use=len(self._in_use),
+            browser_scrapes=self._browser_scrapes,
+            total_scrapes=self._total_scrapes,
+            tab_recycles=self._tab_recycles,
+            browser_restarts=self._browser_restarts,
+            browser_rss_mb=None if rss is None else round(rss / _MB, 1),
+        )
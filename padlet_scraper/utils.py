@@ -1,11 +1,88 @@
 """Utility functions for Padlet scraping."""
 
+import contextlib
 import json
+import os
+import uuid
 from pathlib import Path
-from typing import Union
+from typing import IO, Iterator, Union
 from .models import Padlet
 
 
+def _create_temp(output_path: Path) -> tuple[int, str]:
+    """Create a new, unique temporary file next to output_path; return (fd, name)."""
+    while True:
+        tmp_name = str(output_path.parent / f".{output_path.name}.{uuid.uuid4().hex[:12]}.tmp")
+        try:
+            # Created like open() would (0666 minus the umask), without
+            # touching the process-wide umask that other threads rely on
+            return os.open(tmp_name, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0), 0o666), tmp_name
+        except FileExistsError:
+            continue
+
+
+@contextlib.contextmanager
+def atomic_write(output_path: Union[str, Path], mode: str = 'w', encoding: str = 'utf-8') -> Iterator[IO]:
+    """
+    Open a temporary file next to output_path and rename it into place on success.
+
+    Readers never see a half-written file: either the previous contents or the
+    complete new contents are visible. If the block raises, the temporary file
+    is removed and output_path is left untouched.
+
+    Args:
+        output_path: Final path of the file
+        mode: File mode for the temporary file ('w' or 'wb')
+        encoding: Text encoding (ignored in binary mode)
+    """
+    output_path = Path(output_path)
+    fd, tmp_name = _create_temp(output_path)
+    try:
+        if 'b' in mode:
+            f = os.fdopen(fd, mode)
+        else:
+            f = os.fdopen(fd, mode, encoding=encoding)
+        with f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_name, output_path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_name)
+        raise
+
+
+def write_json(padlet: Padlet, f: IO[str]) -> None:
+    """Write Padlet data as indented JSON to an open text file."""
+    json.dump(padlet.model_dump(), f, indent=2, ensure_ascii=False)
+
+
+def write_markdown(padlet: Padlet, f: IO[str]) -> None:
+    """Stream the Markdown rendering of a Padlet to an open text file."""
+    for chunk in padlet.iter_markdown():
+        f.write(chunk)
+
+
+def write_jsonl(padlet: Padlet, f: IO[str]) -> None:
+    """
+    Write one JSON object per post to an open text file.
+
+    Every line carries the board and section it belongs to, so JSONL files
+    from many boards can be concatenated and processed line by line.
+    """
+    for section in padlet.sections:
+        for post in section.posts:
+            record = {
+                "url": padlet.url,
+                "title": padlet.title,
+                "section_title": section.title,
+                **post.model_dump(),
+            }
+            f.write(json.dumps(record, ensure_ascii=False))
+            f.write("\n")
+
+
 def save_to_json(padlet: Padlet, output_path: Union[str, Path]) -> None:
     """
     Save Padlet data to a JSON file.
@@ -14,10 +91,8 @@ def save_to_json(padlet: Padlet, output_path: Union[str, Path]) -> None:
         padlet: The Padlet object to save
         output_path: Path where the JSON file should be saved
     """
-    output_path = Path(output_path)
-
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(padlet.model_dump(), f, indent=2, ensure_ascii=False)
+    with atomic_write(output_path) as f:
+        write_json(padlet, f)
 
 
 def save_to_markdown(padlet: Padlet, output_path: Union[str, Path]) -> None:
@@ -28,10 +103,20 @@ def save_to_markdown(padlet: Padlet, output_path: Union[str, Path]) -> None:
         padlet: The Padlet object to save
         output_path: Path where the Markdown file should be saved
     """
-    output_path = Path(output_path)
+    with atomic_write(output_path) as f:
+        write_markdown(padlet, f)
+
+
+def save_to_jsonl(padlet: Padlet, output_path: Union[str, Path]) -> None:
+    """
+    Save Padlet posts to a JSON Lines file (one post per line).
 
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(padlet.to_markdown())
+    Args:
+        padlet: The Padlet object to save
+        output_path: Path where the JSONL file should be saved
+    """
+    with atomic_write(output_path) as f:
+        write_jsonl(padlet, f)
 
 
 def load_from_json(json_path: Union[str, Path]) -> Padlet:
@@ -0,0 +1,201 @@
+"""Worker that scrapes jobs leased from a coordinator (see coordinator.py)."""
+
+import asyncio
+import json
+import os
+import socket
+import sys
+from typing import Optional
+from .coordinator import LeaseLostError
+from .httpclient import HttpPool
+from .scraper import PadletScraper
+
+
+class Worker:
+    """Leases jobs from a coordinator and scrapes them with a local concurrency limit.
+
+    Leases are renewed in the background while a scrape runs. If the
+    coordinator says a lease was lost (it expired and the job went to
+    another worker), the scrape is cancelled.
+
+    Usage:
+        async with BrowserSession() as session:
+            worker = Worker("http://127.0.0.1:8700", PadletScraper(session=session), concurrency=2)
+            await worker.run()
+    """
+
+    def __init__(self, coordinator_url: str, scraper: Optional[PadletScraper] = None, concurrency: int = 2,
+                 name: Optional[str] = None, lease_timeout: Optional[float] = None, poll_interval: float = 2.0,
+                 http_pool: Optional[HttpPool] = None):
+        """
+        Initialize the worker.
+
+        Args:
+            coordinator_url: Base URL of the coordinator, e.g. http://127.0.0.1:8700
+            scraper: Scraper to run jobs with (a default PadletScraper if None)
+            concurrency: Maximum number of jobs scraped at once
+            name: Worker name shown in the coordinator's stats (host-pid by default)
+            lease_timeout: Lease length to ask for (the coordinator's default if None)
+            poll_interval: Seconds between lease requests while the queue is empty
+            http_pool: Connection pool for talking to the coordinator
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        self.coordinator_url = coordinator_url.rstrip("/")
+        self.scraper = scraper or PadletScraper()
+        self.concurrency = concurrency
+        self.name = name or f"{socket.gethostname()}-{os.getpid()}"
+        self.lease_timeout = lease_timeout
+        self.poll_interval = poll_interval
+        self.http_pool = http_pool or HttpPool(max_per_host=concurrency + 1)
+
+        self.completed = 0
+        self.failed = 0
+        self.lost = 0
+        self._stopping = False
+
+    async def _call(self, path: str, payload: dict) -> dict:
+        response = await self.http_pool.apost(
+            self.coordinator_url + path,
+            json.dumps(payload).encode("utf-8"),
+            {"Content-Type": "application/json"},
+        )
+        if response.status == 409:
+            raise LeaseLostError(path.split("/")[2] if path.startswith("/jobs/") else path)
+        response.raise_for_status()
+        return json.loads(response.text())
+
+    async def _report(self, job: dict, action: str, payload: dict, attempts: int = 3) -> None:
+        """Send complete/fail/release for a job, retrying while the coordinator is unreachable.
+
+        Retrying is safe: the coordinator answers a repeated report for the
+        same lease as it did the first time instead of applying it again.
+        """
+        for attempt in range(attempts):
+            try:
+                await self._call(f"/jobs/{job['id']}/{action}", {"lease": job["lease"], **payload})
+                return
+            except LeaseLostError:
+                raise
+            except Exception as e:
+                if attempt == attempts - 1:
+                    raise
+                print(f"Warning: Could not {action} job {job['id']}: {e}", file=sys.stderr)
+                await asyncio.sleep(self.poll_interval)
+
+    async def _keep_leased(self, job: dict, scrape: asyncio.Future) -> None:
+        """Renew the job's lease until the scrape finishes; cancel the scrape if the lease is lost."""
+        expires_in = job["expires_in"]
+        while True:
+            await asyncio.sleep(expires_in / 3)
+            try:
+                payload = {"lease": job["lease"]}
+                if self.lease_timeout:
+                    payload["lease_timeout"] = self.lease_timeout
+                expires_in = (await self._call(f"/jobs/{job['id']}/renew", payload))["expires_in"]
+            except LeaseLostError:
+                print(f"Lost lease on {job['url']}, abandoning it", file=sys.stderr, flush=True)
+                job["lost"] = True
+                scrape.cancel()
+                return
+            except Exception as e:
+                # The coordinator may be restarting; keep scraping and try again
+                print(f"Warning: Could not renew lease on {job['url']}: {e}", file=sys.stderr)
+
+    async def _process(self, job: dict) -> None:
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        scrape = asyncio.ensure_future(self.scraper.scrape(job["url"]))
+        renewer = asyncio.ensure_future(self._keep_leased(job, scrape))
+        try:
+            try:
+                padlet = await scrape
+            finally:
+                renewer.cancel()
+        except asyncio.CancelledError:
+            if job.get("lost"):
+                self.lost += 1
+                return
+            # The worker is shutting down; hand the job back for someone else
+            try:
+                await asyncio.wait_for(self._call(f"/jobs/{job['id']}/release", {"lease": job["lease"]}), 5)
+            except Exception:
+                pass  # The lease will expire instead
+            raise
+        except Exception as e:
+            print(f"Failed {job['url']}: {e}", file=sys.stderr, flush=True)
+            self.failed += 1
+            try:
+                await self._report(job, "fail", {"error": f"{type(e).__name__}: {e}"})
+            except Exception as report_error:
+                print(f"Warning: Could not report failure: {report_error}", file=sys.stderr)
+            return
+
+        try:
+            await self._report(job, "complete", {
+                "result": padlet.model_dump(),
+                "duration": round(loop.time() - started, 3),
+            })
+        except LeaseLostError:
+            self.lost += 1
+            print(f"Lost lease on {job['url']} before its result was accepted", file=sys.stderr, flush=True)
+            return
+        except Exception as e:
+            # Still unreachable after the retries; the lease will expire and the job be retried
+            self.failed += 1
+            print(f"Warning: Could not report result of {job['url']}: {e}", file=sys.stderr, flush=True)
+            return
+        self.completed += 1
+        print(f"✓ {job['url']}: {len(padlet.sections)} sections, {padlet.total_posts} posts",
+              file=sys.stderr, flush=True)
+
+    async def run(self, exit_when_idle: bool = False) -> None:
+        """
+        Lease and scrape jobs until stop() is called (or no jobs are left, if exit_when_idle).
+
+        Args:
+            exit_when_idle: Return once every job on the coordinator has been completed or failed
+        """
+        running: set[asyncio.Future] = set()
+        try:
+            while not self._stopping:
+                free = self.concurrency - len(running)
+                jobs = []
+                pending = None
+                if free > 0:
+                    payload = {"worker": self.name, "max_jobs": free}
+                    if self.lease_timeout:
+                        payload["lease_timeout"] = self.lease_timeout
+                    try:
+                        leased = await self._call("/lease", payload)
+                        jobs, pending = leased["jobs"], leased.get("pending")
+                    except Exception as e:
+                        print(f"Warning: Could not lease jobs from {self.coordinator_url}: {e}", file=sys.stderr)
+                for job in jobs:
+                    running.add(asyncio.ensure_future(self._process(job)))
+
+                if exit_when_idle and not running and pending == 0:
+                    break
+                if jobs and len(running) < self.concurrency:
+                    continue  # The queue may hold more; ask again right away
+
+                if running:
+                    done, running = await asyncio.wait(
+                        running, timeout=self.poll_interval, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    running = set(running)
+                    for task in done:
+                        if not task.cancelled() and task.exception() is not None:
+                            print(f"Warning: Job task failed: {task.exception()!r}", file=sys.stderr, flush=True)
+                else:
+                    await asyncio.sleep(self.poll_interval)
+        finally:
+            for task in running:
+                task.cancel()
+            await asyncio.gather(*running, return_exceptions=True)
+            self.http_pool.close()
+            self.scraper.close()
+
+    def stop(self) -> None:
+        """Stop leasing new jobs; run() cancels and releases the ones in progress."""
+        self._stopping = True
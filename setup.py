@@ -20,6 +20,9 @@ setup(
         "nodriver>=0.37",
         "pydantic>=2.0.0",
     ],
+    extras_require={
+        "zstd": ["zstandard>=0.15"],
+    },
     entry_points={
         "console_scripts": [
             "padlet-scraper=padlet_scraper.cli:main",
@@ -0,0 +1,133 @@
+"""Shared fixtures: a local stand-in for padlet.com and a stand-in browser."""
+
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+BOARD_HTML = """<html><head><title>{title}</title></head><body><h1>{title}</h1>
+<section data-id="s1" data-rank="1"><h2 data-testid="sectionTitleText">Ideas</h2>
+<div data-testid="surfacePost"><div data-pw="postSubject">First</div><div data-pw="postBody"><p>Hello</p></div></div>
+</section>
+<script>window.__STARTING_STATE__ = {{"wall": {{"posts_count": 1}}}};</script>
+</body></html>"""
+
+
+class FakeTab:
+    """A tab whose CDP commands fail (or hang)."""
+
+    def __init__(self, hang: bool = False):
+        self.hang = hang
+        self.closed = False
+
+    async def send(self, command):
+        if self.hang:
+            await asyncio.sleep(30)
+        raise RuntimeError("no CDP here")
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    """Enough of a nodriver Browser for BrowserSession; pid may be a real process."""
+
+    def __init__(self, hang: bool = False, pid: int = None):
+        self.hang = hang
+        self._process_pid = pid
+        self.tabs: list[FakeTab] = []
+        self.stopped = False
+
+    async def get(self, url, new_tab=False):
+        tab = FakeTab(self.hang)
+        self.tabs.append(tab)
+        return tab
+
+    def stop(self):
+        self.stopped = True
+
+
+class Route:
+    """What the stand-in server answers for one path."""
+
+    def __init__(self, body: bytes = b"", status: int = 200, content_type: str = "text/html; charset=utf-8",
+                 delay: float = 0.0, headers: dict = None):
+        self.body = body
+        self.status = status
+        self.content_type = content_type
+        self.delay = delay
+        self.headers = headers or {}
+
+
+class StandInServer:
+    """Local HTTP server with per-path responses, injected latency and throttling.
+
+    Requests are logged as (host header, path, time) so tests can check
+    which host saw what and when.
+    """
+
+    def __init__(self):
+        self.routes: dict[str, Route] = {}
+        self.requests: list[tuple[str, str, float]] = []
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                path = self.path.split("?")[0]
+                with server._lock:
+                    server.requests.append((self.headers.get("Host", ""), path, time.monotonic()))
+                    server.active += 1
+                    server.peak = max(server.peak, server.active)
+                try:
+                    route = server.routes.get(path) or Route(b"not found", status=404, content_type="text/plain")
+                    if route.delay:
+                        time.sleep(route.delay)
+                    self.send_response(route.status)
+                    self.send_header("Content-Type", route.content_type)
+                    self.send_header("Content-Length", str(len(route.body)))
+                    for key, value in route.headers.items():
+                        self.send_header(key, value)
+                    self.end_headers()
+                    self.wfile.write(route.body)
+                finally:
+                    with server._lock:
+                        server.active -= 1
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_port
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def url(self, path: str, host: str = "127.0.0.1") -> str:
+        """URL of a path; use host="localhost" to look like a second host."""
+        return f"http://{host}:{self.port}{path}"
+
+    def board(self, path: str, title: str = "Board", **route_kwargs) -> str:
+        """Serve a small, complete server-rendered board at path and return its URL."""
+        self.routes[path] = Route(BOARD_HTML.format(title=title).encode("utf-8"), **route_kwargs)
+        return self.url(path)
+
+    def hits(self, path: str) -> int:
+        return sum(1 for _, p, _ in self.requests if p == path)
+
+    def close(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+@pytest.fixture
+def stand_in():
+    server = StandInServer()
+    yield server
+    server.close()
@@ -0,0 +1,194 @@
+"""A stand-in for Chrome that answers the scraper's CDP commands from a synthetic board.
+
+FakeSession can be passed to PadletScraper(session=...) (or wrapped in a
+RecordingSession), so the browser path runs without a browser.
+"""
+
+import asyncio
+import contextlib
+import json
+import re
+
+import nodriver as uc
+
+
+def _node(node_id: int, name: str, attrs=(), children=(), value: str = "") -> dict:
+    return {
+        "nodeId": node_id, "backendNodeId": node_id, "nodeType": 3 if name == "#text" else 1,
+        "nodeName": name.upper(), "localName": "" if name == "#text" else name, "nodeValue": value,
+        "childNodeCount": len(children), "children": list(children), "attributes": list(attrs),
+    }
+
+
+def _string(value) -> dict:
+    text = json.dumps(value)
+    return {"result": {"type": "string", "value": text, "deepSerializedValue": {"type": "string", "value": text}}}
+
+
+_FRAME = {
+    "id": "F", "loaderId": "L", "url": "https://padlet.com/", "domainAndRegistry": "padlet.com",
+    "securityOrigin": "https://padlet.com", "mimeType": "text/html", "secureContextType": "Secure",
+    "crossOriginIsolatedContextType": "NotIsolated", "gatedAPIFeatures": [],
+}
+
+
+class Board:
+    """A board's DOM and the answers to the scraper's JavaScript."""
+
+    def __init__(self, title: str, sections: list[tuple[str, int, str, list[tuple[str, str]]]],
+                 searchable_after: int = 0):
+        """
+        Args:
+            title: Board title (the <h1>)
+            sections: (section id, data-rank, title, [(subject, body), ...]) per section
+            searchable_after: DOM.performSearch calls that find nothing before the
+                              section titles show up (-1: never), to make Tab.find poll
+        """
+        self.title = title
+        self.sections = sections
+        self.searchable_after = searchable_after
+        self.searches = 0
+        self.board_height = 6000
+        self.viewport = 1080
+        ids = iter(range(10, 10 ** 6))
+        self.section_nodes: dict[int, str] = {}
+        self.title_nodes: dict[int, int] = {}
+        children = []
+        for section_id, rank, section_title, _ in sections:
+            title_id = next(ids)
+            title_node = _node(title_id, "h2", ["data-testid", "sectionTitleText"],
+                               [_node(next(ids), "#text", value=section_title)])
+            node_id = next(ids)
+            self.section_nodes[node_id] = section_id
+            self.title_nodes[node_id] = title_id
+            children.append(_node(node_id, "section", ["data-id", section_id, "data-rank", str(rank)], [title_node]))
+        self.h1 = next(ids)
+        body = _node(3, "body", [], [_node(self.h1, "h1", [], [_node(next(ids), "#text", value=title)])] + children)
+        self.document = {
+            "nodeId": 1, "backendNodeId": 1, "nodeType": 9, "nodeName": "#document", "localName": "",
+            "nodeValue": "", "childNodeCount": 1, "children": [_node(2, "html", [], [body])],
+        }
+
+    def handle(self, method: str, params: dict) -> dict:
+        if method == "Page.navigate":
+            return {"frameId": "F", "loaderId": "L"}
+        if method == "Page.getFrameTree":
+            return {"frameTree": {"frame": _FRAME}}
+        if method == "Target.getTargets":
+            return {"targetInfos": []}
+        if method == "DOM.getDocument":
+            return {"root": self.document}
+        if method == "DOM.performSearch":
+            self.searches += 1
+            found = self.searchable_after >= 0 and self.searches > self.searchable_after
+            return {"searchId": f"search{self.searches}", "resultCount": len(self.title_nodes) if found else 0}
+        if method == "DOM.getSearchResults":
+            return {"nodeIds": list(self.title_nodes.values())}
+        if method == "DOM.querySelectorAll":
+            return {"nodeIds": list(self.section_nodes) if params["selector"].startswith("section") else []}
+        if method == "DOM.querySelector":
+            if params["selector"] == "h1":
+                return {"nodeId": self.h1}
+            return {"nodeId": self.title_nodes.get(params["nodeId"], 0)}
+        if method == "DOM.resolveNode":
+            return {"object": {"type": "object", "objectId": f"o{params.get('backendNodeId')}"}}
+        if method == "Runtime.evaluate":
+            return self._evaluate(params["expression"])
+        if method == "Emulation.setDeviceMetricsOverride":
+            self.viewport = params["height"]
+            return {}
+        if method.startswith(("Emulation.", "Performance.", "DOM.")):
+            return {}
+        raise uc.ProtocolException({"code": -32601, "message": f"'{method}' wasn't found"})
+
+    def _evaluate(self, expression: str) -> dict:
+        if "clipped:" in expression:
+            return _string({
+                "height": self.board_height, "viewport": self.viewport, "sections": len(self.sections),
+                "posts": sum(len(posts) for *_, posts in self.sections),
+                "clipped": 0 if self.viewport >= self.board_height else 3,
+            })
+        if "getAttribute('data-rank')" in expression:
+            return _string([[section_id, str(rank)] for section_id, rank, _, _ in self.sections])
+        if "responseStatus" in expression:
+            return {"result": {"type": "number", "value": 200, "deepSerializedValue": {"type": "number", "value": 200}}}
+        match = re.search(r'section\[data-id="([^"]+)"\]', expression)
+        if match:
+            posts = next(p for section_id, _, _, p in self.sections if section_id == match.group(1))
+            return _string({"posts": [{"subject": subject, "body": body} for subject, body in posts]})
+        if "getElementById" in expression:
+            return {"result": {"type": "number", "value": 0}}
+        return {"result": {"type": "undefined"}}
+
+
+class FakeTab(uc.Tab):
+    """A nodriver Tab backed by a Board; one command at a time, like a renderer."""
+
+    def __init__(self, board: Board, latency: float = 0.0, real_sleep: bool = False):
+        super().__init__()
+        self.board = board
+        self.latency = latency
+        self.real_sleep = real_sleep
+        self.commands = 0
+        self._renderer = asyncio.Lock()
+
+    async def send(self, cdp_obj, *args, **kwargs):
+        request = next(cdp_obj)
+        async with self._renderer:
+            await asyncio.sleep(self.latency)
+        self.commands += 1
+        result = self.board.handle(request["method"], request.get("params") or {})
+        try:
+            cdp_obj.send(result)
+        except StopIteration as e:
+            return e.value
+
+    async def get(self, url: str = "about:blank", new_tab: bool = False, new_window: bool = False):
+        await self.send(uc.cdp.page.navigate(url))
+        return self
+
+    async def attach(self, *args, **kwargs) -> None:
+        pass
+
+    async def sleep(self, t: float = 1) -> None:
+        await asyncio.sleep(t if self.real_sleep else 0)
+
+    async def close(self) -> None:
+        pass
+
+
+class FakeSession:
+    """Hands out FakeTabs over one Board, like a BrowserSession."""
+
+    def __init__(self, board: Board, latency: float = 0.0, real_sleep: bool = False):
+        self.board = board
+        self.latency = latency
+        self.real_sleep = real_sleep
+        self.leased: list[FakeTab] = []
+
+    async def start(self) -> "FakeSession":
+        return self
+
+    async def close(self) -> None:
+        pass
+
+    @contextlib.asynccontextmanager
+    async def tab(self):
+        async with self.tabs(1) as tabs:
+            yield tabs[0]
+
+    @contextlib.asynccontextmanager
+    async def tabs(self, count: int):
+        tabs = [FakeTab(self.board, self.latency, self.real_sleep) for _ in range(count)]
+        self.leased.extend(tabs)
+        yield tabs
+
+    def discard(self, tab) -> None:
+        pass
+
+
+def make_board(sections: int = 5, posts: int = 4, **kwargs) -> Board:
+    return Board("Fake Board", [
+        (f"s{i}", i, f"Section {i}", [(f"Post {i}.{j}", f"Body {i} {j}") for j in range(posts)])
+        for i in range(sections)
+    ], **kwargs)
@@ -0,0 +1,115 @@
+"""Tests for the chunked, compressed board archive."""
+
+import gzip
+import json
+
+import pytest
+
+from padlet_scraper import archive as archive_module
+from padlet_scraper.archive import ArchiveReader, ArchiveWriter, default_codec, index_path, iter_archive, save_to_archive
+from padlet_scraper.models import Attachment, Padlet, Post, Section
+
+
+def make_padlets(count: int) -> list[Padlet]:
+    return [
+        Padlet(
+            url=f"https://padlet.com/user/board-{i}",
+            title=f"Board {i}",
+            sections=[Section(title="Ideas", section_id=f"s{i}", posts=[
+                Post(subject=f"Post {i}", body="Line one\nLine two ✓", section_id=f"s{i}",
+                     attachments=[Attachment(url=f"https://example.com/{i}.png", kind="image")]),
+            ])],
+            partial=i % 2 == 1,
+        )
+        for i in range(count)
+    ]
+
+
+CODECS = ["gzip"] + (["zstd"] if archive_module.zstandard is not None else [])
+
+
+@pytest.mark.parametrize("codec", CODECS)
+def test_round_trip(tmp_path, codec):
+    padlets = make_padlets(25)
+    path = tmp_path / "boards.pjz"
+    save_to_archive(padlets, path, codec=codec, chunk_bytes=2000)
+
+    reader = ArchiveReader(path)
+    assert reader.codec == codec
+    assert len(reader.index["chunks"]) > 1
+    assert list(reader) == padlets
+    assert len(reader) == 25
+    assert reader.urls() == [p.url for p in padlets]
+
+
+def test_index_lookup_decompresses_one_chunk(tmp_path, monkeypatch):
+    padlets = make_padlets(40)
+    path = tmp_path / "boards.pjz"
+    save_to_archive(padlets, path, codec="gzip", chunk_bytes=1500)
+
+    calls = []
+    decompress = archive_module._decompress
+    monkeypatch.setattr(archive_module, "_decompress", lambda codec, data: calls.append(1) or decompress(codec, data))
+    reader = ArchiveReader(path)
+    assert reader.load(padlets[23].url) == padlets[23]
+    assert len(calls) == 1
+    assert padlets[5].url in reader
+    with pytest.raises(KeyError):
+        reader.load("https://padlet.com/user/missing")
+
+
+def test_later_board_shadows_earlier_and_append(tmp_path):
+    path = tmp_path / "boards.pjz"
+    first, second = make_padlets(2)
+    save_to_archive([first, second], path, codec="gzip")
+    updated = first.model_copy(update={"title": "Renamed"})
+    with ArchiveWriter(path, append=True) as writer:
+        writer.write(updated)
+
+    reader = ArchiveReader(path)
+    assert reader.load(first.url).title == "Renamed"
+    assert len(reader) == 3
+    with pytest.raises(ValueError):
+        ArchiveWriter(path, codec="zstd" if reader.codec == "gzip" else "gzip", append=True)
+
+
+@pytest.mark.parametrize("codec", CODECS)
+def test_readable_without_index(tmp_path, codec):
+    padlets = make_padlets(10)
+    path = tmp_path / "boards.pjz"
+    save_to_archive(padlets, path, codec=codec, chunk_bytes=1000)
+    index_path(path).unlink()
+
+    reader = ArchiveReader(path)
+    assert reader.index is None and reader.codec == codec
+    assert list(iter_archive(path)) == padlets
+    assert reader.load(padlets[7].url) == padlets[7]
+    assert len(reader) == 10
+
+
+def test_stale_index_is_ignored(tmp_path):
+    path = tmp_path / "boards.pjz"
+    save_to_archive(make_padlets(3), path, codec="gzip")
+    with open(path, "ab") as f:
+        f.write(gzip.compress(make_padlets(4)[3].model_dump_json().encode("utf-8") + b"\n"))
+    reader = ArchiveReader(path)
+    assert reader.index is None
+    assert len(reader) == 4
+
+
+def test_gzip_archive_is_plain_jsonl_when_decompressed(tmp_path):
+    padlets = make_padlets(5)
+    path = tmp_path / "boards.pjz"
+    save_to_archive(padlets, path, codec="gzip", chunk_bytes=500)
+    lines = gzip.decompress(path.read_bytes()).decode("utf-8").splitlines()
+    assert [json.loads(line)["url"] for line in lines] == [p.url for p in padlets]
+
+
+def test_gzip_fallback_without_zstandard(tmp_path, monkeypatch):
+    monkeypatch.setattr(archive_module, "zstandard", None)
+    assert default_codec() == "gzip"
+    path = tmp_path / "boards.pjz"
+    save_to_archive(make_padlets(3), path)
+    assert ArchiveReader(path).codec == "gzip"
+    with pytest.raises(ImportError):
+        ArchiveWriter(tmp_path / "other.pjz", codec="zstd")
@@ -0,0 +1,87 @@
+"""Tests for attachment downloads and how they fit within a scrape's deadline."""
+
+import asyncio
+import threading
+import time
+
+from conftest import Route
+from padlet_scraper import PadletScraper
+from padlet_scraper.attachments import AttachmentCache, AttachmentFetcher
+from padlet_scraper.models import Attachment, Padlet, Post, Section
+
+
+def _board(url: str, attachment_urls: list[str]) -> Padlet:
+    posts = [Post(subject=f"Post {i}", body="", attachments=[Attachment(url=u, kind="image")])
+             for i, u in enumerate(attachment_urls)]
+    return Padlet(url=url, title="Board", sections=[Section(title="Section", posts=posts)])
+
+
+def test_fetch_timeout_leaves_slow_downloads_unfinished(stand_in, tmp_path):
+    stand_in.routes["/fast.png"] = Route(b"fast", content_type="image/png")
+    stand_in.routes["/slow.png"] = Route(b"slow", content_type="image/png", delay=1.0)
+    fetcher = AttachmentFetcher(AttachmentCache(tmp_path))
+
+    async def run():
+        padlet = _board("board", [stand_in.url("/fast.png"), stand_in.url("/slow.png")])
+        started = time.monotonic()
+        stats = await fetcher.fetch(padlet, timeout=0.4)
+        assert time.monotonic() - started < 0.9
+        fast, slow = (post.attachments[0] for post in padlet.sections[0].posts)
+        assert fast.cache_key is not None and slow.cache_key is None
+        assert stats.downloaded == 1 and stats.unfinished == 1 and padlet.partial
+
+        # The slow download kept going; waiting for it again doesn't fetch it twice
+        again = _board("board", [stand_in.url("/slow.png")])
+        stats = await fetcher.fetch(again)
+        assert again.sections[0].posts[0].attachments[0].cache_key is not None
+        assert stats.unfinished == 0 and not again.partial
+
+    asyncio.run(run())
+    fetcher.close()
+    assert stand_in.hits("/slow.png") == 1
+
+
+def test_scrape_deadline_covers_attachment_downloads(monkeypatch, stand_in, tmp_path):
+    stand_in.routes["/slow.png"] = Route(b"slow", content_type="image/png", delay=2.0)
+    fetcher = AttachmentFetcher(AttachmentCache(tmp_path))
+
+    async def scrape_board(self, url, deadline):
+        return _board(url, [stand_in.url("/slow.png")])
+
+    monkeypatch.setattr(PadletScraper, "_scrape_board", scrape_board)
+    scraper = PadletScraper(deadline=0.5, attachment_fetcher=fetcher)
+
+    async def run():
+        started = time.monotonic()
+        padlet = await scraper.scrape("https://padlet.com/user/board")
+        return padlet, time.monotonic() - started
+
+    padlet, took = asyncio.run(run())
+    fetcher.close()
+    assert took < 1.5
+    assert padlet.partial
+    assert padlet.sections[0].posts[0].attachments[0].cache_key is None
+
+
+def test_cache_lookup_runs_off_the_event_loop(stand_in, tmp_path):
+    stand_in.routes["/a.png"] = Route(b"a", content_type="image/png")
+    cache = AttachmentCache(tmp_path)
+    fetcher = AttachmentFetcher(cache)
+    lookup = cache.lookup
+    threads = []
+
+    def recording_lookup(url):
+        threads.append(threading.current_thread())
+        return lookup(url)
+
+    cache.lookup = recording_lookup
+
+    async def run():
+        await fetcher.fetch(_board("one", [stand_in.url("/a.png")]))
+        stats = await fetcher.fetch(_board("two", [stand_in.url("/a.png")]))
+        assert stats.cached == 1 and stats.downloaded == 0
+
+    asyncio.run(run())
+    fetcher.close()
+    assert len(threads) == 2
+    assert all(thread is not threading.main_thread() for thread in threads)
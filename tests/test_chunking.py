@@ -0,0 +1,179 @@
+"""Tests for chunking boards and caching per-chunk results."""
+
+import asyncio
+import hashlib
+import threading
+
+import pytest
+
+from padlet_scraper.chunking import (
+    ChunkProcessor, FakeModel, FileChunkCache, MemoryChunkCache, chunk_padlet, estimate_tokens,
+)
+from padlet_scraper.models import Padlet, Post, Section
+
+
+def make_padlet(sections: int = 4, posts: int = 40, edit=None, insert=None) -> Padlet:
+    """A board whose posts vary in length; edit=(i, j) changes a word of one post in place."""
+    board = []
+    for i in range(sections):
+        items = []
+        for j in range(posts):
+            body = f"Body {i} {j} " + "lorem ipsum dolor sit amet " * (j % 7 + 1)
+            if edit == (i, j):
+                body = body.replace("lorem", "LOREM", 1)
+            items.append(Post(subject=f"Post {i}.{j}", body=body))
+            if insert == (i, j):
+                items.append(Post(subject=f"New post {i}.{j}", body="Something new"))
+        board.append(Section(title=f"Section {i}", posts=items))
+    return Padlet(url="https://padlet.com/user/board", title="Board", sections=board)
+
+
+def test_chunks_fit_budget_and_hash_their_markdown():
+    chunks = chunk_padlet(make_padlet(), max_tokens=800)
+    assert len(chunks) > 4
+    assert [c.index for c in chunks] == list(range(len(chunks)))
+    for chunk in chunks:
+        assert chunk.tokens == estimate_tokens(chunk.markdown) <= 800
+        assert chunk.hash == hashlib.sha256(chunk.markdown.encode("utf-8")).hexdigest()
+        # Each chunk reads on its own and belongs to one section
+        [section] = chunk.sections
+        assert chunk.markdown.startswith(f"# Board\n\n## {section}\n")
+    assert sum(c.posts for c in chunks) == 4 * 40
+    assert [c.hash for c in chunk_padlet(make_padlet(), max_tokens=800)] == [c.hash for c in chunks]
+
+
+def test_every_section_starts_a_new_chunk():
+    padlet = make_padlet(sections=3, posts=2)
+    chunks = chunk_padlet(padlet, max_tokens=4000)
+    assert [c.sections for c in chunks] == [["Section 0"], ["Section 1"], ["Section 2"]]
+
+
+def _chunk_of(chunks, subject: str) -> int:
+    return next(c.index for c in chunks if f"### {subject}\n" in c.markdown)
+
+
+def test_editing_one_post_changes_only_its_chunk():
+    before = chunk_padlet(make_padlet(), max_tokens=800)
+    only_own = 0
+    for i in range(4):
+        for j in range(40):
+            after = {c.hash for c in chunk_padlet(make_padlet(edit=(i, j)), max_tokens=800)}
+            invalidated = {c.index for c in before if c.hash not in after}
+            own = _chunk_of(before, f"Post {i}.{j}")
+            # The edit may add or remove the boundary before the post, merging
+            # or splitting its chunk; nothing further away is touched
+            assert own in invalidated and invalidated <= {own - 1, own}
+            only_own += invalidated == {own}
+    assert only_own >= 0.8 * 4 * 40
+
+
+def test_inserting_a_post_leaves_other_chunks_alone():
+    before = chunk_padlet(make_padlet(), max_tokens=800)
+    after = chunk_padlet(make_padlet(insert=(2, 10)), max_tokens=800)
+    unchanged = {c.hash for c in before} & {c.hash for c in after}
+    # Greedy packing would re-hash everything after the insertion
+    assert len(unchanged) >= len(before) - 2
+    assert {c.hash for c in before if c.sections != ["Section 2"]} <= unchanged
+
+
+def _same_subject_section(subject, posts: int, insert_first: bool = False) -> Padlet:
+    items = [Post(subject=subject(j), body=f"Note {j}: " + "some thoughts on the topic " * (j % 5 + 1))
+             for j in range(posts)]
+    if insert_first:
+        items.insert(0, Post(subject=subject(0), body="A new note at the top"))
+    return Padlet(url="u", title="Board", sections=[Section(title="Notes", posts=items)])
+
+
+@pytest.mark.parametrize("subject", [lambda j: "Untitled", lambda j: ("Question", "Answer")[j % 2]],
+                         ids=["untitled", "repeated"])
+def test_untitled_and_repeated_subjects_still_cut_on_content(subject):
+    before = chunk_padlet(_same_subject_section(subject, 40), max_tokens=400)
+    after = chunk_padlet(_same_subject_section(subject, 40, insert_first=True), max_tokens=400)
+    assert len(before) > 3
+    kept = {c.hash for c in before} & {c.hash for c in after}
+    assert {c.hash for c in before[1:]} <= kept
+
+
+def test_oversized_post_gets_chunks_of_its_own():
+    big = "\n\n".join(f"Paragraph {n} " + "word " * 60 for n in range(10))
+    padlet = Padlet(url="u", title="Board", sections=[Section(title="S", posts=[
+        Post(subject="Small", body="tiny"), Post(subject="Big", body=big), Post(subject="After", body="tiny"),
+    ])])
+    chunks = chunk_padlet(padlet, max_tokens=200)
+    assert all(c.tokens <= 200 for c in chunks)
+    assert "Small" in chunks[0].markdown and "Big" not in chunks[0].markdown
+    assert "After" in chunks[-1].markdown and "Paragraph" not in chunks[-1].markdown
+    assert sum("Paragraph" in c.markdown for c in chunks) > 1
+
+
+def test_budget_without_room_for_posts_is_rejected():
+    with pytest.raises(ValueError):
+        chunk_padlet(make_padlet(sections=1, posts=1), max_tokens=5)
+
+
+def test_file_cache_persists_between_instances(tmp_path):
+    cache = FileChunkCache(tmp_path)
+    assert cache.get("ns:abc") is None
+    cache.set("ns:abc", {"summary": "notes"})
+    assert FileChunkCache(tmp_path).get("ns:abc") == {"summary": "notes"}
+
+    memory = MemoryChunkCache()
+    memory.set("k", "v")
+    assert memory.get("k") == "v" and memory.get("missing") is None
+
+
+def test_processor_reprocesses_only_changed_chunks(tmp_path):
+    model = FakeModel()
+    processor = ChunkProcessor(model, cache=FileChunkCache(tmp_path), namespace="v1")
+    chunks = chunk_padlet(make_padlet(), max_tokens=800)
+
+    results = asyncio.run(processor.run(chunks))
+    assert len(results) == len(chunks) and model.calls == len(chunks)
+    assert processor.last_stats.cached == 0
+
+    asyncio.run(processor.run(chunk_padlet(make_padlet(edit=(1, 5)), max_tokens=800)))
+    stats = processor.last_stats
+    assert (stats.chunks, stats.cached, stats.processed) == (len(chunks), len(chunks) - 1, 1)
+
+    # A new namespace (prompt or model change) doesn't reuse old results
+    other = ChunkProcessor(model, cache=FileChunkCache(tmp_path), namespace="v2")
+    asyncio.run(other.run(chunks))
+    assert other.last_stats.processed == len(chunks)
+
+
+def test_processor_bounds_concurrency_and_dedupes():
+    model = FakeModel(latency=0.02)
+    processor = ChunkProcessor(model, cache=MemoryChunkCache(), max_concurrency=2)
+    chunks = chunk_padlet(make_padlet(sections=2), max_tokens=800)
+    results = asyncio.run(processor.run(chunks + chunks))
+    assert results[:len(chunks)] == results[len(chunks):]
+    assert model.calls == len(chunks) and model.peak == 2
+
+
+def test_processor_runs_plain_functions_off_the_loop():
+    threads = []
+
+    def summarize(chunk):
+        threads.append(threading.current_thread())
+        return chunk.hash[:8]
+
+    chunks = chunk_padlet(make_padlet(sections=1, posts=3), max_tokens=800)
+    results = asyncio.run(ChunkProcessor(summarize).run(chunks))
+    assert results == [c.hash[:8] for c in chunks]
+    assert threads and all(t is not threading.main_thread() for t in threads)
+
+
+def test_processor_failure_keeps_finished_results_cached():
+    cache = MemoryChunkCache()
+    chunks = chunk_padlet(make_padlet(sections=1, posts=3), max_tokens=4000) + \
+        chunk_padlet(Padlet(url="u", title="Other", sections=[Section(title="S", posts=[Post(subject="x", body="y")])]))
+
+    async def flaky(chunk):
+        if "Other" in chunk.markdown:
+            await asyncio.sleep(0.01)
+            raise RuntimeError("model unavailable")
+        return "ok"
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(ChunkProcessor(flaky, cache=cache, max_concurrency=2).run(chunks))
+    assert cache.get(f":{chunks[0].hash}") == "ok"
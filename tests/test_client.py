@@ -0,0 +1,72 @@
+"""Tests for the synchronous PadletClient."""
+
+import subprocess
+import sys
+import time
+
+import pytest
+
+from conftest import FakeBrowser
+from padlet_scraper import PadletClient, PadletScraper
+from padlet_scraper import session as session_module
+from padlet_scraper.models import Padlet
+from padlet_scraper.process import pid_alive
+
+
+@pytest.fixture
+def chrome_stand_ins(monkeypatch):
+    """Launch a sleeping process per browser start, as the browser's pid."""
+    processes: list[subprocess.Popen] = []
+    browsers: list[FakeBrowser] = []
+
+    async def launch(*args):
+        processes.append(subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"]))
+        browsers.append(FakeBrowser(pid=processes[-1].pid))
+        return browsers[-1]
+
+    monkeypatch.setattr(session_module, "launch_browser", launch)
+    yield browsers
+    for process in processes:
+        process.kill()
+        process.wait()
+
+
+def test_scrape_from_threads_shares_one_browser(monkeypatch, chrome_stand_ins):
+    async def scrape_targets(self, targets, url, deadline):
+        return Padlet(url=url, title=url)
+
+    monkeypatch.setattr(PadletScraper, "_scrape_targets", scrape_targets)
+    client = PadletClient(max_concurrency=2)
+    try:
+        futures = [client.submit(f"https://padlet.com/u/{i}") for i in range(4)]
+        titles = [f.result(5).title for f in futures]
+    finally:
+        client.close()
+    assert titles == [f"https://padlet.com/u/{i}" for i in range(4)]
+    assert len(chrome_stand_ins) == 1
+    assert chrome_stand_ins[0].stopped
+
+
+def test_deadline_kills_stuck_shared_browser(monkeypatch, chrome_stand_ins):
+    stuck = True
+
+    async def scrape_targets(self, targets, url, deadline):
+        if stuck:
+            # Blocks the event loop itself, so only the watchdog thread can act
+            time.sleep(1.0)
+            raise ConnectionError("browser connection closed")
+        return Padlet(url=url)
+
+    monkeypatch.setattr(PadletScraper, "_scrape_targets", scrape_targets)
+    client = PadletClient(deadline=0.2)
+    client.scraper.kill_grace = 0.2
+    try:
+        with pytest.raises(ConnectionError):
+            client.scrape("https://padlet.com/u/stuck")
+        assert not pid_alive(chrome_stand_ins[0]._process_pid)
+        stuck = False
+        client.scrape("https://padlet.com/u/next")
+    finally:
+        client.close()
+    # The killed browser was replaced for the next scrape
+    assert len(chrome_stand_ins) == 2
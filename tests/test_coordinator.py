@@ -0,0 +1,205 @@
+"""Tests for the job coordinator, its worker and the CLI commands that run them."""
+
+import asyncio
+import json
+import time
+import urllib.error
+import urllib.request
+
+import pytest
+
+from padlet_scraper.cli import coordinator_main, parse_args, scrape_main, worker_main
+from padlet_scraper.coordinator import Coordinator, JobQueue, LeaseLostError
+from padlet_scraper.models import Padlet
+from padlet_scraper.worker import Worker
+
+
+def test_expired_lease_goes_to_another_worker():
+    queue = JobQueue(lease_timeout=0.05)
+    [job_id] = queue.enqueue(["https://padlet.com/user/board"])
+    [first] = queue.lease("w1")
+    assert queue.lease("w2") == []
+
+    time.sleep(0.1)
+    [second] = queue.lease("w2")
+    assert second["id"] == job_id and second["lease"] != first["lease"]
+    assert queue.job(job_id)["attempts"] == 2
+
+    with pytest.raises(LeaseLostError):
+        queue.renew(job_id, first["lease"])
+    with pytest.raises(LeaseLostError):
+        queue.complete(job_id, first["lease"], {"url": "late"})
+    stats = queue.stats()
+    assert stats.workers["w1"].expired == 1 and stats.requeued == 1
+
+
+def test_renewed_lease_does_not_expire():
+    queue = JobQueue(lease_timeout=0.1)
+    [job_id] = queue.enqueue(["https://padlet.com/user/board"])
+    [job] = queue.lease("w1")
+    for _ in range(4):
+        time.sleep(0.05)
+        queue.renew(job_id, job["lease"])
+    assert queue.lease("w2") == []
+    assert queue.job(job_id)["status"] == "leased"
+
+
+def test_job_fails_after_max_attempts_expire():
+    queue = JobQueue(lease_timeout=0.01, max_attempts=2)
+    [job_id] = queue.enqueue(["https://padlet.com/user/board"])
+    queue.lease("w1")
+    time.sleep(0.02)
+    queue.lease("w1")
+    time.sleep(0.02)
+    stats = queue.stats()
+    assert queue.job(job_id)["status"] == "failed"
+    assert stats.failed == 1 and queue.pending == 0
+
+
+def test_repeated_complete_with_same_lease_is_a_no_op(tmp_path):
+    queue = JobQueue(output_dir=tmp_path)
+    [job_id] = queue.enqueue(["https://padlet.com/user/board"])
+    [job] = queue.lease("w1")
+    queue.complete(job_id, job["lease"], {"url": "first"}, duration=1.0)
+    queue.complete(job_id, job["lease"], {"url": "retried"}, duration=1.0)
+
+    assert json.loads((tmp_path / f"{job_id}.json").read_text())["url"] == "first"
+    stats = queue.stats()
+    assert stats.completed == 1 and stats.workers["w1"].completed == 1
+    # A different outcome for the same lease is still refused
+    with pytest.raises(LeaseLostError):
+        queue.fail(job_id, job["lease"], "boom")
+
+
+def test_repeated_fail_counts_one_attempt():
+    queue = JobQueue(max_attempts=3)
+    [job_id] = queue.enqueue(["https://padlet.com/user/board"])
+    [job] = queue.lease("w1")
+    queue.fail(job_id, job["lease"], "boom")
+    queue.fail(job_id, job["lease"], "boom")
+    assert queue.job(job_id)["status"] == "queued"
+    assert queue.stats().workers["w1"].failed == 1
+
+
+@pytest.mark.parametrize("lease_timeout", ["30", -1, 0, float("nan"), True])
+def test_invalid_lease_timeout_leaves_the_job_queued(lease_timeout):
+    queue = JobQueue()
+    [job_id] = queue.enqueue(["https://padlet.com/user/board"])
+    with pytest.raises(ValueError):
+        queue.lease("w1", 1, lease_timeout)
+    assert queue.job(job_id)["status"] == "queued" and queue.pending == 1
+
+    [job] = queue.lease("w1", 1, 5)
+    assert job["expires_in"] == 5.0
+    with pytest.raises(ValueError):
+        queue.renew(job_id, job["lease"], lease_timeout)
+    assert queue.job(job_id)["status"] == "leased"
+
+
+def test_invalid_lease_timeout_over_http_answers_400():
+    queue = JobQueue()
+    queue.enqueue(["https://padlet.com/user/board"])
+    with Coordinator(port=0, queue=queue) as coordinator:
+        status, _ = _post(f"{coordinator.url}/lease", {"worker": "w1", "lease_timeout": "30"})
+        assert status == 400
+        status, body = _post(f"{coordinator.url}/lease", {"worker": "w1"})
+        assert status == 200 and len(body["jobs"]) == 1
+
+
+def _post(url: str, payload: dict) -> tuple[int, dict]:
+    request = urllib.request.Request(url, json.dumps(payload).encode(), {"Content-Type": "application/json"})
+    try:
+        with urllib.request.urlopen(request, timeout=5) as response:
+            return response.status, json.load(response)
+    except urllib.error.HTTPError as e:
+        return e.code, json.load(e)
+
+
+def test_unexpected_error_answers_500(monkeypatch):
+    queue = JobQueue()
+    [job_id] = queue.enqueue(["https://padlet.com/user/board"])
+    [job] = queue.lease("w1")
+
+    def complete(*args, **kwargs):
+        raise OSError("No space left on device")
+
+    monkeypatch.setattr(queue, "complete", complete)
+    with Coordinator(port=0, queue=queue) as coordinator:
+        status, body = _post(f"{coordinator.url}/jobs/{job_id}/complete", {"lease": job["lease"], "result": {}})
+        assert status == 500 and "No space left" in body["error"]
+        # The server is still answering
+        status, body = _post(f"{coordinator.url}/jobs/{job_id}/renew", {"lease": job["lease"]})
+        assert status == 200
+
+
+class _StubScraper:
+    async def scrape(self, url: str) -> Padlet:
+        return Padlet(url=url, title="Board")
+
+    def close(self) -> None:
+        pass
+
+
+def test_worker_retries_complete_after_a_dropped_answer(monkeypatch):
+    queue = JobQueue()
+    queue.enqueue(["https://padlet.com/user/board"])
+    complete = queue.complete
+    calls = []
+
+    def flaky_complete(*args, **kwargs):
+        # The result is recorded, but the answer never reaches the worker
+        calls.append(args)
+        complete(*args, **kwargs)
+        if len(calls) == 1:
+            raise OSError("connection reset")
+
+    monkeypatch.setattr(queue, "complete", flaky_complete)
+    with Coordinator(port=0, queue=queue) as coordinator:
+        worker = Worker(coordinator.url, _StubScraper(), concurrency=1, poll_interval=0.01)
+        asyncio.run(asyncio.wait_for(worker.run(exit_when_idle=True), 10))
+
+    assert len(calls) == 2
+    assert worker.completed == 1 and worker.lost == 0
+    assert queue.stats().completed == 1
+
+
+def test_worker_counts_a_result_it_could_not_report(monkeypatch, capsys):
+    queue = JobQueue()
+    queue.enqueue(["https://padlet.com/user/board"])
+
+    def complete(*args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(queue, "complete", complete)
+    with Coordinator(port=0, queue=queue) as coordinator:
+        worker = Worker(coordinator.url, _StubScraper(), concurrency=1, poll_interval=0.01)
+
+        async def run():
+            task = asyncio.ensure_future(worker.run())
+            while not worker.failed:
+                await asyncio.sleep(0.01)
+            worker.stop()
+            await task
+
+        asyncio.run(asyncio.wait_for(run(), 10))
+
+    assert worker.failed == 1 and worker.completed == 0
+    err = capsys.readouterr().err
+    assert "Could not report result" in err and "never retrieved" not in err
+
+
+def test_cli_commands():
+    args = parse_args(["https://padlet.com/user/board", "-o", "out.json"])
+    assert args.handler is scrape_main and args.url == "https://padlet.com/user/board"
+    args = parse_args(["--no-headless", "https://padlet.com/user/board"])
+    assert args.handler is scrape_main and args.no_headless
+    args = parse_args(["scrape", "https://padlet.com/user/board", "--tabs", "2"])
+    assert args.handler is scrape_main and args.tabs == 2
+
+    args = parse_args(["worker", "--concurrency", "4", "--fast-path"])
+    assert args.handler is worker_main and args.concurrency == 4 and args.fast_path
+    args = parse_args(["coordinator", "https://padlet.com/a", "--port", "0"])
+    assert args.handler is coordinator_main and args.urls == ["https://padlet.com/a"] and args.port == 0
+
+    with pytest.raises(SystemExit):
+        parse_args([])
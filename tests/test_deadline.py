@@ -0,0 +1,140 @@
+"""Tests for per-scrape deadline budgets and the browser watchdog."""
+
+import asyncio
+import contextlib
+import subprocess
+import sys
+import time
+
+import pytest
+
+from padlet_scraper.deadline import DEFAULT_PHASE_WEIGHTS, PHASES, Deadline
+from padlet_scraper.process import ProcessWatchdog, pid_alive
+
+
+def test_unbounded_deadline():
+    async def run():
+        deadline = Deadline(None)
+        assert deadline.remaining() is None
+        assert all(deadline.budget_for(phase) is None for phase in PHASES)
+        return await deadline.run("scroll", asyncio.sleep(0, result="done"))
+
+    assert asyncio.run(run()) == "done"
+
+
+def test_budgets_split_by_weight():
+    async def run():
+        deadline = Deadline(100.0)
+        return {phase: deadline.budget_for(phase) for phase in PHASES}
+
+    budgets = asyncio.run(run())
+    assert budgets["navigate"] == pytest.approx(100.0 * DEFAULT_PHASE_WEIGHTS["navigate"], rel=1e-3)
+    # Measured against the phases still to run, so the last phase gets everything left
+    assert budgets["teardown"] == pytest.approx(100.0, rel=1e-3)
+    assert budgets["scroll"] == pytest.approx(100.0 * 0.35 / 0.65, rel=1e-3)
+
+
+def test_unused_time_rolls_over():
+    weights = {"navigate": 0.5, "load": 0.5, "scroll": 0, "extract": 0, "teardown": 0}
+
+    async def run():
+        deadline = Deadline(1.0, weights)
+        navigate = deadline.budget_for("navigate")
+        await deadline.run("navigate", asyncio.sleep(0.01))
+        return navigate, deadline.budget_for("load")
+
+    navigate, load = asyncio.run(run())
+    assert navigate == pytest.approx(0.5, rel=1e-2)
+    # Load gets everything navigate didn't use, not just its own half
+    assert load > 0.9
+
+
+def test_phase_overrun_cancels_and_records():
+    async def run():
+        deadline = Deadline(0.2, {"navigate": 1.0, "load": 0, "scroll": 0, "extract": 0, "teardown": 0})
+        cancelled = asyncio.Event()
+
+        async def stuck():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        started = time.monotonic()
+        with pytest.raises(asyncio.TimeoutError):
+            await deadline.run("navigate", stuck())
+        return time.monotonic() - started, cancelled.is_set(), deadline.expired
+
+    elapsed, cancelled, expired = asyncio.run(run())
+    assert elapsed < 1.0
+    assert cancelled
+    assert expired == ["navigate"]
+
+
+def test_watchdog_kills_process_tree():
+    # A parent that starts a child of its own, like Chrome's renderers
+    parent = subprocess.Popen([
+        sys.executable, "-c",
+        "import subprocess, sys, time; subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(30)']); time.sleep(30)",
+    ])
+    try:
+        watchdog = ProcessWatchdog(parent.pid, 0.2, name="test process")
+        parent.wait(timeout=5)
+        assert watchdog.fired
+    finally:
+        parent.kill()
+        parent.wait()
+
+
+def test_watchdog_cancel():
+    process = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+    try:
+        watchdog = ProcessWatchdog(process.pid, 0.1)
+        watchdog.cancel()
+        time.sleep(0.3)
+        assert not watchdog.fired
+        assert pid_alive(process.pid)
+    finally:
+        process.kill()
+        process.wait()
+
+
+def test_fast_path_bounded_by_navigate_budget(stand_in):
+    from padlet_scraper import PadletScraper
+    url = stand_in.board("/slow", delay=3.0)
+
+    async def run():
+        scraper = PadletScraper(fast_path=True)
+        started = time.monotonic()
+        # A fast path that runs out of time hands over to the browser
+        padlet = await scraper._scrape_fast_path(url, Deadline(1.0))
+        return padlet, time.monotonic() - started
+
+    padlet, elapsed = asyncio.run(run())
+    assert padlet is None
+    assert elapsed < 1.0
+
+
+class _BrowserlessSession:
+    """Hands out tabs without owning a browser, like a replay session."""
+
+    @contextlib.asynccontextmanager
+    async def tabs(self, count: int):
+        yield [object() for _ in range(count)]
+
+    def discard(self, tab) -> None:
+        pass
+
+
+def test_deadline_with_browserless_session(monkeypatch):
+    from padlet_scraper import PadletScraper
+    from padlet_scraper.models import Padlet
+
+    async def scrape_targets(self, targets, url, deadline):
+        return Padlet(url=url, title="Board")
+
+    monkeypatch.setattr(PadletScraper, "_scrape_targets", scrape_targets)
+    scraper = PadletScraper(session=_BrowserlessSession(), deadline=5)
+    padlet = asyncio.run(scraper.scrape("https://padlet.com/user/board"))
+    assert padlet.title == "Board" and not padlet.partial
@@ -0,0 +1,99 @@
+"""Tests for multi-format export and atomic writes."""
+
+import json
+import os
+import stat
+import threading
+
+import pytest
+
+from padlet_scraper.export import Exporter, export_file, writer_for
+from padlet_scraper.models import Padlet, Post, Section
+from padlet_scraper.utils import atomic_write
+
+
+def make_padlet() -> Padlet:
+    return Padlet(
+        url="https://padlet.com/user/board",
+        title="Board",
+        sections=[Section(title="Ideas", section_id="1", posts=[Post(subject="First", body="Hello", section_id="1")])],
+    )
+
+
+def test_writer_for_rejects_unknown_extension():
+    with pytest.raises(ValueError, match="Unsupported file extension"):
+        writer_for("board.csv")
+
+
+def test_atomic_write_replaces_file(tmp_path):
+    path = tmp_path / "out.txt"
+    path.write_text("old")
+    with atomic_write(path) as f:
+        f.write("new")
+    assert path.read_text() == "new"
+    assert os.listdir(tmp_path) == ["out.txt"]
+
+
+def test_atomic_write_keeps_original_on_error(tmp_path):
+    path = tmp_path / "out.txt"
+    path.write_text("old")
+    with pytest.raises(RuntimeError):
+        with atomic_write(path) as f:
+            f.write("partial")
+            raise RuntimeError("boom")
+    assert path.read_text() == "old"
+    assert os.listdir(tmp_path) == ["out.txt"]
+
+
+def test_atomic_write_respects_umask(tmp_path):
+    previous = os.umask(0o027)
+    try:
+        with atomic_write(tmp_path / "out.txt") as f:
+            f.write("x")
+    finally:
+        os.umask(previous)
+    assert stat.S_IMODE(os.stat(tmp_path / "out.txt").st_mode) == 0o640
+
+
+def test_atomic_write_does_not_change_umask(tmp_path):
+    seen = []
+    stop = threading.Event()
+
+    def watch():
+        # Reading the umask means setting it; use the same value so the
+        # watcher itself can't be mistaken for a change
+        while not stop.is_set():
+            current = os.umask(0o022)
+            os.umask(current)
+            seen.append(current)
+
+    previous = os.umask(0o022)
+    watcher = threading.Thread(target=watch)
+    watcher.start()
+    try:
+        for i in range(200):
+            with atomic_write(tmp_path / f"{i}.txt") as f:
+                f.write("x")
+    finally:
+        stop.set()
+        watcher.join()
+        os.umask(previous)
+    assert set(seen) == {0o022}
+
+
+def test_exporter_writes_every_format(tmp_path):
+    padlet = make_padlet()
+    paths = [tmp_path / "b.json", tmp_path / "b.md", tmp_path / "b.jsonl"]
+    with Exporter() as exporter:
+        written = [future.result() for future in exporter.submit(padlet, paths)]
+    assert written == paths
+    assert Padlet.model_validate(json.loads(paths[0].read_text())) == padlet
+    assert paths[1].read_text() == padlet.to_markdown()
+    record = json.loads(paths[2].read_text().splitlines()[0])
+    assert record["section_title"] == "Ideas" and record["subject"] == "First"
+
+
+def test_export_file_matches_markdown(tmp_path):
+    padlet = make_padlet()
+    export_file(padlet, tmp_path / "b.md")
+    assert (tmp_path / "b.md").read_text(encoding="utf-8") == padlet.to_markdown()
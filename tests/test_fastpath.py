@@ -0,0 +1,106 @@
+"""Tests for browserless board parsing and the fast path."""
+
+import asyncio
+import json
+
+from conftest import Route
+from padlet_scraper import PadletScraper
+from padlet_scraper.fastpath import parse_board_html
+
+URL = "https://padlet.com/user/board"
+
+
+def board_html(state: dict, name: str = "__STARTING_STATE__", markup: str = "") -> str:
+    return (f"<html><body><h1>Markup title</h1>{markup}"
+            f"<script>window.{name} = {json.dumps(state)};</script></body></html>")
+
+
+def make_state(posts_count=2) -> dict:
+    state = {
+        "wall": {"title": "Board", "posts_count": posts_count},
+        "sections": [{"id": "b", "title": "Second", "sort_index": 1}, {"id": "a", "title": "First", "sort_index": 0}],
+        "posts": [
+            {"id": 1, "wall_section_id": "a", "subject": "Hello", "body": "<p>One</p><p><br></p><p><a href='/x'>x</a></p>"},
+            {"id": 2, "wall_section_id": "b", "subject": "Bye", "body": "Two"},
+        ],
+    }
+    if posts_count is None:
+        del state["wall"]["posts_count"]
+    return state
+
+
+def test_hydration_state_is_parsed_in_order():
+    result = parse_board_html(board_html(make_state()), URL)
+    assert result.source == "hydration" and result.complete
+    padlet = result.padlet
+    assert padlet.title == "Board"
+    assert [s.title for s in padlet.sections] == ["First", "Second"]
+    assert padlet.sections[0].posts[0].body == "One\n\n[x](https://padlet.com/x)"
+
+
+def test_hydration_without_count_is_not_complete():
+    result = parse_board_html(board_html(make_state(posts_count=None)), URL)
+    assert result.source == "hydration" and not result.complete
+
+
+def test_hydration_with_mismatched_count_is_not_complete():
+    assert not parse_board_html(board_html(make_state(posts_count=3)), URL).complete
+    assert not parse_board_html(board_html(make_state(posts_count=1)), URL).complete
+
+
+def test_unknown_script_json_is_ignored():
+    # Any other script with a posts list (analytics, an embed, ...) isn't board data
+    html = board_html({"posts": [{"id": 1, "subject": "Ad"}], "posts_count": 1}, name="__ANALYTICS__")
+    assert parse_board_html(html, URL) is None
+
+
+def test_malformed_state_falls_back_to_markup():
+    state = make_state()
+    state["posts"][0]["subject"] = {"unexpected": "shape"}
+    markup = ('<section data-id="a" data-rank="0"><h2 data-testid="sectionTitleText">First</h2>'
+              '<div data-testid="surfacePost"><div data-pw="postSubject">Hello</div></div></section>')
+    result = parse_board_html(board_html(state, markup=markup), URL)
+    assert result.source == "dom"
+    assert result.padlet.title == "Markup title"
+    assert result.padlet.total_posts == 1
+
+
+def test_dom_with_lazy_containers_is_not_complete():
+    html = ('<html><body><section data-id="a" data-rank="0"><h2 data-testid="sectionTitleText">A</h2>'
+            '<div id="group-posts-a" class="overflow-y-auto"></div></section></body></html>')
+    result = parse_board_html(html, URL)
+    assert result.source == "dom" and not result.complete
+
+
+def _rows(count: int) -> str:
+    posts = "".join(f'<div data-testid="surfacePost"><div data-pw="postSubject">Post {i}</div></div>'
+                    for i in range(count))
+    return f'<section data-id="a" data-rank="0"><h2 data-testid="sectionTitleText">A</h2>{posts}</section>'
+
+
+def test_dom_is_complete_only_against_a_post_count():
+    # No count to check against: later rows may only load on scrolling
+    result = parse_board_html(f"<html><body>{_rows(2)}</body></html>", URL)
+    assert result.source == "dom" and result.padlet.total_posts == 2 and not result.complete
+
+    # The state only gives the count; the markup holds the first rows of a bigger board
+    assert not parse_board_html(board_html({"wall": {"posts_count": 5}}, markup=_rows(2)), URL).complete
+
+    result = parse_board_html(board_html({"wall": {"posts_count": 2}}, markup=_rows(2)), URL)
+    assert result.source == "dom" and result.complete
+
+
+def test_fast_path_scrape_and_pool_close(stand_in):
+    stand_in.routes["/board"] = Route(board_html(make_state()).encode("utf-8"))
+
+    async def run():
+        scraper = PadletScraper(fast_path=True)
+        padlet = await scraper.scrape(stand_in.url("/board"))
+        pool = scraper.http_pool
+        scraper.close()
+        return padlet, pool, scraper.http_pool
+
+    padlet, pool, after = asyncio.run(run())
+    assert padlet.total_posts == 2 and not padlet.partial
+    assert pool is not None and after is None
+    assert not pool._idle
@@ -0,0 +1,49 @@
+"""Tests for the scroll and tall-viewport loading modes."""
+
+import asyncio
+
+import pytest
+
+from fake_cdp import FakeSession, make_board
+from padlet_scraper import PadletScraper
+from padlet_scraper.scraper import TALL_VIEWPORT_MAX_HEIGHT
+
+URL = "https://padlet.com/user/board"
+
+
+def scrape(board, **kwargs):
+    return asyncio.run(PadletScraper(session=FakeSession(board), **kwargs).scrape(URL))
+
+
+def test_rejects_unknown_options():
+    with pytest.raises(ValueError):
+        PadletScraper(loading="zoom")
+    with pytest.raises(ValueError):
+        PadletScraper(tabs=0)
+
+
+def test_tall_viewport_loads_without_scrolling(capsys):
+    board = make_board()
+    expected = scrape(make_board())
+    capsys.readouterr()
+
+    padlet = scrape(board, loading="tall")
+    err = capsys.readouterr().err
+    assert padlet == expected
+    assert board.viewport == board.board_height
+    assert "Tall viewport (6000px)" in err
+    assert "Scrolling main page" not in err
+
+
+def test_tall_viewport_falls_back_to_scrolling(capsys):
+    board = make_board()
+    board.board_height = TALL_VIEWPORT_MAX_HEIGHT + 1
+    expected = scrape(make_board())
+    capsys.readouterr()
+
+    padlet = scrape(board, loading="tall")
+    err = capsys.readouterr().err
+    assert padlet == expected and not padlet.partial
+    assert "falling back to scrolling" in err
+    assert "Scrolling main page" in err
+    assert board.viewport == 1080  # Normal viewport restored before scrolling
@@ -0,0 +1,88 @@
+"""Tests for splitting a board's sections between several tabs."""
+
+import asyncio
+import contextlib
+import time
+
+from fake_cdp import FakeSession, make_board
+from padlet_scraper import PadletScraper
+from padlet_scraper.models import Section
+
+URL = "https://padlet.com/user/board"
+INF = float("inf")
+
+
+def test_split_ranks_is_contiguous_and_half_open():
+    ranks = {f"s{i}": float(i) for i in range(10)}
+    ranges = PadletScraper._split_ranks(ranks, 3)
+    assert ranges == [(-INF, 3.0), (3.0, 6.0), (6.0, INF)]
+    # Ranks between and beyond the first tab's ranks still land in exactly one range
+    for rank in (-5.0, 2.5, 3.0, 5.999, 9.5, 100.0):
+        assert sum(low <= rank < high for low, high in ranges) == 1
+
+
+def test_split_ranks_with_fewer_sections_than_tabs():
+    ranges = PadletScraper._split_ranks({"a": 1.0, "b": 2.0}, 4)
+    assert ranges.count(None) == 2
+    assert [r for r in ranges if r] == [(-INF, 2.0), (2.0, INF)]
+    assert PadletScraper._split_ranks({}, 2) == [None, None]
+
+
+def test_merge_sections_dedupes_and_orders_by_rank():
+    a, b, c = (Section(title=t, section_id=t) for t in "abc")
+    duplicate = Section(title="a again", section_id="a")
+    merged = PadletScraper._merge_sections([[c, a], [duplicate, b]], {"a": 0.0, "b": 1.0, "c": 2.0})
+    assert [s.title for s in merged] == ["a", "b", "c"]
+
+
+def test_multi_tab_scrape_matches_single_tab():
+    board = make_board(sections=9, posts=3)
+
+    async def run():
+        single = await PadletScraper(session=FakeSession(board)).scrape(URL)
+        session = FakeSession(board)
+        split = await PadletScraper(session=session, tabs=3).scrape(URL)
+        return single, split, session
+
+    single, split, session = asyncio.run(run())
+    assert split == single
+    assert not split.partial
+    assert len(session.leased) == 3
+
+
+def test_section_outside_every_share_marks_partial(monkeypatch):
+    board = make_board(sections=6, posts=1)
+    calls = []
+    section_ranks = PadletScraper._section_ranks
+
+    async def ranks_per_tab(self, page):
+        ranks = await section_ranks(self, page)
+        calls.append(page)
+        if len(calls) > 1:
+            # Another tab renders a section the first tab doesn't, in the first tab's range
+            ranks["extra"] = 0.5
+        return ranks
+
+    monkeypatch.setattr(PadletScraper, "_section_ranks", ranks_per_tab)
+    padlet = asyncio.run(PadletScraper(session=FakeSession(board), tabs=2).scrape(URL))
+    assert padlet.partial
+    assert padlet.total_posts == 6
+
+
+def test_opening_tabs_counts_against_deadline():
+    class SlowSession(FakeSession):
+        @contextlib.asynccontextmanager
+        async def tabs(self, count):
+            await asyncio.sleep(5)
+            async with super().tabs(count) as tabs:
+                yield tabs
+
+    async def run():
+        scraper = PadletScraper(session=SlowSession(make_board()), tabs=3, deadline=0.5)
+        started = time.monotonic()
+        padlet = await scraper.scrape(URL)
+        return padlet, time.monotonic() - started
+
+    padlet, elapsed = asyncio.run(run())
+    assert padlet.partial and not padlet.sections
+    assert elapsed < 2.0
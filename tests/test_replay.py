@@ -0,0 +1,85 @@
+"""Tests for CDP recording and replay."""
+
+import asyncio
+import time
+
+import pytest
+from nodriver import cdp
+
+from fake_cdp import FakeSession, make_board
+from padlet_scraper import PadletScraper
+from padlet_scraper.replay import RecordingSession, ReplaySession, ReplayTab, load_recording
+
+URL = "https://padlet.com/user/board"
+
+
+def search(query: str, count: int) -> dict:
+    return {"method": "DOM.performSearch", "params": {"query": query}, "result": {"searchId": query, "resultCount": count}}
+
+
+async def record_and_replay(tmp_path, board, timeout: float = 30, real_sleep: bool = False, tabs: int = 1):
+    path = tmp_path / "board.cdp.jsonl"
+    async with RecordingSession(path, session=FakeSession(board, real_sleep=real_sleep)) as session:
+        live = await PadletScraper(session=session, timeout=timeout, tabs=tabs).scrape(URL)
+    started = time.monotonic()
+    replayed = await PadletScraper(session=ReplaySession(path), timeout=timeout, tabs=tabs).scrape(URL)
+    return live, replayed, time.monotonic() - started, load_recording(path)
+
+
+def test_replay_gives_identical_padlet(tmp_path):
+    # Section titles show up on the third search, so Tab.find polls
+    live, replayed, elapsed, entries = asyncio.run(record_and_replay(tmp_path, make_board(searchable_after=2)))
+    assert live.total_posts == 20
+    assert replayed == live
+    assert sum(1 for e in entries if e["method"] == "DOM.performSearch") == 3
+    assert elapsed < 1.0
+
+
+def test_replay_and_record_with_deadline(tmp_path):
+    path = tmp_path / "board.cdp.jsonl"
+
+    async def run():
+        async with RecordingSession(path, session=FakeSession(make_board())) as session:
+            live = await PadletScraper(session=session, deadline=30).scrape(URL)
+        return live, await PadletScraper(session=ReplaySession(path), deadline=30).scrape(URL)
+
+    live, replayed = asyncio.run(run())
+    assert replayed == live and not live.partial
+
+
+def test_replay_survives_extra_polls(tmp_path):
+    # Nothing is ever found: Tab.find polls until its timeout, a different number
+    # of times when replayed at full speed than while recording
+    live, replayed, elapsed, _ = asyncio.run(
+        record_and_replay(tmp_path, make_board(searchable_after=-1), timeout=1, real_sleep=True)
+    )
+    assert replayed == live
+    assert elapsed < 3.0
+
+
+def test_replay_multi_tab(tmp_path):
+    live, replayed, _, entries = asyncio.run(record_and_replay(tmp_path, make_board(sections=8, posts=2), tabs=3))
+    assert {e["tab"] for e in entries} == {0, 1, 2}
+    assert [s.section_id for s in live.sections] == [f"s{i}" for i in range(8)]
+    assert replayed == live
+
+
+def test_repeated_and_reordered_commands():
+    tab = ReplayTab([search("a", 1), search("b", 10), search("a", 2), search("c", 20)])
+
+    async def run():
+        results = []
+        for query in ("a", "a", "a", "b", "c", "a"):
+            _, count = await tab.send(cdp.dom.perform_search(query))
+            results.append(count)
+        return results
+
+    # The extra polls of "a" repeat its answer instead of eating the one recorded after "b"
+    assert asyncio.run(run()) == [1, 1, 1, 10, 20, 2]
+    assert tab.remaining == 0
+
+
+def test_unrecorded_command_raises():
+    tab = ReplayTab([search("a", 1)])
+    with pytest.raises(LookupError):
+        asyncio.run(tab.send(cdp.dom.perform_search("other")))
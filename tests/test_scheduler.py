@@ -0,0 +1,108 @@
+"""Tests for the per-host rate limiter and AIMD scheduler."""
+
+import asyncio
+import time
+
+import pytest
+
+from conftest import Route
+from padlet_scraper import PadletScraper
+from padlet_scraper.errors import ThrottledError
+from padlet_scraper.scheduler import ScrapeScheduler, TokenBucket
+
+
+def test_token_bucket_allows_burst_then_rate():
+    async def run():
+        bucket = TokenBucket(rate=20.0, burst=3)
+        started = time.monotonic()
+        for _ in range(3):
+            await bucket.acquire()
+        burst = time.monotonic() - started
+        for _ in range(4):
+            await bucket.acquire()
+        return burst, time.monotonic() - started
+
+    burst, total = asyncio.run(run())
+    assert burst < 0.05
+    assert total >= 4 / 20.0 * 0.9
+
+
+def test_token_bucket_pause():
+    async def run():
+        bucket = TokenBucket(rate=100.0, burst=5)
+        bucket.pause(0.2)
+        assert bucket.paused
+        started = time.monotonic()
+        await bucket.acquire()
+        return time.monotonic() - started
+
+    assert asyncio.run(run()) >= 0.19
+
+
+def test_first_congestion_decreases_limit():
+    scheduler = ScrapeScheduler(scraper=object(), max_concurrency=8, initial_concurrency=4)
+    scheduler._record(latency=1.0, congested=True)
+    assert scheduler.concurrency_limit == 2
+
+
+def test_decrease_at_most_once_per_round():
+    scheduler = ScrapeScheduler(scraper=object(), max_concurrency=8, initial_concurrency=8)
+    scheduler._record(latency=1.0, congested=True)
+    scheduler._record(latency=1.0, congested=True)
+    assert scheduler.concurrency_limit == 4
+
+
+def test_additive_increase_per_round():
+    scheduler = ScrapeScheduler(scraper=object(), max_concurrency=8, initial_concurrency=2)
+    # +1/limit per success: about one extra slot per round of completions
+    for _ in range(3):
+        scheduler._record(latency=0.1, congested=False)
+    assert scheduler.concurrency_limit == 3
+    for _ in range(100):
+        scheduler._record(latency=0.1, congested=False)
+    assert scheduler.concurrency_limit == 8
+
+
+def test_slow_host_lowers_limit(stand_in):
+    url = stand_in.board("/slow", delay=0.3)
+
+    async def run():
+        scheduler = ScrapeScheduler(PadletScraper(fast_path=True), max_concurrency=4, initial_concurrency=4,
+                                    rate_per_host=100.0, burst=4, target_latency=0.1)
+        results = await scheduler.scrape_many([url] * 4)
+        return scheduler, results
+
+    scheduler, results = asyncio.run(run())
+    assert all(r.total_posts == 1 for r in results)
+    assert scheduler.concurrency_limit < 4
+    assert scheduler.stats().completed == 4
+
+
+def test_throttled_host_does_not_stall_other_hosts(stand_in):
+    stand_in.routes["/busy"] = Route(b"slow down", status=429, content_type="text/plain")
+    throttled = stand_in.url("/busy")
+    other = stand_in.board("/ok")
+    other = other.replace("127.0.0.1", "localhost")
+
+    async def run():
+        scheduler = ScrapeScheduler(PadletScraper(fast_path=True), max_concurrency=1, initial_concurrency=1,
+                                    rate_per_host=100.0, burst=1, throttle_backoff=5.0)
+        with pytest.raises(ThrottledError):
+            await scheduler.scrape(throttled)
+        # A second scrape of the paused host waits for it without holding the only slot
+        waiting = asyncio.ensure_future(scheduler.scrape(throttled))
+        await asyncio.sleep(0.05)
+        started = time.monotonic()
+        padlet = await scheduler.scrape(other)
+        elapsed = time.monotonic() - started
+        stats = scheduler.stats()
+        waiting.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiting
+        return padlet, elapsed, stats
+
+    padlet, elapsed, stats = asyncio.run(run())
+    assert padlet.title == "Board"
+    assert elapsed < 1.0
+    assert stats.throttled == 1
+    assert stand_in.hits("/busy") == 1
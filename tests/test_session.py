@@ -0,0 +1,121 @@
+"""Tests for BrowserSession tab reuse and recycling, with a stand-in browser."""
+
+import asyncio
+import threading
+import time
+
+from conftest import FakeBrowser
+from padlet_scraper import session as session_module
+from padlet_scraper.session import BrowserSession, RecyclePolicy
+
+
+def make_session(monkeypatch, hang: bool = False, **policy) -> tuple[BrowserSession, list[FakeBrowser]]:
+    browsers: list[FakeBrowser] = []
+
+    async def launch(*args):
+        browsers.append(FakeBrowser(hang=hang))
+        return browsers[-1]
+
+    monkeypatch.setattr(session_module, "launch_browser", launch)
+    return BrowserSession(policy=RecyclePolicy(**policy)), browsers
+
+
+def test_multi_tab_lease_counts_one_scrape(monkeypatch):
+    session, browsers = make_session(monkeypatch, max_tab_heap_mb=None, max_browser_rss_mb=None)
+
+    async def run():
+        async with session.tabs(3) as tabs:
+            assert len(tabs) == 3
+        async with session.tab():
+            pass
+        return session.stats()
+
+    stats = asyncio.run(run())
+    assert stats.browser_scrapes == 2
+    assert stats.total_scrapes == 2
+    assert stats.tabs_open == 3  # The single-tab lease reused an idle tab
+    assert stats.tab_recycles == 0
+    assert len(browsers[0].tabs) == 3
+
+
+def test_hung_heap_probe_recycles_tab(monkeypatch):
+    session, browsers = make_session(monkeypatch, hang=True, heap_probe_timeout=0.1, max_browser_rss_mb=None)
+
+    async def run():
+        started = time.monotonic()
+        async with session.tab():
+            pass
+        return time.monotonic() - started, session.stats()
+
+    elapsed, stats = asyncio.run(run())
+    assert elapsed < 2.0
+    assert stats.tab_recycles == 1
+    assert browsers[0].tabs[0].closed
+
+
+def test_rss_checked_at_most_once_per_interval(monkeypatch):
+    session, _ = make_session(monkeypatch, max_tab_heap_mb=None, rss_check_interval=60.0)
+    checks = []
+    monkeypatch.setattr(session, "browser_rss_bytes", lambda: checks.append(1) or 1)
+
+    async def run():
+        for _ in range(5):
+            async with session.tab():
+                pass
+
+    asyncio.run(run())
+    assert len(checks) == 1
+
+
+def test_stats_report_sampled_rss_without_scanning(monkeypatch):
+    session, _ = make_session(monkeypatch, max_tab_heap_mb=None, max_browser_rss_mb=None)
+    threads = []
+
+    def rss():
+        threads.append(threading.current_thread())
+        return 300 * 1024 * 1024
+
+    monkeypatch.setattr(session, "browser_rss_bytes", rss)
+
+    async def run():
+        async with session.tab():
+            pass
+        before = session.stats()
+        await session.sample_rss()
+        return before, session.stats()
+
+    before, after = asyncio.run(run())
+    assert before.browser_rss_mb is None and after.browser_rss_mb == 300.0
+    assert len(threads) == 1 and threads[0] is not threading.main_thread()
+
+
+def test_browser_restarts_after_in_flight_scrapes_drain(monkeypatch):
+    session, browsers = make_session(monkeypatch, max_tab_heap_mb=None, max_browser_rss_mb=None,
+                                     max_scrapes_per_browser=2)
+
+    async def run():
+        release = asyncio.Event()
+
+        async def scrape(wait: bool):
+            async with session.tab():
+                if wait:
+                    await release.wait()
+
+        slow = asyncio.ensure_future(scrape(True))
+        await asyncio.sleep(0)
+        await scrape(False)
+        await scrape(False)  # The limit is reached while the slow scrape still holds a tab
+        assert session._draining and not browsers[0].stopped
+        waiting = asyncio.ensure_future(scrape(False))
+        await asyncio.sleep(0.05)
+        assert not waiting.done()  # New work waits while the browser drains
+        release.set()
+        await slow
+        await waiting
+        return session.stats()
+
+    stats = asyncio.run(run())
+    assert browsers[0].stopped
+    assert len(browsers) == 2
+    assert stats.browser_restarts == 1
+    assert stats.browser_scrapes == 1